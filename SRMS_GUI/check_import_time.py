@@ -0,0 +1,58 @@
+"""
+Import-time budget for a cold start: importing main.py, the app shell and
+the login view (everything needed before the login window shows) must
+stay under IMPORT_BUDGET_MS. Dashboards and the database driver are
+imported after login and are not counted.
+
+    python check_import_time.py            # exit code 1 when over budget
+
+Each attempt runs in a fresh interpreter with -X importtime; the best of
+ATTEMPTS is compared with the budget, so one slow run doesn't fail it.
+"""
+import os
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 150
+ATTEMPTS = 5
+COLD_START = ("main", "gui.app", "gui.login_view")
+SHOW_SLOWEST = 10
+
+
+def _measure():
+    """Cumulative import time (us) of each top-level import."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = "; ".join(f"import {m}" for m in COLD_START)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=here, capture_output=True, text=True, check=True
+    )
+
+    # "import time: self [us] | cumulative | imported package", nesting shown by indent
+    top = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):
+            top[name.strip()] = int(cumulative)
+    return top
+
+
+def main():
+    runs = [_measure() for _ in range(ATTEMPTS)]
+    best = min(runs, key=lambda r: sum(r.values()))
+    total_ms = sum(best.values()) / 1000
+
+    print(f"cold start imports: {total_ms:.1f} ms (budget {IMPORT_BUDGET_MS} ms, best of {ATTEMPTS})")
+    if total_ms <= IMPORT_BUDGET_MS:
+        return 0
+
+    print("slowest top-level imports:")
+    for name, us in sorted(best.items(), key=lambda item: -item[1])[:SHOW_SLOWEST]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
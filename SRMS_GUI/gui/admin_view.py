@@ -4,10 +4,9 @@ from services.user_service import create_user, update_user_role
 from models.session import Session
 
 class AdminView:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Admin Dashboard")
-        self.root.geometry("400x450")
+    def __init__(self, app):
+        self.app = app
+        self.root = app.frame("Admin Dashboard", "400x450")
 
     def run(self):
         tk.Label(
@@ -19,8 +18,6 @@ class AdminView:
         self.create_user_section()
         self.update_role_section()
 
-        self.root.mainloop()
-
     # ---------------- CREATE USER ----------------
     def create_user_section(self):
         frame = tk.LabelFrame(self.root, text="Create User")
@@ -0,0 +1,46 @@
+import importlib
+import tkinter as tk
+
+# role -> (module, view class); a view is imported the first time it is shown
+DASHBOARDS = {
+    "Admin": ("gui.admin_view", "AdminView"),
+    "Instructor": ("gui.instructor_view", "InstructorView"),
+    "TA": ("gui.ta_view", "TAView"),
+    "Student": ("gui.student_view", "StudentView"),
+}
+GUEST = ("gui.guest_view", "GuestView")
+
+
+class App:
+    """
+    The one Tk root of the application. Views build themselves inside
+    the frame they get from frame(); showing a view replaces the previous one.
+    """
+
+    def __init__(self):
+        self.root = tk.Tk()
+        self.current = None
+
+    def frame(self, title, geometry):
+        if self.current is not None:
+            self.current.destroy()
+
+        self.root.title(title)
+        self.root.geometry(geometry)
+
+        self.current = tk.Frame(self.root)
+        self.current.pack(fill="both", expand=True)
+        return self.current
+
+    def show_login(self):
+        from gui.login_view import LoginView
+        LoginView(self).run()
+
+    def open_dashboard(self, role):
+        module, name = DASHBOARDS.get(role, GUEST)
+        view = getattr(importlib.import_module(module), name)
+        view(self).run()
+
+    def run(self):
+        self.show_login()
+        self.root.mainloop()
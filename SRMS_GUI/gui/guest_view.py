@@ -5,10 +5,9 @@ from services.course_service import view_public_courses
 
 
 class GuestView:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Guest Dashboard")
-        self.root.geometry("600x400")
+    def __init__(self, app):
+        self.app = app
+        self.root = app.frame("Guest Dashboard", "600x400")
 
     def run(self):
         tk.Label(
@@ -34,8 +33,6 @@ class GuestView:
 
         self.table.pack(fill="both", expand=True, pady=10)
 
-        self.root.mainloop()
-
     def load_courses(self):
         try:
             for row in self.table.get_children():
@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
 
-from tensorboard import notebook
 from models.session import Session
 from services.grade_service import enter_or_update_grade, view_grades
 from services.attendance_service import view_attendance
@@ -9,10 +8,9 @@ from services.attendance_service import record_attendance
 
 
 class InstructorView:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Instructor Dashboard")
-        self.root.geometry("700x500")
+    def __init__(self, app):
+        self.app = app
+        self.root = app.frame("Instructor Dashboard", "700x500")
 
     def run(self):
         tk.Label(
@@ -27,8 +25,6 @@ class InstructorView:
         self.grades_tab(notebook)
         self.attendance_tab(notebook)
 
-        self.root.mainloop()
-
     # ---------------- GRADES TAB ----------------
     def grades_tab(self, notebook):
         tab = ttk.Frame(notebook)
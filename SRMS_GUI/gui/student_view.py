@@ -9,10 +9,9 @@ from services.role_request_service import submit_role_upgrade_request
 
 
 class StudentView:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("Student Dashboard")
-        self.root.geometry("750x520")
+    def __init__(self, app):
+        self.app = app
+        self.root = app.frame("Student Dashboard", "750x520")
 
     def run(self):
         tk.Label(
@@ -29,8 +28,6 @@ class StudentView:
         self.courses_tab(nb)
         self.role_request_tab(nb)
 
-        self.root.mainloop()
-
     # ---------------- PROFILE ----------------
     def profile_tab(self, notebook):
         tab = ttk.Frame(notebook)
@@ -5,10 +5,9 @@ from services.attendance_service import view_attendance, record_attendance
 
 
 class TAView:
-    def __init__(self):
-        self.root = tk.Tk()
-        self.root.title("TA Dashboard")
-        self.root.geometry("600x450")
+    def __init__(self, app):
+        self.app = app
+        self.root = app.frame("TA Dashboard", "600x450")
 
     def run(self):
         tk.Label(
@@ -19,8 +18,6 @@ class TAView:
 
         self.attendance_tab()
 
-        self.root.mainloop()
-
     def attendance_tab(self):
         form = tk.Frame(self.root)
         form.pack(pady=10)
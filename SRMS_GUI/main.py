@@ -1,4 +1,4 @@
-from gui.login_view import LoginView
+from gui.app import App
 if __name__ == "__main__":
-    app = LoginView()
+    app = App()
     app.run()
@@ -39,6 +39,39 @@ WITH ALGORITHM = AES_256
 ENCRYPTION BY CERTIFICATE SRMS_Cert;
 GO
 
+-- Opening the key goes through the certificate (an asymmetric decrypt), so
+-- it is done at most once per connection: an open key stays open for the
+-- session until CLOSE or disconnect. Procedures open it only if it isn't
+-- open yet and close it only if they opened it:
+--     DECLARE @opened BIT;
+--     EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+--     ...
+--     IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+CREATE OR ALTER PROCEDURE dbo.OpenKeyIfClosed @Opened BIT OUTPUT
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET @Opened = 0;
+    IF NOT EXISTS (SELECT 1 FROM sys.openkeys WHERE key_name = 'SRMS_AES_Key' AND database_id = DB_ID())
+    BEGIN
+        OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+        SET @Opened = 1;
+    END
+END
+GO
+
+-- Key-session mode: the client calls this once on each new connection and
+-- the key then stays open for the connection's lifetime, so no procedure
+-- call pays for opening it. Without it every call opens and closes the key.
+CREATE OR ALTER PROCEDURE dbo.OpenKeySession
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+END
+GO
+
 ---------------------------------------------------------------
 -- TASK 2: Required Schema (WITH Encrypted Student ID)
 ---------------------------------------------------------------
@@ -47,6 +80,7 @@ GO
 CREATE TABLE dbo.Student (
     SurrogateID     INT IDENTITY(1,1) PRIMARY KEY,  -- used for FKs
     StudentID_Enc   VARBINARY(256) NOT NULL,        -- REAL Student ID, encrypted (PDF 3.1)
+    StudentID_BIdx  BINARY(32)     NULL,            -- keyed HMAC of the real Student ID (TASK 2c)
     FullName        NVARCHAR(100)  NOT NULL,
     Email           NVARCHAR(100)  NOT NULL UNIQUE, -- link to Users.Username
     PhoneEnc        VARBINARY(256) NOT NULL,
@@ -70,7 +104,8 @@ CREATE TABLE dbo.Course (
     CourseID    INT            NOT NULL PRIMARY KEY,
     CourseName  NVARCHAR(100)  NOT NULL,
     [Description] NVARCHAR(MAX) NULL,
-    PublicInfo  NVARCHAR(MAX)  NULL
+    PublicInfo  NVARCHAR(MAX)  NULL,
+    RowVer      ROWVERSION     NOT NULL   -- change detection for cached catalogs
 );
 GO
 
@@ -109,6 +144,128 @@ CREATE TABLE dbo.Users (
 );
 GO
 
+---------------------------------------------------------------
+-- TASK 2b: Supporting Indexes
+---------------------------------------------------------------
+
+-- EnterOrUpdateGrade upsert check + joins from Student (one grade per student/course)
+CREATE UNIQUE INDEX UX_Grades_Student_Course
+    ON dbo.Grades (StudentRefID, CourseID);
+GO
+
+-- CourseGradebook: every grade of one course
+CREATE INDEX IX_Grades_Course
+    ON dbo.Grades (CourseID)
+    INCLUDE (StudentRefID, GradeValueEnc, DateEntered, EnteredBy);
+GO
+
+-- Student branch of ViewAttendance
+CREATE INDEX IX_Attendance_Student_Date
+    ON dbo.Attendance (StudentRefID, DateRecorded)
+    INCLUDE (CourseID, [Status]);
+GO
+
+-- ListStudentRoster: who has attendance in a course
+CREATE INDEX IX_Attendance_Course
+    ON dbo.Attendance (CourseID, StudentRefID);
+GO
+
+-- Keyset paging of attendance (ViewAttendancePage): newest first
+CREATE INDEX IX_Attendance_DateRecorded
+    ON dbo.Attendance (DateRecorded DESC, AttendanceID DESC)
+    INCLUDE (StudentRefID, CourseID, [Status], RecordedBy);
+GO
+
+-- Catalog change probe / delta fetch (PublicCourseVersion, ViewPublicCourses)
+CREATE INDEX IX_Course_RowVer
+    ON dbo.Course (RowVer);
+GO
+
+-- AvgGradeByDepartment
+CREATE INDEX IX_Student_Department
+    ON dbo.Student (Department);
+GO
+
+-- FindStudentByID (blind index, see TASK 2c)
+CREATE INDEX IX_Student_StudentID_BIdx
+    ON dbo.Student (StudentID_BIdx);
+GO
+
+-- (pending role requests index is created with dbo.RoleRequests in TASK 9)
+
+---------------------------------------------------------------
+-- TASK 2c: Blind Index for the real Student ID
+---------------------------------------------------------------
+-- StudentID_Enc can't be searched without decrypting every row, so each
+-- student also stores HMAC-SHA256(key, StudentID) in StudentID_BIdx.
+-- Looking a student up by real ID hashes the ID once and seeks the index.
+-- The HMAC key is random, kept encrypted with SRMS_AES_Key, and stored
+-- as its inner/outer padded forms (key XOR 0x36.., key XOR 0x5C..) so the
+-- HMAC is two HASHBYTES calls.
+CREATE TABLE dbo.BlindIndexKey (
+    KeyName      NVARCHAR(50)   NOT NULL PRIMARY KEY,
+    InnerPadEnc  VARBINARY(256) NOT NULL,
+    OuterPadEnc  VARBINARY(256) NOT NULL
+);
+GO
+
+OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+
+DECLARE @hmacKey BINARY(64) = CRYPT_GEN_RANDOM(64),
+        @ipad VARBINARY(64) = 0x, @opad VARBINARY(64) = 0x, @i INT = 1;
+WHILE @i <= 64
+BEGIN
+    SET @ipad += CAST(CAST(SUBSTRING(@hmacKey, @i, 8) AS BIGINT) ^ CAST(0x3636363636363636 AS BIGINT) AS BINARY(8));
+    SET @opad += CAST(CAST(SUBSTRING(@hmacKey, @i, 8) AS BIGINT) ^ CAST(0x5C5C5C5C5C5C5C5C AS BIGINT) AS BINARY(8));
+    SET @i += 8;
+END
+
+INSERT INTO dbo.BlindIndexKey (KeyName, InnerPadEnc, OuterPadEnc)
+VALUES (N'StudentID',
+        EncryptByKey(Key_GUID('SRMS_AES_Key'), @ipad),
+        EncryptByKey(Key_GUID('SRMS_AES_Key'), @opad));
+
+CLOSE SYMMETRIC KEY SRMS_AES_Key;
+GO
+
+-- Blind index of a real Student ID, given as the plaintext bytes that are
+-- encrypted into StudentID_Enc (VARCHAR). Needs SRMS_AES_Key open; with
+-- the key closed it returns NULL, which matches nothing.
+CREATE OR ALTER FUNCTION dbo.StudentIDBlindIndex(@StudentID VARBINARY(20))
+RETURNS TABLE
+AS
+RETURN
+    SELECT CAST(HASHBYTES('SHA2_256',
+               CONVERT(VARBINARY(64), DecryptByKey(OuterPadEnc))
+             + HASHBYTES('SHA2_256', CONVERT(VARBINARY(64), DecryptByKey(InnerPadEnc)) + @StudentID)
+           ) AS BINARY(32)) AS BIdx
+    FROM dbo.BlindIndexKey
+    WHERE KeyName = N'StudentID';
+GO
+
+CREATE OR ALTER TRIGGER dbo.TR_Student_BlindIndex
+ON dbo.Student
+AFTER INSERT, UPDATE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF NOT UPDATE(StudentID_Enc) RETURN;
+
+    -- the inserting batch usually has the key open already (it just encrypted
+    -- the ID); otherwise it is opened here and closed again
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    UPDATE s
+    SET StudentID_BIdx = b.BIdx
+    FROM dbo.Student s
+    JOIN inserted i ON i.SurrogateID = s.SurrogateID
+    OUTER APPLY dbo.StudentIDBlindIndex(CONVERT(VARBINARY(20), DecryptByKey(i.StudentID_Enc))) b;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
 ---------------------------------------------------------------
 -- TASK 3: RBAC Roles + Block Direct Table Access
 ---------------------------------------------------------------
@@ -126,35 +283,34 @@ GO
 ---------------------------------------------------------------
 -- TASK 4: Helper Functions
 ---------------------------------------------------------------
-CREATE OR ALTER FUNCTION UserRole(@Username NVARCHAR(50))
-RETURNS NVARCHAR(20)
-AS
-BEGIN
-    DECLARE @r NVARCHAR(20);
-    SELECT @r = RoleName FROM Users WHERE Username = @Username;
-    RETURN @r;
-END
+-- Identity of the calling user: role, clearance and (for students) the
+-- Student.SurrogateID, in one seek. Inline, so the optimizer expands it
+-- into the calling statement like a view - no per-call function overhead.
+-- ValidateLogin stores the verified identity in read-only SESSION_CONTEXT
+-- on the connection the client keeps for the whole session; for that user
+-- on that connection the row comes from the context and dbo.Users is not
+-- read. Role changes therefore apply to open sessions at their next login.
+DROP FUNCTION IF EXISTS dbo.UserRole, dbo.UserClearance, dbo.GetStudentSurrogateID;
+DROP PROCEDURE IF EXISTS dbo.GetIdentity;
 GO
 
-CREATE OR ALTER FUNCTION UserClearance(@Username NVARCHAR(50))
-RETURNS INT
+CREATE OR ALTER FUNCTION dbo.UserIdentity(@Username NVARCHAR(50))
+RETURNS TABLE
 AS
-BEGIN
-    DECLARE @c INT;
-    SELECT @c = ClearanceLevel FROM dbo.Users WHERE Username = @Username;
-    RETURN @c;
-END
-GO
-
--- Helper: Get Student SurrogateID from Username (for Students)
-CREATE OR ALTER FUNCTION GetStudentSurrogateID(@Username NVARCHAR(50))
-RETURNS INT
-AS
-BEGIN
-    DECLARE @sid INT;
-    SELECT @sid = SurrogateID FROM Student WHERE Email = @Username;
-    RETURN @sid;
-END
+RETURN
+    SELECT
+        CAST(SESSION_CONTEXT(N'SRMS_Role') AS NVARCHAR(20)) AS RoleName,
+        CAST(SESSION_CONTEXT(N'SRMS_Clearance') AS INT) AS ClearanceLevel,
+        CAST(SESSION_CONTEXT(N'SRMS_StudentRef') AS INT) AS StudentRefID
+    WHERE CAST(SESSION_CONTEXT(N'SRMS_User') AS NVARCHAR(50)) = @Username
+
+    UNION ALL
+
+    SELECT u.RoleName, u.ClearanceLevel, s.SurrogateID
+    FROM dbo.Users u
+    LEFT JOIN dbo.Student s ON s.Email = u.Username
+    WHERE u.Username = @Username
+      AND ISNULL(CAST(SESSION_CONTEXT(N'SRMS_User') AS NVARCHAR(50)), N'') <> @Username;
 GO
 
 ---------------------------------------------------------------
@@ -172,12 +328,15 @@ AS
 BEGIN
     SET NOCOUNT ON;
 
-    IF dbo.UserRole(@AdminUser) <> 'Admin'
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@AdminUser);
+    IF @role <> 'Admin'
     BEGIN
         THROW 50001, 'Admin only.', 1;
     END
 
-    OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
     INSERT INTO dbo.Users (Username, PasswordEnc, RoleName, ClearanceLevel)
     VALUES (@Username,
@@ -185,7 +344,7 @@ BEGIN
             @RoleName,
             @Clearance);
 
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
 END
 GO
 
@@ -196,13 +355,29 @@ CREATE OR ALTER PROCEDURE ValidateLogin
 AS
 BEGIN
     SET NOCOUNT ON;
-    OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
     DECLARE @Stored VARBINARY(256);
     SELECT @Stored = PasswordEnc FROM dbo.[Users] WHERE Username = @Username;
-    IF @Stored IS NULL BEGIN CLOSE SYMMETRIC KEY SRMS_AES_Key; THROW 50002, 'Invalid login.', 1; END
+    IF @Stored IS NULL BEGIN IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key; THROW 50002, 'Invalid login.', 1; END
     DECLARE @Decrypted NVARCHAR(200) = CONVERT(NVARCHAR(200), DecryptByKey(@Stored));
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
     IF @Decrypted <> @PlainPassword THROW 50002, 'Invalid login.', 1;
+
+    -- first login on this connection: remember who it belongs to (see dbo.UserIdentity)
+    IF SESSION_CONTEXT(N'SRMS_User') IS NULL
+    BEGIN
+        DECLARE @Role NVARCHAR(20), @Clearance INT, @StudentRef INT;
+        SELECT @Role = RoleName, @Clearance = ClearanceLevel, @StudentRef = StudentRefID
+        FROM dbo.UserIdentity(@Username);
+
+        EXEC sp_set_session_context @key = N'SRMS_Role', @value = @Role, @read_only = 1;
+        EXEC sp_set_session_context @key = N'SRMS_Clearance', @value = @Clearance, @read_only = 1;
+        EXEC sp_set_session_context @key = N'SRMS_StudentRef', @value = @StudentRef, @read_only = 1;
+        -- set last: dbo.UserIdentity trusts the context once SRMS_User matches
+        EXEC sp_set_session_context @key = N'SRMS_User', @value = @Username, @read_only = 1;
+    END
+
     SELECT Username, RoleName, ClearanceLevel FROM dbo.Users WHERE Username = @Username;
 END
 GO
@@ -212,11 +387,12 @@ CREATE OR ALTER PROCEDURE ViewOwnProfile @Username NVARCHAR(50)
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
     IF @clr < 2 THROW 50004, 'MLS NRU: clearance < Confidential.', 1;
 
-    OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
     IF @role = 'Student'
     BEGIN
@@ -239,16 +415,47 @@ BEGIN
         FROM dbo.Student;
     END
 
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
 END
 GO
 
 -- Public Courses
-CREATE OR ALTER PROCEDURE ViewPublicCourses @Username NVARCHAR(50)
+-- @SinceVersion: only rows inserted/updated at or after this rowversion
+-- (a Watermark from PublicCourseVersion); NULL returns the whole catalog.
+CREATE OR ALTER PROCEDURE ViewPublicCourses
+    @Username     NVARCHAR(50),
+    @SinceVersion BINARY(8) = NULL
 AS
 BEGIN
-    IF dbo.UserRole(@Username) IS NULL THROW 50003, 'Unknown user.', 1;
-    SELECT CourseID, CourseName, PublicInfo FROM dbo.Course;
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL THROW 50003, 'Unknown user.', 1;
+
+    SELECT CourseID, CourseName, PublicInfo, RowVer
+    FROM dbo.Course
+    WHERE @SinceVersion IS NULL OR RowVer >= @SinceVersion
+    OPTION (RECOMPILE);
+END
+GO
+
+-- Cheap "has the catalog changed?" probe for client-side caches.
+--   Version     highest committed rowversion in dbo.Course
+--   CourseCount rows now (deletes leave no rowversion behind)
+--   Watermark   every row below it is committed; keep it and pass it to
+--               ViewPublicCourses next time Version >= it
+CREATE OR ALTER PROCEDURE PublicCourseVersion @Username NVARCHAR(50)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20);
+    SELECT @role = RoleName FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL THROW 50003, 'Unknown user.', 1;
+
+    SELECT MAX(RowVer) AS Version,
+           COUNT(*) AS CourseCount,
+           CAST(MIN_ACTIVE_ROWVERSION() AS BINARY(8)) AS Watermark
+    FROM dbo.Course;
 END
 GO
 
@@ -259,8 +466,9 @@ AS
 BEGIN
     SET NOCOUNT ON;
 
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    DECLARE @opened BIT;
 
     IF @role IS NULL
         THROW 50100, 'Unknown user.', 1;
@@ -272,8 +480,7 @@ BEGIN
     BEGIN
         IF @clr < 2 THROW 50101, 'MLS NRU.', 1;
 
-        OPEN SYMMETRIC KEY SRMS_AES_Key
-        DECRYPTION BY CERTIFICATE SRMS_Cert;
+        EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
         SELECT
             'Student' AS ProfileType,
@@ -286,7 +493,7 @@ BEGIN
         FROM dbo.Student
         WHERE Email = @Username;
 
-        CLOSE SYMMETRIC KEY SRMS_AES_Key;
+        IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
         RETURN;
     END
 
@@ -297,8 +504,7 @@ BEGIN
     BEGIN
         IF @clr < 3 THROW 50102, 'MLS NRU.', 1;
 
-        OPEN SYMMETRIC KEY SRMS_AES_Key
-        DECRYPTION BY CERTIFICATE SRMS_Cert;
+        EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
         SELECT
             'Student' AS ProfileType,
@@ -310,7 +516,7 @@ BEGIN
             ClearanceLevel
         FROM dbo.Student;
 
-        CLOSE SYMMETRIC KEY SRMS_AES_Key;
+        IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
         RETURN;
     END
 
@@ -321,8 +527,7 @@ BEGIN
     BEGIN
         IF @clr < 3 THROW 50103, 'MLS NRU.', 1;
 
-        OPEN SYMMETRIC KEY SRMS_AES_Key
-        DECRYPTION BY CERTIFICATE SRMS_Cert;
+        EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
         -- Students
         SELECT
@@ -349,7 +554,7 @@ BEGIN
         FROM dbo.Users
         WHERE RoleName = 'TA';
 
-        CLOSE SYMMETRIC KEY SRMS_AES_Key;
+        IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
         RETURN;
     END
 
@@ -360,8 +565,7 @@ BEGIN
     BEGIN
         IF @clr < 4 THROW 50104, 'MLS NRU.', 1;
 
-        OPEN SYMMETRIC KEY SRMS_AES_Key
-        DECRYPTION BY CERTIFICATE SRMS_Cert;
+        EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
         SELECT
             'Student' AS ProfileType,
@@ -398,7 +602,7 @@ BEGIN
             ClearanceLevel
         FROM dbo.Users;
 
-        CLOSE SYMMETRIC KEY SRMS_AES_Key;
+        IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
         RETURN;
     END
     ELSE
@@ -408,6 +612,48 @@ BEGIN
 END
 GO
 
+-- One student by real Student ID: a seek on the blind index, then only
+-- the matching row is decrypted (to rule out a hash collision).
+-- Same access rules as ViewProfilesByRole for student profiles.
+CREATE OR ALTER PROCEDURE FindStudentByID
+    @Username  NVARCHAR(50),
+    @StudentID VARCHAR(20)
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+
+    IF @role IS NULL THROW 50100, 'Unknown user.', 1;
+    IF @role = 'TA' AND @clr < 3 THROW 50102, 'MLS NRU.', 1;
+    IF @role = 'Instructor' AND @clr < 3 THROW 50103, 'MLS NRU.', 1;
+    IF @role = 'Admin' AND @clr < 4 THROW 50104, 'MLS NRU.', 1;
+    IF @role NOT IN ('Admin','Instructor','TA') THROW 50105, 'Access denied.', 1;
+
+    DECLARE @Plain VARBINARY(20) = CONVERT(VARBINARY(20), LTRIM(RTRIM(@StudentID)));
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    DECLARE @BIdx BINARY(32) = (SELECT BIdx FROM dbo.StudentIDBlindIndex(@Plain));
+
+    SELECT
+        'Student' AS ProfileType,
+        CONVERT(VARCHAR(20), @Plain) AS Identifier,
+        FullName,
+        Email,
+        CONVERT(NVARCHAR(20), DecryptByKey(PhoneEnc)) AS Phone,
+        Department,
+        ClearanceLevel
+    FROM dbo.Student
+    WHERE StudentID_BIdx = @BIdx
+      AND CONVERT(VARBINARY(20), DecryptByKey(StudentID_Enc)) = @Plain;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
 CREATE OR ALTER PROCEDURE EditOwnProfile
     @Username NVARCHAR(50),
     @NewFullName NVARCHAR(100)
@@ -415,23 +661,18 @@ AS
 BEGIN
     SET NOCOUNT ON;
 
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
 
     -- Only Admin / Instructor / TA
     IF @role NOT IN ('Admin','Instructor','TA')
         THROW 50006, 'Only Admin/Instructor/TA can edit profile.', 1;
 
-    OPEN SYMMETRIC KEY SRMS_AES_Key
-        DECRYPTION BY CERTIFICATE SRMS_Cert;
-
     UPDATE dbo.Student
     SET 
         FullName = @NewFullName,
         ClearanceLevel = @clr   -- MLS-safe
     WHERE Email = @Username;
-
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
 END
 GO
 
@@ -445,8 +686,8 @@ CREATE OR ALTER PROCEDURE EnterOrUpdateGrade
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
     IF @role NOT IN ('Admin','Instructor') THROW 50008, 'Only Admin/Instructor can edit grades.', 1;
     IF @clr < 3 THROW 50009, 'MLS NRU: clearance < Secret.', 1;
     IF @clr > 3 AND @role <> 'Admin'
@@ -455,7 +696,8 @@ BEGIN
     DECLARE @StudentRefID INT = (SELECT SurrogateID FROM dbo.Student WHERE Email = @StudentEmail);
     IF @StudentRefID IS NULL THROW 50025, 'Student not found.', 1;
 
-    OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
     IF EXISTS (SELECT 1 FROM dbo.Grades WHERE StudentRefID = @StudentRefID AND CourseID = @CourseID)
     BEGIN
@@ -470,7 +712,86 @@ BEGIN
         VALUES (@StudentRefID, @CourseID, EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT(VARBINARY(MAX), CAST(@GradeValue AS NVARCHAR(20)))), GETDATE(), @Username);
     END
 
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
+-- One row per CSV line for BulkEnterOrUpdateGrade
+CREATE TYPE dbo.GradeBatch AS TABLE (
+    RowNo        INT           NOT NULL PRIMARY KEY,  -- line number in the source file
+    StudentEmail NVARCHAR(100) NOT NULL,
+    CourseID     INT           NOT NULL,
+    GradeValue   DECIMAL(5,2)  NOT NULL
+);
+GO
+
+-- Set-based EnterOrUpdateGrade: same RBAC/MLS checks, key opened once per
+-- batch, one MERGE. Valid rows are saved in one transaction; rows that
+-- cannot be saved are returned as (RowNo, StudentEmail, Error).
+CREATE OR ALTER PROCEDURE BulkEnterOrUpdateGrade
+    @Username NVARCHAR(50),
+    @Grades   dbo.GradeBatch READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL OR @role NOT IN ('Admin','Instructor') THROW 50008, 'Only Admin/Instructor can edit grades.', 1;
+    IF @clr < 3 THROW 50009, 'MLS NRU: clearance < Secret.', 1;
+    IF @clr > 3 AND @role <> 'Admin'
+		THROW 50010, 'MLS NWD: cannot write down.', 1;
+
+    CREATE TABLE #Batch (
+        RowNo        INT PRIMARY KEY,
+        StudentEmail NVARCHAR(100),
+        StudentRefID INT NULL,
+        CourseID     INT,
+        GradeValue   DECIMAL(5,2),
+        Error        NVARCHAR(200) NULL
+    );
+
+    INSERT INTO #Batch (RowNo, StudentEmail, StudentRefID, CourseID, GradeValue)
+    SELECT g.RowNo, g.StudentEmail, s.SurrogateID, g.CourseID, g.GradeValue
+    FROM @Grades g
+    LEFT JOIN dbo.Student s ON s.Email = g.StudentEmail;
+
+    UPDATE #Batch SET Error = 'Student not found.' WHERE StudentRefID IS NULL;
+
+    UPDATE b SET Error = 'Course not found.'
+    FROM #Batch b
+    WHERE b.Error IS NULL
+      AND NOT EXISTS (SELECT 1 FROM dbo.Course c WHERE c.CourseID = b.CourseID);
+
+    -- the same student/course twice in one batch: the last line wins
+    WITH dup AS (
+        SELECT Error, ROW_NUMBER() OVER (PARTITION BY StudentRefID, CourseID ORDER BY RowNo DESC) AS rn
+        FROM #Batch WHERE Error IS NULL
+    )
+    UPDATE dup SET Error = 'Superseded by a later line for the same student/course.' WHERE rn > 1;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    BEGIN TRAN;
+
+    MERGE dbo.Grades AS t
+    USING (SELECT StudentRefID, CourseID, GradeValue FROM #Batch WHERE Error IS NULL) AS src
+        ON t.StudentRefID = src.StudentRefID AND t.CourseID = src.CourseID
+    WHEN MATCHED THEN
+        UPDATE SET GradeValueEnc = EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT(VARBINARY(MAX), CAST(src.GradeValue AS NVARCHAR(20)))),
+                   DateEntered = GETDATE(), EnteredBy = @Username
+    WHEN NOT MATCHED THEN
+        INSERT (StudentRefID, CourseID, GradeValueEnc, DateEntered, EnteredBy)
+        VALUES (src.StudentRefID, src.CourseID,
+                EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT(VARBINARY(MAX), CAST(src.GradeValue AS NVARCHAR(20)))),
+                GETDATE(), @Username);
+
+    COMMIT;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+
+    SELECT RowNo, StudentEmail, Error FROM #Batch WHERE Error IS NOT NULL ORDER BY RowNo;
 END
 GO
 
@@ -480,29 +801,71 @@ CREATE OR ALTER PROCEDURE ViewGrades
     AS
     BEGIN
         SET NOCOUNT ON;
-        DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-        DECLARE @clr  INT = dbo.UserClearance(@Username);
+        DECLARE @role NVARCHAR(20), @clr INT;
+        SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
         IF @role NOT IN ('Admin','Instructor') THROW 50011, 'Only Admin/Instructor can view grades.', 1;
         IF @clr < 3 THROW 50012, 'MLS NRU: clearance < Secret.', 1;
 
         DECLARE @StudentRefID INT = (SELECT SurrogateID FROM dbo.Student WHERE Email = @StudentEmail);
         IF @StudentRefID IS NULL THROW 50025, 'Student not found.', 1;
 
-        OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+        DECLARE @opened BIT;
+        EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+        -- one student: decrypt the ID once, not once per grade row
+        DECLARE @StudentID NVARCHAR(20) = (
+            SELECT CONVERT(NVARCHAR(20), DecryptByKey(StudentID_Enc))
+            FROM dbo.Student WHERE SurrogateID = @StudentRefID
+        );
 
         SELECT 
             g.GradeID,
-            (SELECT CONVERT(NVARCHAR(20), DecryptByKey(s2.StudentID_Enc)) FROM dbo.Student s2 WHERE s2.SurrogateID = g.StudentRefID) AS StudentID,
+            @StudentID AS StudentID,
             g.CourseID,
             CAST(CONVERT(NVARCHAR(MAX), DecryptByKey(g.GradeValueEnc)) AS DECIMAL(5,2)) AS GradeValue,
             g.DateEntered, g.EnteredBy
         FROM dbo.Grades g
         WHERE g.StudentRefID = @StudentRefID;
 
-        CLOSE SYMMETRIC KEY SRMS_AES_Key;
+        IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
     END
     GO
 
+-- Gradebook of one course: every student with a grade in the course, in
+-- one result set (instead of one ViewGrades call per student). One grade
+-- per student/course, so each student ID is decrypted once.
+CREATE OR ALTER PROCEDURE CourseGradebook
+    @Username NVARCHAR(50),
+    @CourseID INT
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL OR @role NOT IN ('Admin','Instructor') THROW 50011, 'Only Admin/Instructor can view grades.', 1;
+    IF @clr < 3 THROW 50012, 'MLS NRU: clearance < Secret.', 1;
+    IF NOT EXISTS (SELECT 1 FROM dbo.Course WHERE CourseID = @CourseID) THROW 50061, 'Course not found.', 1;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    SELECT
+        CONVERT(VARCHAR(20), DecryptByKey(s.StudentID_Enc)) AS StudentID,
+        s.FullName,
+        s.Email,
+        s.Department,
+        CAST(CONVERT(NVARCHAR(MAX), DecryptByKey(g.GradeValueEnc)) AS DECIMAL(5,2)) AS GradeValue,
+        g.DateEntered,
+        g.EnteredBy
+    FROM dbo.Grades g
+    JOIN dbo.Student s ON s.SurrogateID = g.StudentRefID
+    WHERE g.CourseID = @CourseID
+    ORDER BY s.FullName, s.Email;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
 -- Attendance
 CREATE OR ALTER PROCEDURE RecordAttendance
     @Username NVARCHAR(50),
@@ -512,8 +875,8 @@ CREATE OR ALTER PROCEDURE RecordAttendance
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
     IF @role NOT IN ('Admin','Instructor','TA') THROW 50013, 'Only Admin/Instructor/TA can edit attendance.', 1;
     IF @clr < 3 THROW 50014, 'MLS NRU: clearance < Secret.', 1;
     IF @clr > 3 THROW 50015, 'MLS NWD: cannot write down.', 1;
@@ -526,33 +889,135 @@ BEGIN
 END
 GO
 
+-- Roster for bulk attendance (no decryption needed)
+-- The class list of one course. There is no enrolment table, so a
+-- student belongs to a course once they have a grade or an attendance
+-- record in it (InCourse = 1). A course with neither yet (its first
+-- lecture) lists every student instead, with InCourse = 0.
+-- @Department narrows either list.
+CREATE OR ALTER PROCEDURE ListStudentRoster
+    @Username NVARCHAR(50),
+    @CourseID INT,
+    @Department NVARCHAR(50) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL OR @role NOT IN ('Admin','Instructor','TA') THROW 50013, 'Only Admin/Instructor/TA can edit attendance.', 1;
+    IF @clr < 3 THROW 50014, 'MLS NRU: clearance < Secret.', 1;
+    IF NOT EXISTS (SELECT 1 FROM dbo.Course WHERE CourseID = @CourseID)
+        THROW 50061, 'Course not found.', 1;
+
+    IF EXISTS (SELECT 1 FROM dbo.Grades WHERE CourseID = @CourseID)
+       OR EXISTS (SELECT 1 FROM dbo.Attendance WHERE CourseID = @CourseID)
+        SELECT s.Email, s.FullName, s.Department, CAST(1 AS BIT) AS InCourse
+        FROM dbo.Student s
+        WHERE s.SurrogateID IN (
+            SELECT StudentRefID FROM dbo.Grades WHERE CourseID = @CourseID
+            UNION
+            SELECT StudentRefID FROM dbo.Attendance WHERE CourseID = @CourseID
+        )
+          AND (@Department IS NULL OR s.Department = @Department)
+        ORDER BY s.FullName, s.Email
+        OPTION (RECOMPILE);
+    ELSE
+        SELECT Email, FullName, Department, CAST(0 AS BIT) AS InCourse
+        FROM dbo.Student
+        WHERE @Department IS NULL OR Department = @Department
+        ORDER BY FullName, Email
+        OPTION (RECOMPILE);
+END
+GO
+
+-- One row per student for RecordAttendanceBatch
+CREATE TYPE dbo.AttendanceRoster AS TABLE (
+    StudentEmail NVARCHAR(100) NOT NULL PRIMARY KEY,
+    [Status]     BIT           NOT NULL
+);
+GO
+
+-- Records a whole roster for one course in a single transaction.
+-- Returns one row per submitted student: 'Recorded' or 'Student not found'.
+CREATE OR ALTER PROCEDURE RecordAttendanceBatch
+    @Username NVARCHAR(50),
+    @CourseID INT,
+    @Roster   dbo.AttendanceRoster READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL OR @role NOT IN ('Admin','Instructor','TA') THROW 50013, 'Only Admin/Instructor/TA can edit attendance.', 1;
+    IF @clr < 3 THROW 50014, 'MLS NRU: clearance < Secret.', 1;
+    IF @clr > 3 THROW 50015, 'MLS NWD: cannot write down.', 1;
+    IF NOT EXISTS (SELECT 1 FROM dbo.Course WHERE CourseID = @CourseID) THROW 50061, 'Course not found.', 1;
+
+    DECLARE @Now DATETIME = GETDATE();
+
+    BEGIN TRAN;
+
+    INSERT INTO dbo.Attendance(StudentRefID, CourseID, Status, DateRecorded, RecordedBy)
+    SELECT s.SurrogateID, @CourseID, r.[Status], @Now, @Username
+    FROM @Roster r
+    JOIN dbo.Student s ON s.Email = r.StudentEmail;
+
+    COMMIT;
+
+    SELECT r.StudentEmail,
+           CASE WHEN s.SurrogateID IS NULL THEN 'Student not found' ELSE 'Recorded' END AS Result
+    FROM @Roster r
+    LEFT JOIN dbo.Student s ON s.Email = r.StudentEmail
+    ORDER BY r.StudentEmail;
+END
+GO
+
 CREATE OR ALTER PROCEDURE ViewAttendance @Username NVARCHAR(50)
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
-    IF @clr < 3 AND dbo.UserRole(@Username) <> 'Student'
+    DECLARE @role NVARCHAR(20), @clr INT, @me INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel, @me = StudentRefID FROM dbo.UserIdentity(@Username);
+    IF @clr < 3 AND @role <> 'Student'
 		THROW 50016, 'MLS NRU: clearance < Secret.', 1;
 
-    OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
 
     IF @role IN ('Admin','Instructor','TA')
     BEGIN
+        -- decrypt each student that has attendance once, then join
+        CREATE TABLE #StudentIDs (
+            SurrogateID INT PRIMARY KEY,
+            StudentID   NVARCHAR(20) NULL
+        );
+
+        INSERT INTO #StudentIDs (SurrogateID, StudentID)
+        SELECT s.SurrogateID, CONVERT(NVARCHAR(20), DecryptByKey(s.StudentID_Enc))
+        FROM dbo.Student s
+        WHERE EXISTS (SELECT 1 FROM dbo.Attendance a WHERE a.StudentRefID = s.SurrogateID);
+
         SELECT 
             a.AttendanceID,
-            (SELECT CONVERT(NVARCHAR(20), DecryptByKey(s.StudentID_Enc)) FROM dbo.Student s WHERE s.SurrogateID = a.StudentRefID) AS StudentID,
+            i.StudentID,
             a.CourseID, a.[Status], a.DateRecorded, a.RecordedBy
-        FROM dbo.Attendance a;
+        FROM dbo.Attendance a
+        JOIN #StudentIDs i ON i.SurrogateID = a.StudentRefID;
     END
     ELSE IF @role = 'Student'
     BEGIN
-        DECLARE @MyRefID INT = dbo.GetStudentSurrogateID(@Username);
+        DECLARE @MyRefID INT = @me;
         IF @MyRefID IS NULL THROW 50017, 'Student record not found.', 1;
 
+        DECLARE @MyStudentID NVARCHAR(20) = (
+            SELECT CONVERT(NVARCHAR(20), DecryptByKey(StudentID_Enc))
+            FROM dbo.Student WHERE SurrogateID = @MyRefID
+        );
+
         SELECT 
             AttendanceID,
-            (SELECT CONVERT(NVARCHAR(20), DecryptByKey(s.StudentID_Enc)) FROM dbo.Student s WHERE s.SurrogateID = a.StudentRefID) AS StudentID,
+            @MyStudentID AS StudentID,
             CourseID, [Status], DateRecorded
         FROM dbo.Attendance a
         WHERE a.StudentRefID = @MyRefID;
@@ -560,7 +1025,204 @@ BEGIN
     ELSE
         THROW 50018, 'Access denied.', 1;
 
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
+-- Paged attendance (keyset on DateRecorded/AttendanceID, newest first).
+-- Pass the DateRecorded/AttendanceID of the last row already shown to get
+-- the next page. @ToDate is exclusive.
+CREATE OR ALTER PROCEDURE ViewAttendancePage
+    @Username  NVARCHAR(50),
+    @PageSize  INT = 100,
+    @AfterDate DATETIME = NULL,
+    @AfterID   INT = NULL,
+    @CourseID  INT = NULL,
+    @FromDate  DATETIME = NULL,
+    @ToDate    DATETIME = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT, @me INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel, @me = StudentRefID FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL OR @role NOT IN ('Admin','Instructor','TA','Student')
+        THROW 50018, 'Access denied.', 1;
+    IF @clr < 3 AND @role <> 'Student'
+        THROW 50016, 'MLS NRU: clearance < Secret.', 1;
+    IF @PageSize NOT BETWEEN 1 AND 1000 THROW 50060, 'Page size must be between 1 and 1000.', 1;
+
+    -- Students only ever see their own rows
+    DECLARE @MyRefID INT = NULL;
+    IF @role = 'Student'
+    BEGIN
+        SET @MyRefID = @me;
+        IF @MyRefID IS NULL THROW 50017, 'Student record not found.', 1;
+    END
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    -- Pick the page first so only the students on it are decrypted
+    DECLARE @page TABLE (
+        AttendanceID INT PRIMARY KEY,
+        StudentRefID INT, CourseID INT, [Status] BIT,
+        DateRecorded DATETIME, RecordedBy NVARCHAR(50)
+    );
+
+    INSERT INTO @page
+        SELECT TOP (@PageSize)
+            a.AttendanceID, a.StudentRefID, a.CourseID, a.[Status], a.DateRecorded, a.RecordedBy
+        FROM dbo.Attendance a
+        WHERE (@MyRefID IS NULL OR a.StudentRefID = @MyRefID)
+          AND (@CourseID IS NULL OR a.CourseID = @CourseID)
+          AND (@FromDate IS NULL OR a.DateRecorded >= @FromDate)
+          AND (@ToDate IS NULL OR a.DateRecorded < @ToDate)
+          AND (@AfterDate IS NULL
+               OR a.DateRecorded < @AfterDate
+               OR (a.DateRecorded = @AfterDate AND a.AttendanceID < @AfterID))
+        ORDER BY a.DateRecorded DESC, a.AttendanceID DESC
+        OPTION (RECOMPILE);
+
+    WITH ids AS (
+        SELECT s.SurrogateID, CONVERT(NVARCHAR(20), DecryptByKey(s.StudentID_Enc)) AS StudentID
+        FROM dbo.Student s
+        WHERE s.SurrogateID IN (SELECT StudentRefID FROM @page)
+    )
+    SELECT
+        p.AttendanceID,
+        i.StudentID,
+        p.CourseID, p.[Status], p.DateRecorded,
+        CASE WHEN @role = 'Student' THEN NULL ELSE p.RecordedBy END AS RecordedBy
+    FROM @page p
+    JOIN ids i ON i.SurrogateID = p.StudentRefID
+    ORDER BY p.DateRecorded DESC, p.AttendanceID DESC;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
+-- Attendance rollup: present/absent counts per student, course and ISO
+-- week (WeekStart = the Monday), kept up to date by a trigger on
+-- dbo.Attendance, so RecordAttendance, RecordAttendanceBatch and bulk
+-- loads all maintain it. Attendance rates and trends are read from here
+-- instead of from the raw rows.
+CREATE TABLE dbo.AttendanceWeekly (
+    CourseID      INT  NOT NULL,
+    StudentRefID  INT  NOT NULL,
+    WeekStart     DATE NOT NULL,
+    PresentCount  INT  NOT NULL,
+    AbsentCount   INT  NOT NULL,
+    CONSTRAINT PK_AttendanceWeekly PRIMARY KEY (CourseID, StudentRefID, WeekStart)
+);
+GO
+
+-- a student's own rollup across courses
+CREATE INDEX IX_AttendanceWeekly_Student
+    ON dbo.AttendanceWeekly (StudentRefID, CourseID, WeekStart)
+    INCLUDE (PresentCount, AbsentCount);
+GO
+
+CREATE OR ALTER TRIGGER dbo.TR_Attendance_Weekly
+ON dbo.Attendance
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF NOT EXISTS (SELECT 1 FROM inserted) AND NOT EXISTS (SELECT 1 FROM deleted) RETURN;
+
+    -- wk = whole weeks since 1900-01-01, a Monday: the ISO week's Monday
+    -- is then 1900-01-01 + wk * 7 days, whatever SET DATEFIRST is
+    WITH changes AS (
+        SELECT CourseID, StudentRefID, DATEDIFF(DAY, '19000101', DateRecorded) / 7 AS wk,
+               IIF([Status] = 1, 1, 0) AS p, IIF([Status] = 1, 0, 1) AS a
+        FROM inserted
+        UNION ALL
+        SELECT CourseID, StudentRefID, DATEDIFF(DAY, '19000101', DateRecorded) / 7,
+               IIF([Status] = 1, -1, 0), IIF([Status] = 1, 0, -1)
+        FROM deleted
+    )
+    MERGE dbo.AttendanceWeekly WITH (HOLDLOCK) AS t
+    USING (
+        SELECT CourseID, StudentRefID, CAST(DATEADD(DAY, wk * 7, '19000101') AS DATE), SUM(p), SUM(a)
+        FROM changes
+        GROUP BY CourseID, StudentRefID, wk
+    ) AS d (CourseID, StudentRefID, WeekStart, PresentCount, AbsentCount)
+        ON t.CourseID = d.CourseID AND t.StudentRefID = d.StudentRefID AND t.WeekStart = d.WeekStart
+    -- a week whose last row went away is removed, not left at 0/0
+    WHEN MATCHED AND t.PresentCount + d.PresentCount = 0 AND t.AbsentCount + d.AbsentCount = 0 THEN
+        DELETE
+    WHEN MATCHED THEN
+        UPDATE SET PresentCount = t.PresentCount + d.PresentCount,
+                   AbsentCount = t.AbsentCount + d.AbsentCount
+    WHEN NOT MATCHED THEN
+        INSERT (CourseID, StudentRefID, WeekStart, PresentCount, AbsentCount)
+        VALUES (d.CourseID, d.StudentRefID, d.WeekStart, d.PresentCount, d.AbsentCount);
+END
+GO
+
+-- Recomputes dbo.AttendanceWeekly from scratch (after bulk loads with
+-- triggers disabled, or to check for drift).
+CREATE OR ALTER PROCEDURE dbo.RebuildAttendanceWeekly @AdminUser NVARCHAR(50)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20);
+    SELECT @role = RoleName FROM dbo.UserIdentity(@AdminUser);
+    IF @role IS NULL OR @role <> 'Admin' THROW 50001, 'Admin only.', 1;
+
+    BEGIN TRAN;
+    DELETE FROM dbo.AttendanceWeekly WITH (TABLOCKX);
+    INSERT INTO dbo.AttendanceWeekly (CourseID, StudentRefID, WeekStart, PresentCount, AbsentCount)
+    SELECT CourseID, StudentRefID, CAST(DATEADD(DAY, wk * 7, '19000101') AS DATE),
+           SUM(IIF([Status] = 1, 1, 0)),
+           SUM(IIF([Status] = 1, 0, 1))
+    FROM (
+        SELECT CourseID, StudentRefID, [Status], DATEDIFF(DAY, '19000101', DateRecorded) / 7 AS wk
+        FROM dbo.Attendance
+    ) a
+    GROUP BY CourseID, StudentRefID, wk;
+    COMMIT;
+END
+GO
+
+-- Weekly attendance counts from the rollup. Students get their own rows
+-- (every course, or @CourseID); Admin/Instructor/TA get one course.
+-- Identifies students by email/name only, so nothing is decrypted.
+CREATE OR ALTER PROCEDURE AttendanceWeekly
+    @Username NVARCHAR(50),
+    @CourseID INT = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT, @me INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel, @me = StudentRefID FROM dbo.UserIdentity(@Username);
+    IF @role IS NULL OR @role NOT IN ('Admin','Instructor','TA','Student')
+        THROW 50018, 'Access denied.', 1;
+    IF @clr < 3 AND @role <> 'Student'
+        THROW 50016, 'MLS NRU: clearance < Secret.', 1;
+
+    IF @role = 'Student'
+    BEGIN
+        IF @me IS NULL THROW 50017, 'Student record not found.', 1;
+
+        SELECT s.Email, s.FullName, w.CourseID, w.WeekStart, w.PresentCount, w.AbsentCount
+        FROM dbo.AttendanceWeekly w
+        JOIN dbo.Student s ON s.SurrogateID = w.StudentRefID
+        WHERE w.StudentRefID = @me
+          AND (@CourseID IS NULL OR w.CourseID = @CourseID)
+        ORDER BY w.CourseID, w.WeekStart
+        OPTION (RECOMPILE);
+        RETURN;
+    END
+
+    IF @CourseID IS NULL OR NOT EXISTS (SELECT 1 FROM dbo.Course WHERE CourseID = @CourseID)
+        THROW 50061, 'Course not found.', 1;
+
+    SELECT s.Email, s.FullName, w.CourseID, w.WeekStart, w.PresentCount, w.AbsentCount
+    FROM dbo.AttendanceWeekly w
+    JOIN dbo.Student s ON s.SurrogateID = w.StudentRefID
+    WHERE w.CourseID = @CourseID
+    ORDER BY s.Email, w.WeekStart;
 END
 GO
 
@@ -572,7 +1234,9 @@ CREATE OR ALTER PROCEDURE UpdateUserRole
     @NewClearance INT
 AS
 BEGIN
-    IF dbo.UserRole(@AdminUser) <> 'Admin' THROW 50019, 'Admin only.', 1;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@AdminUser);
+    IF @role <> 'Admin' THROW 50019, 'Admin only.', 1;
     UPDATE dbo.[Users] SET RoleName = @NewRole, ClearanceLevel = @NewClearance WHERE Username = @TargetUser;
 END
 GO
@@ -585,36 +1249,214 @@ AS
 SELECT SurrogateID, FullName, Department FROM dbo.Student;
 GO
 
+-- Inference: grade totals per department, kept up to date by triggers on
+-- dbo.Grades and dbo.Student so AvgGradeByDepartment is a single-row read
+-- instead of decrypting every grade in the department.
+CREATE TABLE dbo.DeptGradeAgg (
+    Department    NVARCHAR(50)   NOT NULL PRIMARY KEY,
+    GradeSum      DECIMAL(19,2)  NOT NULL,
+    GradeCount    INT            NOT NULL,
+    StudentCount  INT            NOT NULL   -- distinct students with at least one grade
+);
+GO
+
+CREATE TYPE dbo.DeptGradeDelta AS TABLE (
+    Department    NVARCHAR(50)   NOT NULL,
+    GradeSum      DECIMAL(19,2)  NOT NULL,
+    GradeCount    INT            NOT NULL,
+    StudentCount  INT            NOT NULL
+);
+GO
+
+CREATE OR ALTER PROCEDURE dbo.ApplyDeptGradeDelta
+    @Delta dbo.DeptGradeDelta READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    MERGE dbo.DeptGradeAgg WITH (HOLDLOCK) AS t
+    USING (
+        SELECT Department, SUM(GradeSum), SUM(GradeCount), SUM(StudentCount)
+        FROM @Delta
+        GROUP BY Department
+    ) AS d (Department, GradeSum, GradeCount, StudentCount)
+        ON t.Department = d.Department
+    WHEN MATCHED THEN
+        UPDATE SET GradeSum = t.GradeSum + d.GradeSum,
+                   GradeCount = t.GradeCount + d.GradeCount,
+                   StudentCount = t.StudentCount + d.StudentCount
+    WHEN NOT MATCHED THEN
+        INSERT (Department, GradeSum, GradeCount, StudentCount)
+        VALUES (d.Department, d.GradeSum, d.GradeCount, d.StudentCount);
+
+    DELETE FROM dbo.DeptGradeAgg WHERE GradeCount = 0;
+END
+GO
+
+CREATE OR ALTER TRIGGER dbo.TR_Grades_DeptGradeAgg
+ON dbo.Grades
+AFTER INSERT, UPDATE, DELETE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF NOT EXISTS (SELECT 1 FROM inserted) AND NOT EXISTS (SELECT 1 FROM deleted) RETURN;
+
+    -- the grade procedures already have the key open; anything else (ad hoc
+    -- maintenance) gets it opened here and closed again
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    DECLARE @delta dbo.DeptGradeDelta;
+
+    WITH changes AS (
+        SELECT StudentRefID, 1 AS n,
+               CONVERT(DECIMAL(5,2), CONVERT(NVARCHAR(32), DecryptByKey(GradeValueEnc))) AS v
+        FROM inserted
+        UNION ALL
+        SELECT StudentRefID, -1,
+               -CONVERT(DECIMAL(5,2), CONVERT(NVARCHAR(32), DecryptByKey(GradeValueEnc)))
+        FROM deleted
+    ),
+    per_student AS (
+        SELECT c.StudentRefID, SUM(c.v) AS dSum, SUM(c.n) AS dCount,
+               (SELECT COUNT(*) FROM dbo.Grades g WHERE g.StudentRefID = c.StudentRefID) AS nowCount
+        FROM changes c
+        GROUP BY c.StudentRefID
+    )
+    INSERT INTO @delta (Department, GradeSum, GradeCount, StudentCount)
+    SELECT s.Department, ISNULL(p.dSum, 0), p.dCount,
+           IIF(p.nowCount > 0, 1, 0) - IIF(p.nowCount - p.dCount > 0, 1, 0)
+    FROM per_student p
+    JOIN dbo.Student s ON s.SurrogateID = p.StudentRefID;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+
+    EXEC dbo.ApplyDeptGradeDelta @delta;
+END
+GO
+
+-- a student changing department takes their grades along
+CREATE OR ALTER TRIGGER dbo.TR_Student_DeptGradeAgg
+ON dbo.Student
+AFTER UPDATE
+AS
+BEGIN
+    SET NOCOUNT ON;
+    IF NOT UPDATE(Department) RETURN;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    DECLARE @delta dbo.DeptGradeDelta;
+
+    WITH moved AS (
+        SELECT d.SurrogateID, d.Department AS OldDept, i.Department AS NewDept,
+               SUM(CONVERT(DECIMAL(5,2), CONVERT(NVARCHAR(32), DecryptByKey(g.GradeValueEnc)))) AS GradeSum,
+               COUNT(*) AS GradeCount
+        FROM deleted d
+        JOIN inserted i ON i.SurrogateID = d.SurrogateID
+        JOIN dbo.Grades g ON g.StudentRefID = d.SurrogateID
+        WHERE d.Department <> i.Department
+        GROUP BY d.SurrogateID, d.Department, i.Department
+    )
+    INSERT INTO @delta (Department, GradeSum, GradeCount, StudentCount)
+    SELECT OldDept, -ISNULL(GradeSum, 0), -GradeCount, -1 FROM moved
+    UNION ALL
+    SELECT NewDept, ISNULL(GradeSum, 0), GradeCount, 1 FROM moved;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+
+    IF EXISTS (SELECT 1 FROM @delta) EXEC dbo.ApplyDeptGradeDelta @delta;
+END
+GO
+
+-- Recomputes dbo.DeptGradeAgg from scratch (after TRUNCATE, bulk loads with
+-- triggers disabled, or to check for drift).
+CREATE OR ALTER PROCEDURE dbo.RebuildDeptGradeAgg @AdminUser NVARCHAR(50)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20);
+    SELECT @role = RoleName FROM dbo.UserIdentity(@AdminUser);
+    IF @role IS NULL OR @role <> 'Admin' THROW 50001, 'Admin only.', 1;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    BEGIN TRAN;
+    DELETE FROM dbo.DeptGradeAgg WITH (TABLOCKX);
+    INSERT INTO dbo.DeptGradeAgg (Department, GradeSum, GradeCount, StudentCount)
+    SELECT s.Department,
+           ISNULL(SUM(CONVERT(DECIMAL(5,2), CONVERT(NVARCHAR(32), DecryptByKey(g.GradeValueEnc)))), 0),
+           COUNT(*),
+           COUNT(DISTINCT s.SurrogateID)
+    FROM dbo.Student s
+    JOIN dbo.Grades g ON g.StudentRefID = s.SurrogateID
+    GROUP BY s.Department;
+    COMMIT;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
 CREATE OR ALTER PROCEDURE AvgGradeByDepartment
     @Username NVARCHAR(50),
     @Department NVARCHAR(50)
 AS
 BEGIN
     SET NOCOUNT ON;
-    DECLARE @role NVARCHAR(20) = dbo.UserRole(@Username);
-    DECLARE @clr  INT = dbo.UserClearance(@Username);
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
     IF @role NOT IN ('Admin','Instructor') THROW 50020, 'Access denied.', 1;
     IF @clr < 3 THROW 50021, 'MLS NRU.', 1;
 
-    DECLARE @cnt INT;
-    SELECT @cnt = COUNT(DISTINCT s.SurrogateID)
-    FROM dbo.Student s JOIN dbo.Grades g ON g.StudentRefID = s.SurrogateID
-    WHERE s.Department = @Department;
+    DECLARE @dept NVARCHAR(50), @sum DECIMAL(19,2), @grades INT, @cnt INT;
+    SELECT @dept = Department, @sum = GradeSum, @grades = GradeCount, @cnt = StudentCount
+    FROM dbo.DeptGradeAgg
+    WHERE Department = @Department;
 
-    IF @cnt < 3 THROW 50022, 'Inference Control: group size < 3.', 1;
+    IF ISNULL(@cnt, 0) < 3 THROW 50022, 'Inference Control: group size < 3.', 1;
 
-    OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+    SELECT
+        @dept AS Department,
+        CAST(@sum / @grades AS DECIMAL(38,6)) AS AvgGrade,
+        @cnt AS GroupSize;
+END
+GO
 
-    SELECT 
-        s.Department,
-        AVG(CONVERT(DECIMAL(5,2), CONVERT(NVARCHAR(32), DecryptByKey(g.GradeValueEnc)))) AS AvgGrade,
-        COUNT(DISTINCT s.SurrogateID) AS GroupSize
-    FROM dbo.Student s
+-- Inference report: every grade value (no student identity) of each
+-- department with at least 3 graded students, in one result, for the
+-- client to compute distributions. Smaller departments are listed with a
+-- NULL GradeValue only, so the client can show them as suppressed.
+CREATE OR ALTER PROCEDURE GradeDistributionByDepartment
+    @Username NVARCHAR(50)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role NOT IN ('Admin','Instructor') THROW 50020, 'Access denied.', 1;
+    IF @clr < 3 THROW 50021, 'MLS NRU.', 1;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    SELECT a.Department, a.StudentCount AS GroupSize,
+           CONVERT(DECIMAL(5,2), CONVERT(NVARCHAR(32), DecryptByKey(g.GradeValueEnc))) AS GradeValue
+    FROM dbo.DeptGradeAgg a
+    JOIN dbo.Student s ON s.Department = a.Department
     JOIN dbo.Grades g ON g.StudentRefID = s.SurrogateID
-    WHERE s.Department = @Department
-    GROUP BY s.Department;
+    WHERE a.StudentCount >= 3
 
-    CLOSE SYMMETRIC KEY SRMS_AES_Key;
+    UNION ALL
+
+    SELECT Department, StudentCount, NULL
+    FROM dbo.DeptGradeAgg
+    WHERE StudentCount < 3
+
+    ORDER BY Department;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
 END
 GO
 
@@ -640,6 +1482,14 @@ CREATE TABLE dbo.RoleRequests (
 );
 GO
 
+-- ListPendingRoleRequests: only the pending rows, keyset-paged by RequestID
+-- (identity, so also submission order)
+CREATE INDEX IX_RoleRequests_Pending
+    ON dbo.RoleRequests (RequestID)
+    INCLUDE (Username, CurrentRole, RequestedRole, Reason, DateSubmitted)
+    WHERE Status = 'Pending';
+GO
+
 CREATE OR ALTER PROCEDURE dbo.SubmitRoleUpgradeRequest
     @Username NVARCHAR(50),
     @RequestedRole NVARCHAR(20),
@@ -648,7 +1498,8 @@ AS
 BEGIN
     SET NOCOUNT ON;
 
-    DECLARE @CurrentRole NVARCHAR(20) = dbo.UserRole(@Username);
+    -- the stored role, not the one pinned to this session at login
+    DECLARE @CurrentRole NVARCHAR(20) = (SELECT RoleName FROM dbo.Users WHERE Username = @Username);
 
     IF @CurrentRole IS NULL
         THROW 50050, 'User not found in dbo.Users (cannot determine CurrentRole).', 1;
@@ -661,12 +1512,29 @@ END
 GO
 
 
-CREATE OR ALTER PROCEDURE ListPendingRoleRequests @AdminUser NVARCHAR(50)
+-- Pending requests in RequestID order. @AfterID: the last RequestID the
+-- caller already has - the next page, or (as a high watermark) only the
+-- requests submitted since. @PageSize NULL returns everything.
+CREATE OR ALTER PROCEDURE ListPendingRoleRequests
+    @AdminUser NVARCHAR(50),
+    @PageSize  INT = NULL,
+    @AfterID   INT = NULL
 AS
 BEGIN
-    IF dbo.UserRole(@AdminUser) <> 'Admin' THROW 50031, 'Admin only.', 1;
-    SELECT RequestID, Username, CurrentRole, RequestedRole, Reason, DateSubmitted, Status
-    FROM dbo.RoleRequests WHERE Status = 'Pending' ORDER BY DateSubmitted;
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@AdminUser);
+    IF @role <> 'Admin' THROW 50031, 'Admin only.', 1;
+    IF @PageSize IS NOT NULL AND @PageSize NOT BETWEEN 1 AND 1000
+        THROW 50060, 'Page size must be between 1 and 1000.', 1;
+
+    SELECT TOP (ISNULL(@PageSize, 2147483647))
+        RequestID, Username, CurrentRole, RequestedRole, Reason, DateSubmitted, Status
+    FROM dbo.RoleRequests
+    WHERE Status = 'Pending'
+      AND (@AfterID IS NULL OR RequestID > @AfterID)
+    ORDER BY RequestID
+    OPTION (RECOMPILE);
 END
 GO
 
@@ -677,7 +1545,9 @@ CREATE OR ALTER PROCEDURE ResolveRoleRequest
     @NewClearance INT = NULL
 AS
 BEGIN
-    IF dbo.UserRole(@AdminUser) <> 'Admin' THROW 50032, 'Admin only.', 1;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@AdminUser);
+    IF @role <> 'Admin' THROW 50032, 'Admin only.', 1;
     DECLARE @Username NVARCHAR(50), @RequestedRole NVARCHAR(20), @CurrentStatus NVARCHAR(20);
     SELECT @Username = Username, @RequestedRole = RequestedRole, @CurrentStatus = Status
     FROM dbo.RoleRequests WHERE RequestID = @RequestID;
@@ -698,32 +1568,123 @@ BEGIN
 END
 GO
 
+-- One row per decision for BulkResolveRoleRequests
+CREATE TYPE dbo.RoleDecisionBatch AS TABLE (
+    RequestID    INT          NOT NULL PRIMARY KEY,
+    [Action]     NVARCHAR(10) NOT NULL,   -- 'Approve' / 'Deny'
+    NewClearance INT          NULL        -- as ResolveRoleRequest; NULL keeps the user's clearance
+);
+GO
+
+-- Resolves a whole batch of requests in one transaction. Returns one row
+-- per submitted request: 'Approved', 'Denied', 'Already resolved',
+-- 'Request not found' or 'Invalid action' (the last three change nothing).
+-- A user approved more than once in the batch ends up with the role of
+-- the newest request, as if they had been resolved one by one.
+CREATE OR ALTER PROCEDURE BulkResolveRoleRequests
+    @AdminUser NVARCHAR(50),
+    @Decisions dbo.RoleDecisionBatch READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@AdminUser);
+    IF @role IS NULL OR @role <> 'Admin' THROW 50032, 'Admin only.', 1;
+
+    CREATE TABLE #Decision (
+        RequestID     INT PRIMARY KEY,
+        [Action]      NVARCHAR(10),
+        NewClearance  INT,
+        Username      NVARCHAR(50),
+        RequestedRole NVARCHAR(20),
+        Result        NVARCHAR(20) NULL
+    );
+
+    DECLARE @Now DATETIME = GETDATE();
+
+    BEGIN TRAN;
+
+    -- lock the requests so a concurrent resolve can't slip in between
+    INSERT INTO #Decision (RequestID, [Action], NewClearance, Username, RequestedRole, Result)
+    SELECT d.RequestID, d.[Action], d.NewClearance, r.Username, r.RequestedRole,
+           CASE
+               WHEN r.RequestID IS NULL THEN 'Request not found'
+               WHEN r.Status <> 'Pending' THEN 'Already resolved'
+               WHEN d.[Action] NOT IN ('Approve','Deny') THEN 'Invalid action'
+           END
+    FROM @Decisions d
+    LEFT JOIN dbo.RoleRequests r WITH (UPDLOCK, HOLDLOCK) ON r.RequestID = d.RequestID;
+
+    UPDATE u
+    SET RoleName = a.RequestedRole,
+        ClearanceLevel = COALESCE(a.NewClearance, u.ClearanceLevel)
+    FROM dbo.[Users] u
+    JOIN (
+        SELECT Username, RequestedRole, NewClearance,
+               ROW_NUMBER() OVER (PARTITION BY Username ORDER BY RequestID DESC) AS rn
+        FROM #Decision
+        WHERE Result IS NULL AND [Action] = 'Approve'
+    ) a ON a.Username = u.Username AND a.rn = 1;
+
+    UPDATE #Decision
+    SET Result = CASE [Action] WHEN 'Approve' THEN 'Approved' ELSE 'Denied' END
+    WHERE Result IS NULL;
+
+    UPDATE r
+    SET Status = d.Result, DateResolved = @Now, ResolvedBy = @AdminUser
+    FROM dbo.RoleRequests r
+    JOIN #Decision d ON d.RequestID = r.RequestID
+    WHERE d.Result IN ('Approved','Denied');
+
+    COMMIT;
+
+    SELECT RequestID, Result FROM #Decision ORDER BY RequestID;
+END
+GO
+
 ---------------------------------------------------------------
 -- TASK 10: Grant EXECUTE Permissions
 ---------------------------------------------------------------
 -- Public
+GRANT EXECUTE ON OpenKeySession TO [Guest], [Student], [TA], [Instructor], [Admin];
 GRANT EXECUTE ON ViewPublicCourses TO [Guest], [Student], [TA], [Instructor], [Admin];
+GRANT EXECUTE ON PublicCourseVersion TO [Guest], [Student], [TA], [Instructor], [Admin];
 
 -- Profile
 GRANT EXECUTE ON ViewOwnProfile TO [Student], [TA], [Instructor], [Admin];
 GRANT EXECUTE ON EditOwnProfile TO [TA], [Instructor], [Admin];
+GRANT EXECUTE ON FindStudentByID TO [TA], [Instructor], [Admin];
 
 -- Grades
 GRANT EXECUTE ON ViewGrades TO [Admin], [Instructor];
+GRANT EXECUTE ON CourseGradebook TO [Admin], [Instructor];
 GRANT EXECUTE ON EnterOrUpdateGrade TO [Admin], [Instructor];
+GRANT EXECUTE ON BulkEnterOrUpdateGrade TO [Admin], [Instructor];
+GRANT EXECUTE ON TYPE::dbo.GradeBatch TO [Admin], [Instructor];
 
 -- Attendance
 GRANT EXECUTE ON RecordAttendance TO [Admin], [Instructor], [TA];
+GRANT EXECUTE ON ListStudentRoster TO [Admin], [Instructor], [TA];
+GRANT EXECUTE ON RecordAttendanceBatch TO [Admin], [Instructor], [TA];
+GRANT EXECUTE ON TYPE::dbo.AttendanceRoster TO [Admin], [Instructor], [TA];
 GRANT EXECUTE ON ViewAttendance TO [Admin], [Instructor], [TA], [Student];
+GRANT EXECUTE ON ViewAttendancePage TO [Admin], [Instructor], [TA], [Student];
+GRANT EXECUTE ON AttendanceWeekly TO [Admin], [Instructor], [TA], [Student];
 
 -- Admin
 GRANT EXECUTE ON CreateUser TO [Admin];
 GRANT EXECUTE ON UpdateUserRole TO [Admin];
+GRANT EXECUTE ON RebuildDeptGradeAgg TO [Admin];
+GRANT EXECUTE ON RebuildAttendanceWeekly TO [Admin];
 GRANT EXECUTE ON ListPendingRoleRequests TO [Admin];
 GRANT EXECUTE ON ResolveRoleRequest TO [Admin];
+GRANT EXECUTE ON BulkResolveRoleRequests TO [Admin];
+GRANT EXECUTE ON TYPE::dbo.RoleDecisionBatch TO [Admin];
 
 -- Inference
 GRANT EXECUTE ON AvgGradeByDepartment TO [Admin], [Instructor];
+GRANT EXECUTE ON GradeDistributionByDepartment TO [Admin], [Instructor];
 
 -- Role Requests
 GRANT EXECUTE ON SubmitRoleUpgradeRequest TO [Student], [TA];
@@ -805,8 +1766,8 @@ CLOSE SYMMETRIC KEY SRMS_AES_Key;
 
 
 -- Course
-INSERT INTO dbo.Course VALUES (101, 'Database Security', 'Secure DB design', 'Open to all');
-INSERT INTO dbo.Course VALUES (102, 'Advanced Database', 'SQL Server', 'Open to all');
+INSERT INTO dbo.Course (CourseID, CourseName, [Description], PublicInfo) VALUES (101, 'Database Security', 'Secure DB design', 'Open to all');
+INSERT INTO dbo.Course (CourseID, CourseName, [Description], PublicInfo) VALUES (102, 'Advanced Database', 'SQL Server', 'Open to all');
 
 CLOSE SYMMETRIC KEY SRMS_AES_Key;
 GO
@@ -921,7 +1882,7 @@ VALUES
 );
 
 
-INSERT INTO dbo.Course
+INSERT INTO dbo.Course (CourseID, CourseName, [Description], PublicInfo)
 VALUES (101, 'Database Security', 'Secure DB design', 'Open to all');
 GO
 
@@ -1,28 +1,42 @@
-from db.connection import get_connection
-from tkinter import messagebox
+from db import metrics
+from db.connection import driver, get_connection, register_session, Session
+from db.query import fetch_one
+from models.records import LoginRow
 
-def validate_login(username, password):
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+INVALID_LOGIN = 50002  # ValidateLogin's THROW for an unknown user or a wrong password
 
-        cursor.execute(
-            "EXEC ValidateLogin ?, ?",
-            username, password
-        )
 
-        row = cursor.fetchone()
-        if not row:
-            messagebox.showerror("Login Failed", "Invalid username or password")
-            return None
+def _is_invalid_login(error):
+    # the server error number ends the message: "...Invalid login. (50002) (SQLExecDirectW)"
+    return any(f"({INVALID_LOGIN})" in str(arg) for arg in error.args)
 
-        # SQL returns: Username, RoleName, ClearanceLevel
-        return {
-            "username": row.Username,
-            "role": row.RoleName,
-            "clearance": row.ClearanceLevel
-        }
 
+def validate_login(username, password):
+    """
+    Returns a Session for the user, or None if the credentials are wrong.
+    The connection the login ran on stays with the session (ValidateLogin
+    pinned the user's identity to it); call session.close() on logout.
+    Database errors are raised to the caller.
+    """
+    lease = get_connection()
+    try:
+        row = fetch_one(LoginRow, "EXEC ValidateLogin ?, ?", username, password, conn=lease)
+    except driver.OperationalError:
+        lease.discard()
+        raise
     except Exception as e:
-        messagebox.showerror("Login Error", str(e))
-        return None
\ No newline at end of file
+        # rejected before the context was set - the connection is clean
+        lease.close()
+        if isinstance(e, driver.Error) and _is_invalid_login(e):
+            return None
+        raise
+
+    if not row:
+        lease.close()
+        return None
+
+    metrics.register_user(row.Username, row.RoleName)
+
+    session = Session(row.Username, row.RoleName, row.ClearanceLevel, lease)
+    register_session(session)
+    return session
@@ -0,0 +1,14 @@
+/* ============================================================
+   Removes everything load_bench_data.sql inserted.
+   ============================================================ */
+USE SRMS_DB;
+SET NOCOUNT ON;
+GO
+
+DELETE FROM dbo.RoleRequests WHERE Reason = 'bench';
+DELETE FROM dbo.Users WHERE Username LIKE 'bench%@nu.edu';
+DELETE FROM dbo.Attendance WHERE RecordedBy = 'bench';
+DELETE FROM dbo.Grades WHERE EnteredBy = 'bench';
+DELETE FROM dbo.Student WHERE Email LIKE 'bench%@nu.edu';
+DELETE FROM dbo.Course WHERE CourseID BETWEEN 9001 AND 9004;
+GO
@@ -0,0 +1,17 @@
+/* ============================================================
+   Removes everything a generate_data.py script inserted.
+   ============================================================ */
+USE SRMS_DB;
+SET NOCOUNT ON;
+GO
+
+DELETE FROM dbo.RoleRequests WHERE Reason = 'generated';
+DELETE a FROM dbo.Attendance a JOIN dbo.Student s ON s.SurrogateID = a.StudentRefID WHERE s.Email LIKE 'gen%@nu.edu';
+DELETE g FROM dbo.Grades g JOIN dbo.Student s ON s.SurrogateID = g.StudentRefID WHERE s.Email LIKE 'gen%@nu.edu';
+DELETE FROM dbo.Student WHERE Email LIKE 'gen%@nu.edu';
+DELETE FROM dbo.Users WHERE Username LIKE 'gen%';
+DELETE FROM dbo.Instructor WHERE InstructorID > 20000;
+DELETE FROM dbo.Attendance WHERE CourseID > 20000;
+DELETE FROM dbo.Grades WHERE CourseID > 20000;
+DELETE FROM dbo.Course WHERE CourseID > 20000;
+GO
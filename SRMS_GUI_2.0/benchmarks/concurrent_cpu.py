@@ -0,0 +1,228 @@
+"""
+Calls the identity-checked procedures from several users at once and
+reports the CPU each procedure costs per call, so changes to the
+permission checks can be compared before and after:
+
+    python -m benchmarks.concurrent_cpu --out before.json        # old schema
+    python -m benchmarks.concurrent_cpu --out after.json --compare before.json
+
+With --backend sqlserver, per-procedure CPU is the worker time recorded in
+sys.dm_exec_procedure_stats (needs VIEW SERVER STATE) and the data of a
+generate_data.py script must already be loaded. With --backend memory
+(the default) only the process CPU of the whole run is available.
+
+--no-sessions runs every call on a pooled connection instead of the
+user's login session, i.e. identity comes from dbo.Users, not the
+session context.
+
+--no-key-session turns off key-session mode (db.connection.KEY_SESSION),
+so every call opens and closes SRMS_AES_Key itself. To measure what the
+per-call OPEN/CLOSE costs:
+
+    python -m benchmarks.concurrent_cpu --backend sqlserver --no-key-session --out per_call.json
+    python -m benchmarks.concurrent_cpu --backend sqlserver --out key_session.json --compare per_call.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime
+
+from benchmarks.generate_data import student_email, PASSWORD
+
+STUDENTS = 10000
+THREADS = 8
+CALLS = 200   # per thread
+
+PROC_STATS_SQL = """
+SELECT OBJECT_NAME(object_id, database_id) AS ProcName,
+       execution_count, total_worker_time, total_logical_reads
+FROM sys.dm_exec_procedure_stats
+WHERE database_id = DB_ID()
+"""
+
+
+def _workload(students):
+    """(username, [calls]) for each kind of user; a call returns its row count."""
+    from services.profile_service import iter_profiles
+    from services.course_service import iter_public_courses
+    from services.grade_service import iter_grades
+    from services.attendance_service import fetch_attendance_page
+
+    def count(rows):
+        return sum(1 for _ in rows)
+
+    def student_calls(user):
+        return [
+            lambda: count(iter_profiles(user)),
+            lambda: len(fetch_attendance_page(user)),
+            lambda: count(iter_public_courses(user)),
+        ]
+
+    def instructor_calls(user, rng):
+        return [
+            lambda: count(iter_grades(user, student_email(rng.randint(1, students)))),
+            lambda: len(fetch_attendance_page(user)),
+            lambda: count(iter_public_courses(user)),
+        ]
+
+    def make(index):
+        rng = random.Random(index)
+        if index % 2:
+            user = student_email(1 + index * 7919 % students)
+            return user, student_calls(user)
+        user = f"geninst{1 + index // 2 % max(2, students // 50)}"
+        return user, instructor_calls(user, rng)
+
+    return make
+
+
+def _proc_stats():
+    from db.connection import get_connection
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(PROC_STATS_SQL)
+        return {row[0]: row[1:] for row in cursor.fetchall() if row[0]}
+
+
+def _cpu_per_procedure(before, after):
+    result = {}
+    for name, (calls, worker_us, reads) in after.items():
+        calls0, worker0, reads0 = before.get(name, (0, 0, 0))
+        calls -= calls0
+        if calls <= 0:
+            continue
+        result[name] = {
+            "calls": calls,
+            "cpu_us_per_call": round((worker_us - worker0) / calls, 1),
+            "logical_reads_per_call": round((reads - reads0) / calls, 1),
+        }
+    return result
+
+
+def run(threads, calls, students, sessions, backend, key_session=True):
+    from auth.login import validate_login
+    from db import connection, metrics
+
+    # only connections opened from here on are affected
+    connection._pool.close_all()
+    connection.KEY_SESSION = key_session
+    # every session keeps one connection; leave room for the rest
+    connection._pool.max_size = max(connection._pool.max_size, threads + 2)
+
+    make = _workload(students)
+    workers = [make(i) for i in range(threads)]
+    logins = [validate_login(user, PASSWORD) if sessions else None for user, _ in workers]
+    errors = []
+    start = threading.Barrier(threads + 1)
+
+    def work(work_calls):
+        start.wait()
+        try:
+            for i in range(calls):
+                work_calls[i % len(work_calls)]()
+        except Exception as e:
+            errors.append(e)
+
+    pool = [threading.Thread(target=work, args=(c,)) for _, c in workers]
+    for t in pool:
+        t.start()
+
+    server_before = _proc_stats() if backend == "sqlserver" else None
+    metrics.reset()
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    start.wait()
+    for t in pool:
+        t.join()
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    for session in logins:
+        if session:
+            session.close()
+    if errors:
+        raise errors[0]
+
+    total = threads * calls
+    result = {
+        "threads": threads,
+        "calls": total,
+        "sessions": sessions,
+        "key_session": key_session,
+        "wall_seconds": round(wall, 3),
+        "calls_per_second": round(total / wall, 1),
+        "process_cpu_us_per_call": round(cpu * 1e6 / total, 1),
+        "procedures": {
+            r["procedure"]: {k: r[k] for k in ("calls", "p50_ms", "p95_ms", "p99_ms")}
+            for r in metrics.snapshot()
+        },
+    }
+    if server_before is not None:
+        for name, cpu_stats in _cpu_per_procedure(server_before, _proc_stats()).items():
+            result["procedures"].setdefault(name, {}).update(cpu_stats)
+    return result
+
+
+def compare(before, after):
+    print(f"{'procedure':<24}{'before':>12}{'after':>12}{'change':>9}")
+    key = "cpu_us_per_call" if any(
+        "cpu_us_per_call" in p for p in after["procedures"].values()
+    ) else "p50_ms"
+    for name, stats in sorted(after["procedures"].items()):
+        old = before["procedures"].get(name, {}).get(key)
+        new = stats.get(key)
+        if old is None or new is None:
+            continue
+        change = f"{(new - old) / old:+.0%}" if old else "-"
+        print(f"{name:<24}{old:>12}{new:>12}{change:>9}")
+    print(f"({key}; throughput {before['calls_per_second']} -> {after['calls_per_second']} calls/s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SRMS concurrent procedure CPU benchmark")
+    parser.add_argument("--threads", type=int, default=THREADS)
+    parser.add_argument("--calls", type=int, default=CALLS, help="calls per thread")
+    parser.add_argument("--students", type=int, default=STUDENTS,
+                        help="size of the generated data set")
+    parser.add_argument("--backend", choices=("memory", "sqlserver"), default="memory")
+    parser.add_argument("--no-sessions", dest="sessions", action="store_false")
+    parser.add_argument("--no-key-session", dest="key_session", action="store_false",
+                        help="open/close the AES key in every procedure call")
+    parser.add_argument("--compare", metavar="REPORT", help="earlier report to compare with")
+    parser.add_argument("--out", default="concurrent_cpu.json")
+    args = parser.parse_args(argv)
+
+    # must be set before db.connection is imported
+    os.environ["SRMS_BACKEND"] = args.backend
+
+    if args.backend == "memory":
+        from benchmarks.run_benchmarks import use_memory_database
+        use_memory_database(args.students)
+
+    report = {
+        "suite": "srms-concurrent-cpu",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "backend": args.backend,
+        "students": args.students,
+    }
+    report.update(run(args.threads, args.calls, args.students, args.sessions,
+                      args.backend, args.key_session))
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"{report['calls']} calls in {report['wall_seconds']} s "
+          f"({report['calls_per_second']} calls/s, {report['process_cpu_us_per_call']} us client CPU per call)")
+    print(f"Report written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+/* ============================================================
+   Benchmark: StudentID decryption in ViewAttendance / ViewGrades
+   - BEFORE: dbo.ViewAttendance_Before / dbo.ViewGrades_Before, the
+             shipped procedures with the correlated DecryptByKey
+             subquery per row put back (created here, dropped at the end)
+   - AFTER : dbo.ViewAttendance / dbo.ViewGrades as in SRMS_DBS.sql,
+             each distinct student decrypted once
+   Run load_bench_data.sql first and cleanup_bench_data.sql after.
+   ============================================================ */
+USE SRMS_DB;
+SET NOCOUNT ON;
+GO
+
+---------------------------------------------------------------
+-- 1. The definitions before the change (everything else as shipped)
+---------------------------------------------------------------
+CREATE OR ALTER PROCEDURE dbo.ViewAttendance_Before @Username NVARCHAR(50)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT, @me INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel, @me = StudentRefID FROM dbo.UserIdentity(@Username);
+    IF @clr < 3 AND @role <> 'Student'
+        THROW 50016, 'MLS NRU: clearance < Secret.', 1;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    IF @role IN ('Admin','Instructor','TA')
+    BEGIN
+        SELECT
+            a.AttendanceID,
+            (SELECT CONVERT(NVARCHAR(20), DecryptByKey(s.StudentID_Enc)) FROM dbo.Student s WHERE s.SurrogateID = a.StudentRefID) AS StudentID,
+            a.CourseID, a.[Status], a.DateRecorded, a.RecordedBy
+        FROM dbo.Attendance a;
+    END
+    ELSE IF @role = 'Student'
+    BEGIN
+        IF @me IS NULL THROW 50017, 'Student record not found.', 1;
+
+        SELECT
+            AttendanceID,
+            (SELECT CONVERT(NVARCHAR(20), DecryptByKey(s.StudentID_Enc)) FROM dbo.Student s WHERE s.SurrogateID = a.StudentRefID) AS StudentID,
+            CourseID, [Status], DateRecorded
+        FROM dbo.Attendance a
+        WHERE a.StudentRefID = @me;
+    END
+    ELSE
+        THROW 50018, 'Access denied.', 1;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
+CREATE OR ALTER PROCEDURE dbo.ViewGrades_Before
+    @Username NVARCHAR(50),
+    @StudentEmail NVARCHAR(100)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @role NVARCHAR(20), @clr INT;
+    SELECT @role = RoleName, @clr = ClearanceLevel FROM dbo.UserIdentity(@Username);
+    IF @role NOT IN ('Admin','Instructor') THROW 50011, 'Only Admin/Instructor can view grades.', 1;
+    IF @clr < 3 THROW 50012, 'MLS NRU: clearance < Secret.', 1;
+
+    DECLARE @StudentRefID INT = (SELECT SurrogateID FROM dbo.Student WHERE Email = @StudentEmail);
+    IF @StudentRefID IS NULL THROW 50025, 'Student not found.', 1;
+
+    DECLARE @opened BIT;
+    EXEC dbo.OpenKeyIfClosed @opened OUTPUT;
+
+    SELECT
+        g.GradeID,
+        (SELECT CONVERT(NVARCHAR(20), DecryptByKey(s2.StudentID_Enc)) FROM dbo.Student s2 WHERE s2.SurrogateID = g.StudentRefID) AS StudentID,
+        g.CourseID,
+        CAST(CONVERT(NVARCHAR(MAX), DecryptByKey(g.GradeValueEnc)) AS DECIMAL(5,2)) AS GradeValue,
+        g.DateEntered, g.EnteredBy
+    FROM dbo.Grades g
+    WHERE g.StudentRefID = @StudentRefID;
+
+    IF @opened = 1 CLOSE SYMMETRIC KEY SRMS_AES_Key;
+END
+GO
+
+---------------------------------------------------------------
+-- 2. Measure server CPU / elapsed time of each procedure. Results go
+--    into temp tables, so network/client time is not included.
+---------------------------------------------------------------
+CREATE TABLE #Results (Phase NVARCHAR(10), ProcName NVARCHAR(60), CpuMs INT, ElapsedMs INT);
+CREATE TABLE #att (AttendanceID INT, StudentID NVARCHAR(20), CourseID INT, [Status] BIT,
+                   DateRecorded DATETIME, RecordedBy NVARCHAR(50));
+CREATE TABLE #myatt (AttendanceID INT, StudentID NVARCHAR(20), CourseID INT, [Status] BIT, DateRecorded DATETIME);
+CREATE TABLE #grades (GradeID INT, StudentID NVARCHAR(20), CourseID INT, GradeValue DECIMAL(5,2),
+                      DateEntered DATETIME, EnteredBy NVARCHAR(50));
+GO
+
+-- @Suffix '_Before' runs the old procedures, '' the shipped ones
+CREATE PROCEDURE #MeasureDecrypt @Phase NVARCHAR(10), @Suffix NVARCHAR(10)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @attendance SYSNAME = N'dbo.ViewAttendance' + @Suffix;
+    DECLARE @grades SYSNAME = N'dbo.ViewGrades' + @Suffix;
+    DECLARE @cpu INT, @t DATETIME2, @i INT, @email NVARCHAR(100);
+
+    -- ViewAttendance, staff branch: every attendance row
+    TRUNCATE TABLE #att;
+    SELECT @cpu = cpu_time FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+    SET @t = SYSDATETIME();
+    INSERT INTO #att EXEC @attendance N'admin1';
+    INSERT INTO #Results SELECT @Phase, 'ViewAttendance (staff)', cpu_time - @cpu, DATEDIFF(MILLISECOND, @t, SYSDATETIME())
+    FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+
+    -- ViewAttendance, student branch: the 100 bench students with a login
+    TRUNCATE TABLE #myatt;
+    SELECT @cpu = cpu_time FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+    SET @t = SYSDATETIME();
+    SET @i = 1;
+    WHILE @i <= 100
+    BEGIN
+        SET @email = CONCAT(N'bench', @i, N'@nu.edu');
+        INSERT INTO #myatt EXEC @attendance @email;
+        SET @i += 1;
+    END
+    INSERT INTO #Results SELECT @Phase, 'ViewAttendance (student) x100', cpu_time - @cpu, DATEDIFF(MILLISECOND, @t, SYSDATETIME())
+    FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+
+    -- ViewGrades for 1,000 students
+    TRUNCATE TABLE #grades;
+    SELECT @cpu = cpu_time FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+    SET @t = SYSDATETIME();
+    SET @i = 1;
+    WHILE @i <= 1000
+    BEGIN
+        SET @email = CONCAT(N'bench', @i, N'@nu.edu');
+        INSERT INTO #grades EXEC @grades N'admin1', @email;
+        SET @i += 1;
+    END
+    INSERT INTO #Results SELECT @Phase, 'ViewGrades x1000', cpu_time - @cpu, DATEDIFF(MILLISECOND, @t, SYSDATETIME())
+    FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+END
+GO
+
+EXEC #MeasureDecrypt 'warmup', '';
+EXEC #MeasureDecrypt 'BEFORE', '_Before';
+EXEC #MeasureDecrypt 'AFTER', '';
+GO
+
+---------------------------------------------------------------
+-- 3. Report, then remove the benchmark procedures
+---------------------------------------------------------------
+SELECT b.ProcName,
+       b.CpuMs AS CpuBefore, a.CpuMs AS CpuAfter,
+       b.ElapsedMs AS ElapsedBefore, a.ElapsedMs AS ElapsedAfter,
+       CAST(100.0 * (b.CpuMs - a.CpuMs) / NULLIF(b.CpuMs, 0) AS DECIMAL(5,1)) AS PctCpuSaved
+FROM #Results b
+JOIN #Results a ON a.ProcName = b.ProcName AND a.Phase = 'AFTER'
+WHERE b.Phase = 'BEFORE'
+ORDER BY b.ProcName;
+
+DROP TABLE #Results, #att, #myatt, #grades;
+DROP PROCEDURE #MeasureDecrypt;
+DROP PROCEDURE dbo.ViewAttendance_Before;
+DROP PROCEDURE dbo.ViewGrades_Before;
+GO
@@ -0,0 +1,291 @@
+"""
+Synthetic SRMS data at campus scale.
+
+    python -m benchmarks.generate_data --students 10000 --sql gen_10k.sql
+
+generate() builds a deterministic data set (same seed, same rows) with
+students, their logins, instructors, TAs, courses, grades, attendance and
+role requests. write_sql() turns it into a T-SQL script that encrypts
+every column the way SRMS_DBS.sql does; load_memory() puts it straight
+into a db.memory_backend database.
+
+Everything is tagged so cleanup_generated_data.sql can remove it:
+gen*@nu.edu students, gen* users, courses and instructors 20001+,
+Reason 'generated'.
+"""
+import argparse
+import random
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+from typing import NamedTuple
+
+COURSE_BASE = 20000
+INSTRUCTOR_BASE = 20000
+DEPARTMENTS = (
+    "Computer Science", "Information Systems", "Software Engineering",
+    "Data Science", "Cyber Security", "Mathematics", "Physics",
+    "Electrical Engineering", "Mechanical Engineering", "Civil Engineering",
+    "Business", "Economics", "Accounting", "Marketing", "Law",
+    "Medicine", "Pharmacy", "Architecture", "Media", "Languages",
+)
+FIRST_NAMES = ("Ahmed", "Mohamed", "Sara", "Mona", "Omar", "Nour", "Youssef",
+               "Hana", "Ali", "Laila", "Karim", "Salma", "Tarek", "Dina", "Ziad")
+LAST_NAMES = ("Hassan", "Ali", "Mahmoud", "Ibrahim", "Saleh", "Fathy", "Nabil",
+              "Adel", "Kamal", "Samir", "Farouk", "Gamal", "Sabry", "Zaki")
+SEMESTER_START = datetime(2025, 2, 1, 9, 0)
+SEMESTER_WEEKS = 15
+PASSWORD = "genpass"
+
+
+class Dataset(NamedTuple):
+    users: list         # (Username, Password, RoleName, ClearanceLevel)
+    students: list      # (StudentID, FullName, Email, Phone, DOB, Department, ClearanceLevel)
+    instructors: list   # (InstructorID, FullName, Email, ClearanceLevel)
+    courses: list       # (CourseID, CourseName, Description, PublicInfo)
+    grades: list        # (StudentEmail, CourseID, GradeValue, DateEntered, EnteredBy)
+    attendance: list    # (StudentEmail, CourseID, Status, DateRecorded, RecordedBy), oldest first
+    role_requests: list # (Username, CurrentRole, RequestedRole, Reason, Status,
+                        #  DateSubmitted, DateResolved, ResolvedBy)
+
+    def counts(self):
+        return {name: len(rows) for name, rows in self._asdict().items()}
+
+
+def student_email(i):
+    return f"gen{i}@nu.edu"
+
+
+def generate(students=1000, grades_per_student=4, attendance_per_student=6, seed=2025):
+    """
+    students drives every other volume: one instructor per 50 students,
+    one TA per 100, one course per 40 (at least 10), 5% of students with
+    a resolved role request and 1% with a pending one.
+    """
+    rng = random.Random(seed)
+
+    instructor_count = max(2, students // 50)
+    ta_count = max(2, students // 100)
+    course_count = max(10, students // 40)
+
+    users = [("genadmin", PASSWORD, "Admin", 4)]
+    instructors = []
+    for i in range(1, instructor_count + 1):
+        users.append((f"geninst{i}", PASSWORD, "Instructor", 3))
+        instructors.append((INSTRUCTOR_BASE + i, f"Instructor {i}", f"geninst{i}", 3))
+    for i in range(1, ta_count + 1):
+        users.append((f"genta{i}", PASSWORD, "TA", 3))
+
+    courses = [
+        (COURSE_BASE + i, f"Course {i}", f"Generated course {i}",
+         "Open to all" if i % 3 else None)
+        for i in range(1, course_count + 1)
+    ]
+
+    student_rows = []
+    grades = []
+    attendance = []
+    for i in range(1, students + 1):
+        email = student_email(i)
+        student_rows.append((
+            str(100000 + i),
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            email,
+            f"010{rng.randrange(10**8):08d}",
+            date(1998, 1, 1) + timedelta(days=rng.randrange(6 * 365)),
+            DEPARTMENTS[i % len(DEPARTMENTS)],
+            2,
+        ))
+        users.append((email, PASSWORD, "Student", 2))
+
+        enrolled = rng.sample(courses, min(grades_per_student, len(courses)))
+        for course in enrolled:
+            grade = Decimal(f"{min(100.0, max(0.0, rng.gauss(75, 12))):.2f}")
+            entered = SEMESTER_START + timedelta(weeks=SEMESTER_WEEKS, days=rng.randrange(14))
+            grades.append((email, course[0], grade, entered, f"geninst{rng.randint(1, instructor_count)}"))
+
+        for _ in range(attendance_per_student):
+            course = rng.choice(enrolled)
+            session = rng.randrange(SEMESTER_WEEKS * 2)  # two sessions a week
+            recorded = SEMESTER_START + timedelta(
+                days=session // 2 * 7 + session % 2 * 3,
+                hours=course[0] % 8,
+                seconds=rng.randrange(600)
+            )
+            attendance.append((email, course[0], rng.random() > 0.12, recorded, f"genta{rng.randint(1, ta_count)}"))
+
+    attendance.sort(key=lambda a: a[3])
+
+    role_requests = []
+    start = SEMESTER_START - timedelta(days=30)
+    resolved = students // 20
+    pending = max(5, students // 100)
+    for n in range(resolved + pending):
+        email = student_email(rng.randint(1, students))
+        submitted = start + timedelta(minutes=n * 7)
+        if n < resolved:
+            role_requests.append((email, "Student", "TA", "generated", "Denied",
+                                  submitted, submitted + timedelta(hours=1), "genadmin"))
+        else:
+            role_requests.append((email, "Student", "TA", "generated", "Pending",
+                                  submitted, None, None))
+
+    return Dataset(users, student_rows, instructors, courses, grades, attendance, role_requests)
+
+
+# =====================================================
+# In-memory backend
+# =====================================================
+def load_memory(database, dataset):
+    """Loads dataset into a db.memory_backend.MemoryDatabase (no undo log)."""
+    from db.memory_backend import AUTOCOMMIT as tx
+
+    with database.lock:
+        for row in dataset.users:
+            database.insert_user(tx, *row)
+        for row in dataset.instructors:
+            database.insert_instructor(tx, *row)
+        for row in dataset.courses:
+            database.insert_course(tx, *row)
+        for row in dataset.students:
+            database.insert_student(tx, *row)
+
+        for email, course_id, value, when, entered_by in dataset.grades:
+            database.insert_grade(tx, database.student_ref(email), course_id, value, entered_by, when)
+        for email, course_id, status, when, recorded_by in dataset.attendance:
+            database.insert_attendance(tx, database.student_ref(email), course_id, status, when, recorded_by)
+
+        for username, current, requested, reason, status, submitted, resolved, by in dataset.role_requests:
+            rid = database.insert_role_request(tx, username, current, requested, reason, submitted)
+            if status != "Pending":
+                database.update_row(tx, database.role_requests[rid],
+                                    Status=status, DateResolved=resolved, ResolvedBy=by)
+
+
+# =====================================================
+# T-SQL script
+# =====================================================
+SQL_BATCH = 1000  # max rows in one INSERT ... VALUES
+
+
+def _sql(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (int, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"'{value:%Y-%m-%dT%H:%M:%S}'"
+    if isinstance(value, date):
+        return f"'{value:%Y-%m-%d}'"
+    return "N'" + str(value).replace("'", "''") + "'"
+
+
+def _encrypt(sql_value, as_type="VARBINARY(MAX)"):
+    return f"EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT({as_type}, {sql_value}))"
+
+
+def _batches(rows):
+    for i in range(0, len(rows), SQL_BATCH):
+        yield rows[i:i + SQL_BATCH]
+
+
+def _write_inserts(f, header, rows, render):
+    for batch in _batches(rows):
+        f.write(header + "\nVALUES\n")
+        f.write(",\n".join("(" + render(r) + ")" for r in batch))
+        f.write(";\n")
+    f.write("GO\n\n")
+
+
+def write_sql(dataset, path):
+    """
+    Writes a script that loads dataset into SRMS_DB (after SRMS_DBS.sql).
+    Encryption matches the seed data and the procedures: passwords as
+    NVARCHAR, StudentID/phone as VARCHAR bytes, grades as the NVARCHAR
+    text of a DECIMAL(5,2).
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(
+            "/* Generated by benchmarks/generate_data.py\n"
+            + "".join(f"   {name}: {count:,}\n" for name, count in dataset.counts().items())
+            + "   Remove with cleanup_generated_data.sql */\n"
+            "USE SRMS_DB;\nSET NOCOUNT ON;\nGO\n\n"
+            "OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;\nGO\n\n"
+        )
+
+        _write_inserts(
+            f, "INSERT INTO dbo.Users (Username, PasswordEnc, RoleName, ClearanceLevel)",
+            dataset.users,
+            lambda u: f"{_sql(u[0])}, EncryptByKey(Key_GUID('SRMS_AES_Key'), {_sql(u[1])}), '{u[2]}', {u[3]}"
+        )
+        _write_inserts(
+            f, "INSERT INTO dbo.Instructor (InstructorID, FullName, Email, ClearanceLevel)",
+            dataset.instructors,
+            lambda i: ", ".join(_sql(v) for v in i)
+        )
+        _write_inserts(
+            f, "INSERT INTO dbo.Course (CourseID, CourseName, [Description], PublicInfo)",
+            dataset.courses,
+            lambda c: ", ".join(_sql(v) for v in c)
+        )
+        _write_inserts(
+            f, "INSERT INTO dbo.Student\n(StudentID_Enc, FullName, Email, PhoneEnc, DOB, Department, ClearanceLevel)",
+            dataset.students,
+            lambda s: ", ".join((
+                _encrypt("'" + s[0] + "'", "VARBINARY(20)"), _sql(s[1]), _sql(s[2]),
+                _encrypt("'" + s[3] + "'", "VARBINARY(20)"), _sql(s[4]), _sql(s[5]), _sql(s[6])
+            ))
+        )
+
+        # Grades / attendance reference Student.SurrogateID (an IDENTITY): join on the email
+        for batch in _batches(dataset.grades):
+            f.write(
+                "INSERT INTO dbo.Grades (StudentRefID, CourseID, GradeValueEnc, DateEntered, EnteredBy)\n"
+                "SELECT s.SurrogateID, v.CourseID, "
+                + _encrypt("CAST(CAST(v.GradeValue AS DECIMAL(5,2)) AS NVARCHAR(20))")
+                + ", v.DateEntered, v.EnteredBy\nFROM (VALUES\n"
+                + ",\n".join("(" + ", ".join(_sql(x) for x in g) + ")" for g in batch)
+                + "\n) v(Email, CourseID, GradeValue, DateEntered, EnteredBy)\n"
+                "JOIN dbo.Student s ON s.Email = v.Email;\n"
+            )
+        f.write("GO\n\n")
+
+        for batch in _batches(dataset.attendance):
+            f.write(
+                "INSERT INTO dbo.Attendance (StudentRefID, CourseID, [Status], DateRecorded, RecordedBy)\n"
+                "SELECT s.SurrogateID, v.CourseID, v.[Status], v.DateRecorded, v.RecordedBy\nFROM (VALUES\n"
+                + ",\n".join("(" + ", ".join(_sql(x) for x in a) + ")" for a in batch)
+                + "\n) v(Email, CourseID, [Status], DateRecorded, RecordedBy)\n"
+                "JOIN dbo.Student s ON s.Email = v.Email;\n"
+            )
+        f.write("GO\n\n")
+
+        _write_inserts(
+            f, "INSERT INTO dbo.RoleRequests\n"
+               "(Username, CurrentRole, RequestedRole, Reason, Status, DateSubmitted, DateResolved, ResolvedBy)",
+            dataset.role_requests,
+            lambda r: ", ".join(_sql(v) for v in r)
+        )
+
+        f.write("CLOSE SYMMETRIC KEY SRMS_AES_Key;\nGO\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic SRMS data")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--grades-per-student", type=int, default=4)
+    parser.add_argument("--attendance-per-student", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--sql", required=True, help="output .sql file")
+    args = parser.parse_args(argv)
+
+    dataset = generate(args.students, args.grades_per_student,
+                       args.attendance_per_student, args.seed)
+    write_sql(dataset, args.sql)
+    for name, count in dataset.counts().items():
+        print(f"{name:>14}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+/* ============================================================
+   Benchmark: logical reads per procedure with and without the
+   supporting indexes (SRMS_DBS.sql TASK 2b / TASK 9).
+   Run load_bench_data.sql first and cleanup_bench_data.sql after.
+   The indexes are dropped for the BEFORE pass and recreated for
+   the AFTER pass, so the database ends in its normal state.
+   AvgGradeByDepartment is not measured: it reads dbo.DeptGradeAgg,
+   which these indexes don't touch.
+   ============================================================ */
+USE SRMS_DB;
+SET NOCOUNT ON;
+GO
+
+CREATE TABLE #Reads (Phase NVARCHAR(10), ProcName NVARCHAR(60), LogicalReads BIGINT);
+GO
+
+-- Runs each procedure once and records the logical reads it caused
+CREATE PROCEDURE #MeasureReads @Phase NVARCHAR(10)
+AS
+BEGIN
+    SET NOCOUNT ON;
+    DECLARE @r BIGINT;
+
+    CREATE TABLE #att (AttendanceID INT, StudentID NVARCHAR(20), CourseID INT, [Status] BIT, DateRecorded DATETIME);
+    CREATE TABLE #req (RequestID INT, Username NVARCHAR(50), CurrentRole NVARCHAR(20), RequestedRole NVARCHAR(20),
+                       Reason NVARCHAR(400), DateSubmitted DATETIME, Status NVARCHAR(20));
+
+    -- EnterOrUpdateGrade (update path), rolled back
+    SELECT @r = logical_reads FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+    BEGIN TRAN;
+    EXEC EnterOrUpdateGrade 'inst1', 'bench5000@nu.edu', 9001, 77;
+    ROLLBACK;
+    INSERT INTO #Reads SELECT @Phase, 'EnterOrUpdateGrade', logical_reads - @r
+    FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+
+    -- ViewAttendance, student branch
+    SELECT @r = logical_reads FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+    INSERT INTO #att EXEC ViewAttendance 'bench50@nu.edu';
+    INSERT INTO #Reads SELECT @Phase, 'ViewAttendance (student)', logical_reads - @r
+    FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+
+    -- ListPendingRoleRequests
+    SELECT @r = logical_reads FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+    INSERT INTO #req EXEC ListPendingRoleRequests 'admin1';
+    INSERT INTO #Reads SELECT @Phase, 'ListPendingRoleRequests', logical_reads - @r
+    FROM sys.dm_exec_requests WHERE session_id = @@SPID;
+END
+GO
+
+---------------------------------------------------------------
+-- BEFORE: primary keys + Student.Email only
+---------------------------------------------------------------
+DROP INDEX IF EXISTS UX_Grades_Student_Course ON dbo.Grades;
+DROP INDEX IF EXISTS IX_Attendance_Student_Date ON dbo.Attendance;
+DROP INDEX IF EXISTS IX_RoleRequests_Pending ON dbo.RoleRequests;
+GO
+
+EXEC #MeasureReads 'warmup';
+EXEC #MeasureReads 'BEFORE';
+GO
+
+---------------------------------------------------------------
+-- AFTER: supporting indexes
+---------------------------------------------------------------
+CREATE UNIQUE INDEX UX_Grades_Student_Course
+    ON dbo.Grades (StudentRefID, CourseID);
+
+CREATE INDEX IX_Attendance_Student_Date
+    ON dbo.Attendance (StudentRefID, DateRecorded)
+    INCLUDE (CourseID, [Status]);
+
+CREATE INDEX IX_RoleRequests_Pending
+    ON dbo.RoleRequests (RequestID)
+    INCLUDE (Username, CurrentRole, RequestedRole, Reason, DateSubmitted)
+    WHERE Status = 'Pending';
+GO
+
+EXEC #MeasureReads 'AFTER';
+GO
+
+---------------------------------------------------------------
+-- Report
+---------------------------------------------------------------
+SELECT b.ProcName,
+       b.LogicalReads AS ReadsBefore,
+       a.LogicalReads AS ReadsAfter,
+       CAST(100.0 * (b.LogicalReads - a.LogicalReads) / NULLIF(b.LogicalReads, 0) AS DECIMAL(5,1)) AS PctSaved
+FROM #Reads b
+JOIN #Reads a ON a.ProcName = b.ProcName AND a.Phase = 'AFTER'
+WHERE b.Phase = 'BEFORE'
+ORDER BY b.ProcName;
+
+DROP TABLE #Reads;
+DROP PROCEDURE #MeasureReads;
+GO
@@ -0,0 +1,101 @@
+/* ============================================================
+   Benchmark data set
+   10,000 students, 1,000,000 attendance rows, 40,000 grades,
+   20,000 resolved + 200 pending role requests.
+   Run against SRMS_DB after SRMS_DBS.sql. Every row is tagged
+   (bench*@nu.edu, RecordedBy/EnteredBy 'bench', courses 9001-9004)
+   so cleanup_bench_data.sql can remove it again.
+   ============================================================ */
+USE SRMS_DB;
+SET NOCOUNT ON;
+GO
+
+---------------------------------------------------------------
+-- Courses, students, attendance, grades
+---------------------------------------------------------------
+IF NOT EXISTS (SELECT 1 FROM dbo.Course WHERE CourseID = 9001)
+    INSERT INTO dbo.Course (CourseID, CourseName, [Description], PublicInfo) VALUES
+        (9001, 'Bench Course 1', NULL, NULL),
+        (9002, 'Bench Course 2', NULL, NULL),
+        (9003, 'Bench Course 3', NULL, NULL),
+        (9004, 'Bench Course 4', NULL, NULL);
+
+OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+
+WITH n AS (
+    SELECT TOP (10000) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS i
+    FROM sys.all_objects a CROSS JOIN sys.all_objects b
+)
+INSERT INTO dbo.Student
+(StudentID_Enc, FullName, Email, PhoneEnc, DOB, Department, ClearanceLevel)
+SELECT
+    EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT(VARBINARY(20), CAST(100000 + i AS VARCHAR(20)))),
+    CONCAT('Bench Student ', i),
+    CONCAT('bench', i, '@nu.edu'),
+    EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT(VARBINARY(20), '01000000000')),
+    '2000-01-01',
+    CONCAT('Bench Dept ', i % 20),
+    2
+FROM n;
+
+DECLARE @first INT = (SELECT MIN(SurrogateID) FROM dbo.Student WHERE Email LIKE 'bench%@nu.edu');
+
+-- 100 attendance rows per student
+WITH n AS (
+    SELECT TOP (1000000) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 AS i
+    FROM sys.all_objects a CROSS JOIN sys.all_objects b CROSS JOIN sys.all_objects c
+)
+INSERT INTO dbo.Attendance (StudentRefID, CourseID, [Status], DateRecorded, RecordedBy)
+SELECT
+    @first + i % 10000,
+    9001 + (i / 10000) % 4,
+    CASE WHEN i % 7 = 0 THEN 0 ELSE 1 END,
+    DATEADD(DAY, -((i / 10000) % 120), '2025-06-01'),
+    'bench'
+FROM n;
+
+-- 4 grades per student
+WITH n AS (
+    SELECT TOP (40000) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) - 1 AS i
+    FROM sys.all_objects a CROSS JOIN sys.all_objects b
+)
+INSERT INTO dbo.Grades (StudentRefID, CourseID, GradeValueEnc, DateEntered, EnteredBy)
+SELECT
+    @first + i / 4,
+    9001 + i % 4,
+    EncryptByKey(Key_GUID('SRMS_AES_Key'), CONVERT(VARBINARY(MAX), CAST(CAST(50 + i % 50 AS DECIMAL(5,2)) AS NVARCHAR(20)))),
+    GETDATE(),
+    'bench'
+FROM n;
+
+CLOSE SYMMETRIC KEY SRMS_AES_Key;
+GO
+
+---------------------------------------------------------------
+-- Logins for the first 100 bench students + role requests
+---------------------------------------------------------------
+OPEN SYMMETRIC KEY SRMS_AES_Key DECRYPTION BY CERTIFICATE SRMS_Cert;
+
+INSERT INTO dbo.Users (Username, PasswordEnc, RoleName, ClearanceLevel)
+SELECT Email, EncryptByKey(Key_GUID('SRMS_AES_Key'), N'benchpass'), 'Student', 2
+FROM dbo.Student
+WHERE Email LIKE 'bench%@nu.edu'
+  AND CAST(SUBSTRING(Email, 6, CHARINDEX('@', Email) - 6) AS INT) <= 100;
+
+CLOSE SYMMETRIC KEY SRMS_AES_Key;
+
+WITH n AS (
+    SELECT TOP (20200) ROW_NUMBER() OVER (ORDER BY (SELECT NULL)) AS i
+    FROM sys.all_objects a CROSS JOIN sys.all_objects b
+)
+INSERT INTO dbo.RoleRequests
+    (Username, CurrentRole, RequestedRole, Reason, Status, DateSubmitted, DateResolved, ResolvedBy)
+SELECT
+    CONCAT('bench', 1 + i % 100, '@nu.edu'),
+    'Student', 'TA', 'bench',
+    CASE WHEN i > 20000 THEN 'Pending' ELSE 'Denied' END,
+    DATEADD(MINUTE, i, '2025-01-01'),
+    CASE WHEN i > 20000 THEN NULL ELSE DATEADD(MINUTE, i + 60, '2025-01-01') END,
+    CASE WHEN i > 20000 THEN NULL ELSE 'admin1' END
+FROM n;
+GO
@@ -0,0 +1,257 @@
+"""
+Times every service function / stored procedure at several data volumes
+and writes a JSON report that can be compared across releases.
+
+    python -m benchmarks.run_benchmarks                     # 1k, 10k, 100k, in memory
+    python -m benchmarks.run_benchmarks --scales 1000 --repeat 50 --out bench.json
+
+With --backend memory (the default) each scale is generated and loaded
+into a fresh db.memory_backend database. With --backend sqlserver the
+server configured in db/connection.py is used as-is: load the matching
+generate_data.py script first and pass that single --scales value.
+"""
+import argparse
+import csv
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.generate_data import generate, load_memory, student_email, COURSE_BASE, PASSWORD
+
+SCALES = (1000, 10000, 100000)
+REPEAT = 20
+IMPORT_ROWS = 2000
+ROSTER_SIZE = 40
+BULK_REQUESTS = 500
+
+
+class Case:
+    """One timed call. run() returns the number of rows it produced/sent."""
+
+    def __init__(self, name, procedure, run, repeat=None):
+        self.name = name
+        self.procedure = procedure
+        self.run = run
+        self.repeat = repeat
+
+
+def _percentile(sorted_values, q):
+    # nearest-rank
+    index = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def build_cases(students, tmpdir):
+    from auth.login import validate_login
+    from db.query import fetch_all
+    from models.records import AttendanceRow
+    from services.profile_service import iter_profiles, find_student_by_id
+    from services import course_service
+    from services.course_service import iter_public_courses, public_courses
+    from services.grade_service import save_grade, iter_grades, fetch_gradebook, import_grades_csv
+    from services.attendance_service import (
+        save_attendance, fetch_attendance_page, iter_attendance,
+        fetch_roster, record_attendance_batch
+    )
+    from services.inference_service import department_average, department_report
+    from services.attendance_analytics_service import attendance_summary
+    from services.role_request_service import (
+        submit_role_request, list_requests, deny_request, resolve_requests
+    )
+
+    admin, inst, ta = "genadmin", "geninst1", "genta1"
+    course_service.clear_catalog_cache()  # left over from the previous scale
+    student = student_email(students // 2)
+    course = COURSE_BASE + 1
+
+    grade_csv = os.path.join(tmpdir, "grades.csv")
+    with open(grade_csv, "w", newline="") as f:
+        writer = csv.writer(f)
+        for i in range(IMPORT_ROWS):
+            writer.writerow((student_email(1 + i % students), COURSE_BASE + 1 + i // students, 70 + i % 30))
+
+    roster = [(student_email(i), i % 5 != 0) for i in range(1, ROSTER_SIZE + 1)]
+
+    # a keyset position in the middle of the attendance history
+    middle = fetch_attendance_page(admin, page_size=1000)[-1]
+    deep_after = (middle.DateRecorded, middle.AttendanceID)
+
+    def probe_catalog():
+        course_service._catalog["checked"] = None  # TTL expired, nothing changed
+        return len(public_courses("guest1"))
+
+    def login_and_logout():
+        session = validate_login(student, PASSWORD)
+        session.close()
+        return 1
+
+    def bulk_deny():
+        # whatever is pending (the generated backlog, then what earlier runs left)
+        for i in range(BULK_REQUESTS):
+            submit_role_request(student_email(1 + i % students), "TA", "benchmark")
+        pending = list_requests(admin)
+        return len(resolve_requests(admin, [(r.RequestID, "Deny", r.RequestedRole) for r in pending]))
+
+    def submit_and_deny():
+        submit_role_request(student, "TA", "benchmark")
+        request = list_requests(admin)[-1]
+        deny_request(admin, request.RequestID)
+        return 1
+
+    return [
+        Case("validate_login", "ValidateLogin", login_and_logout),
+        Case("view_profiles_student", "ViewProfilesByRole",
+             lambda: sum(1 for _ in iter_profiles(student))),
+        Case("view_profiles_admin", "ViewProfilesByRole",
+             lambda: sum(1 for _ in iter_profiles(admin)), repeat=3),
+        Case("find_student_by_id", "FindStudentByID",
+             lambda: 1 if find_student_by_id(inst, str(100000 + students // 2)) else 0),
+        Case("view_public_courses", "ViewPublicCourses",
+             lambda: sum(1 for _ in iter_public_courses("guest1"))),
+        Case("public_courses_cached", "(catalog cache)",
+             lambda: len(public_courses("guest1"))),
+        Case("public_courses_probe", "PublicCourseVersion", probe_catalog),
+        Case("save_grade", "EnterOrUpdateGrade",
+             lambda: save_grade(inst, student, course, 88.5) or 1),
+        Case("view_grades", "ViewGrades",
+             lambda: sum(1 for _ in iter_grades(inst, student))),
+        Case("course_gradebook", "CourseGradebook",
+             lambda: len(fetch_gradebook(inst, course))),
+        Case("import_grades_csv", "BulkEnterOrUpdateGrade",
+             lambda: import_grades_csv(inst, grade_csv)["rows"], repeat=3),
+        Case("department_average", "AvgGradeByDepartment",
+             lambda: 1 if department_average(admin, "Computer Science") else 0),
+        Case("department_report", "GradeDistributionByDepartment",
+             lambda: len(department_report(admin)), repeat=3),
+        Case("save_attendance", "RecordAttendance",
+             lambda: save_attendance(ta, student, course, 1) or 1),
+        Case("fetch_roster", "ListStudentRoster",
+             lambda: len(fetch_roster(ta, course)), repeat=3),
+        Case("record_attendance_batch", "RecordAttendanceBatch",
+             lambda: len(record_attendance_batch(ta, course, roster))),
+        Case("view_attendance_student", "ViewAttendance",
+             lambda: len(fetch_all(AttendanceRow, "EXEC ViewAttendance ?", student))),
+        Case("view_attendance_staff", "ViewAttendance",
+             lambda: len(fetch_all(AttendanceRow, "EXEC ViewAttendance ?", admin)), repeat=3),
+        Case("attendance_first_page", "ViewAttendancePage",
+             lambda: len(fetch_attendance_page(admin))),
+        Case("attendance_deep_page", "ViewAttendancePage",
+             lambda: len(fetch_attendance_page(admin, deep_after))),
+        Case("attendance_page_student", "ViewAttendancePage",
+             lambda: len(fetch_attendance_page(student))),
+        Case("export_course_attendance", "ViewAttendancePage",
+             lambda: sum(1 for _ in iter_attendance(admin, course_id=course)), repeat=3),
+        Case("attendance_analytics_course", "AttendanceWeekly",
+             lambda: len(attendance_summary(inst, course))),
+        Case("attendance_analytics_student", "AttendanceWeekly",
+             lambda: len(attendance_summary(student))),
+        Case("list_role_requests", "ListPendingRoleRequests",
+             lambda: len(list_requests(admin))),
+        Case("submit_and_deny_role_request", "SubmitRoleUpgradeRequest+ResolveRoleRequest",
+             submit_and_deny),
+        Case("bulk_deny_role_requests", "SubmitRoleUpgradeRequest x500+BulkResolveRoleRequests",
+             bulk_deny, repeat=3),
+    ]
+
+
+def run_case(case, repeat):
+    times = []
+    rows = 0
+    for _ in range(case.repeat or repeat):
+        started = time.perf_counter()
+        rows = case.run()
+        times.append((time.perf_counter() - started) * 1000)
+
+    times.sort()
+    return {
+        "name": case.name,
+        "procedure": case.procedure,
+        "runs": len(times),
+        "rows": rows,
+        "min_ms": round(times[0], 3),
+        "median_ms": round(statistics.median(times), 3),
+        "p95_ms": round(_percentile(times, 0.95), 3),
+        "max_ms": round(times[-1], 3),
+    }
+
+
+def use_memory_database(students):
+    """
+    Generates a data set into a fresh memory database and points the
+    connection pool at it. Returns the row counts.
+    """
+    from db import connection
+    from db.memory_backend import MemoryDatabase, connect
+
+    dataset = generate(students)
+    database = MemoryDatabase()
+    load_memory(database, dataset)
+
+    connection._pool.close_all()
+    connection._pool.factory = lambda: connect(database=database)
+    return dataset.counts()
+
+
+def run_scale(students, repeat, backend):
+    from db import connection
+
+    result = {"students": students}
+
+    if backend == "memory":
+        started = time.perf_counter()
+        result["rows"] = use_memory_database(students)
+        result["load_seconds"] = round(time.perf_counter() - started, 3)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cases = build_cases(students, tmpdir)
+        result["results"] = []
+        for case in cases:
+            outcome = run_case(case, repeat)
+            result["results"].append(outcome)
+            print(f"  {case.name:<30} {outcome['median_ms']:>10.3f} ms  (p95 {outcome['p95_ms']:.3f}, rows {outcome['rows']})")
+
+    connection._pool.close_all()
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SRMS benchmark suite")
+    parser.add_argument("--scales", type=int, nargs="+", default=list(SCALES),
+                        help="number of students per run")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--backend", choices=("memory", "sqlserver"), default="memory")
+    parser.add_argument("--out", default="benchmark_report.json")
+    args = parser.parse_args(argv)
+
+    if args.backend == "sqlserver" and len(args.scales) != 1:
+        parser.error("--backend sqlserver measures the data already loaded: pass one --scales value")
+
+    # must be set before db.connection is imported
+    os.environ["SRMS_BACKEND"] = args.backend
+
+    report = {
+        "suite": "srms",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "backend": args.backend,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "scales": [],
+    }
+
+    for students in args.scales:
+        print(f"{students:,} students")
+        report["scales"].append(run_scale(students, args.repeat, args.backend))
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
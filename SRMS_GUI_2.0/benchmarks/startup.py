@@ -0,0 +1,170 @@
+"""
+Measures how long main.py takes to show the login window and how long a
+login takes to bring up the dashboard:
+
+    python -m benchmarks.startup                      # memory backend, admin1
+    python -m benchmarks.startup --eager --out eager.json
+    python -m benchmarks.startup --backend sqlserver --user admin1 --password ...
+
+Every run starts a fresh interpreter, so import and driver-load costs are
+included. time-to-window is measured from process start to the first
+drawn frame of the login window; login-to-dashboard from pressing Login to
+the dashboard window existing.
+
+By default Login is pressed once the background warm-up has finished (a
+user typing their password takes longer than that). --no-warm-up skips the
+warm-up, so the first connection is opened by the login itself; --eager
+imports every dashboard before the window is built, like main.py used to.
+
+Needs a display (or Xvfb).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+RUNS = 10
+LOGIN_TIMEOUT = 60  # seconds
+
+
+def _child(args):
+    import tkinter as tk
+
+    started = time.perf_counter()
+    if args.eager:
+        import importlib
+        from main import DASHBOARDS
+        for module, _ in DASHBOARDS.values():
+            importlib.import_module(module)
+
+    import main
+
+    root = tk.Tk()
+    app = main.LoginWindow(root)
+    root.update()
+    print("window", flush=True)
+    window_s = time.perf_counter() - started
+
+    result = {"window_in_process_s": window_s}
+    warm_started = time.perf_counter()
+    warm = main.start_warm_up() if args.warm_up else None
+
+    def press_login():
+        if warm is not None and warm.is_alive():
+            root.after(5, press_login)
+            return
+        if warm is not None:
+            result["warm_up_s"] = time.perf_counter() - warm_started
+
+        app.entry_user.insert(0, args.user)
+        app.entry_pass.insert(0, args.password)
+        pressed = time.perf_counter()
+        app.handle_login()
+        wait_for_dashboard(pressed)
+
+    def wait_for_dashboard(pressed):
+        if app.dashboard is not None:
+            app.dashboard.update()
+            result["login_s"] = time.perf_counter() - pressed
+            root.destroy()
+        elif time.perf_counter() - pressed > LOGIN_TIMEOUT:
+            root.destroy()
+        else:
+            root.after(5, wait_for_dashboard, pressed)
+
+    root.after_idle(press_login)
+    root.mainloop()
+
+    if "login_s" not in result:
+        raise SystemExit(f"login as {args.user} did not open a dashboard")
+    print(json.dumps(result), flush=True)
+
+
+def _one_run(args):
+    command = [
+        sys.executable, "-m", "benchmarks.startup", "--child",
+        "--user", args.user, "--password", args.password,
+    ]
+    if args.eager:
+        command.append("--eager")
+    if not args.warm_up:
+        command.append("--no-warm-up")
+
+    env = dict(os.environ, SRMS_BACKEND=args.backend)
+    started = time.perf_counter()
+    child = subprocess.Popen(command, env=env, stdout=subprocess.PIPE, text=True)
+    try:
+        first = child.stdout.readline()
+        window_s = time.perf_counter() - started
+        rest = child.stdout.read()
+    finally:
+        child.stdout.close()
+    if child.wait() != 0 or first.strip() != "window":
+        raise RuntimeError(f"startup run failed (exit code {child.returncode})")
+
+    result = json.loads(rest.strip().splitlines()[-1])
+    result["window_s"] = window_s
+    return result
+
+
+def _ms(values):
+    return {
+        "median_ms": round(statistics.median(values) * 1000, 1),
+        "min_ms": round(min(values) * 1000, 1),
+        "max_ms": round(max(values) * 1000, 1),
+    }
+
+
+def run(args):
+    runs = [_one_run(args) for _ in range(args.runs)]
+    result = {
+        "runs": args.runs,
+        "eager": args.eager,
+        "warm_up": args.warm_up,
+        "time_to_window": _ms([r["window_s"] for r in runs]),
+        "window_in_process": _ms([r["window_in_process_s"] for r in runs]),
+        "login_to_dashboard": _ms([r["login_s"] for r in runs]),
+    }
+    if args.warm_up:
+        result["warm_up_time"] = _ms([r["warm_up_s"] for r in runs])
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SRMS startup benchmark")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--backend", choices=("memory", "sqlserver"), default="memory")
+    parser.add_argument("--user", default="admin1")
+    parser.add_argument("--password", default="adminpass")
+    parser.add_argument("--eager", action="store_true",
+                        help="import every dashboard before showing the window")
+    parser.add_argument("--no-warm-up", dest="warm_up", action="store_false")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--out", default="startup.json")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return _child(args)
+
+    report = {
+        "suite": "srms-startup",
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "backend": args.backend,
+        "user": args.user,
+    }
+    report.update(run(args))
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"login window in {report['time_to_window']['median_ms']} ms, "
+          f"dashboard {report['login_to_dashboard']['median_ms']} ms after Login "
+          f"(medians of {args.runs} runs)")
+    print(f"Report written to {args.out}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,412 @@
-import pyodbc
+import os
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+
+# SRMS_BACKEND=memory runs everything against db/memory_backend.py
+# (no SQL Server or ODBC driver needed)
+BACKEND = os.environ.get("SRMS_BACKEND", "sqlserver").lower()
+
+if BACKEND == "memory":
+    from db import memory_backend as driver
+else:
+    import pyodbc as driver
+
+CONNECTION_STRING = (
+    "DRIVER={ODBC Driver 17 for SQL Server};"
+    "SERVER=ME\\SQLEXPRESS;"  # <-- 8er dah 3la hasb el server 3andk
+    "DATABASE=SRMS_DB;"
+    "Trusted_Connection=yes;"
+)
+
+# Key-session mode: every new connection opens SRMS_AES_Key once
+# (dbo.OpenKeySession) and keeps it open, so procedures skip their own
+# certificate-protected OPEN/CLOSE. SRMS_KEY_SESSION=0 turns it off.
+KEY_SESSION = os.environ.get("SRMS_KEY_SESSION", "1") != "0"
+
+# =========================
+# Pool settings
+# =========================
+POOL_MAX_SIZE = 8          # max open connections (idle + checked out)
+POOL_IDLE_TIMEOUT = 300    # seconds an idle connection is kept before eviction
+POOL_CHECKOUT_TIMEOUT = 10 # seconds to wait for a free connection
+POOL_HEALTH_CHECK_AFTER = 30  # idle seconds after which a checkout is pinged first
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+def _connect():
+    raw = driver.connect(CONNECTION_STRING)
+    if KEY_SESSION:
+        try:
+            open_key_session(raw)
+        except Exception:
+            raw.close()
+            raise
+    return raw
+
+
+def open_key_session(raw):
+    cursor = raw.cursor()
+    cursor.execute("EXEC dbo.OpenKeySession")
+    cursor.close()
+    # committed, so the pool's rollback on release can't undo it
+    raw.commit()
+
+
+class PooledConnection:
+    """
+    Proxy around a pooled pyodbc connection.
+    close() hands the connection back to the pool instead of closing it.
+    Its cursors hold the proxy, so a connection still being read through
+    a cursor is never reclaimed as leaked.
+    """
+
+    def __init__(self, pool, raw):
+        self._pool = pool
+        self._raw = raw
+        # If the proxy is garbage collected without close(), reclaim the
+        # connection and count it as a leak.
+        self._finalizer = weakref.finalize(self, pool._reclaim_leaked, raw)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def cursor(self):
+        return PooledCursor(self, self._raw.cursor())
+
+    def close(self):
+        if self._finalizer.detach() is not None:
+            self._pool._release(self._raw)
+
+    def discard(self):
+        """Close the underlying connection for good (e.g. after a network error)."""
+        if self._finalizer.detach() is not None:
+            self._pool._discard(self._raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class PooledCursor:
+    """
+    Cursor of a PooledConnection. Keeps the proxy alive for as long as
+    the cursor (or a loop over it) is in use.
+    """
+
+    def __init__(self, conn, raw):
+        self._conn = conn
+        self._raw = raw
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def _wrap(self, result):
+        # pyodbc's execute() returns the cursor itself, for chaining
+        return self if result is self._raw else result
+
+    def execute(self, *args, **kwargs):
+        return self._wrap(self._raw.execute(*args, **kwargs))
+
+    def executemany(self, *args, **kwargs):
+        return self._wrap(self._raw.executemany(*args, **kwargs))
+
+    def __iter__(self):
+        yield from self._raw
+
+    def __enter__(self):
+        self._raw.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._raw.__exit__(exc_type, exc, tb)
+
+
+class ConnectionPool:
+    def __init__(self, factory, max_size=POOL_MAX_SIZE,
+                 idle_timeout=POOL_IDLE_TIMEOUT,
+                 checkout_timeout=POOL_CHECKOUT_TIMEOUT,
+                 health_check_after=POOL_HEALTH_CHECK_AFTER):
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.health_check_after = health_check_after
+
+        self._cond = threading.Condition()
+        self._idle = []   # [(raw, last_used)] - most recently used at the end
+        self._size = 0    # idle + checked out
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "waits": 0,
+            "leaks": 0,
+            "evictions": 0,
+            "failed_health_checks": 0,
+        }
+
+    # =========================
+    # Checkout
+    # =========================
+    def acquire(self):
+        deadline = time.monotonic() + self.checkout_timeout
+        waited = False
+
+        with self._cond:
+            self._evict_idle()
+            while True:
+                if self._idle:
+                    raw, last_used = self._idle.pop()
+                    self._stats["hits"] += 1
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    raw, last_used = None, None
+                    self._stats["misses"] += 1
+                    break
+
+                if not waited:
+                    self._stats["waits"] += 1
+                    waited = True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeout(
+                        f"No database connection available after {self.checkout_timeout}s"
+                    )
+                self._cond.wait(remaining)
+
+        if raw is not None and time.monotonic() - last_used > self.health_check_after:
+            if not self._is_healthy(raw):
+                with self._cond:
+                    self._stats["failed_health_checks"] += 1
+                self._close_quietly(raw)
+                raw = None
+
+        if raw is None:
+            try:
+                raw = self.factory()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+
+        return PooledConnection(self, raw)
+
+    # =========================
+    # Return / discard
+    # =========================
+    def _release(self, raw):
+        try:
+            # never hand a half-finished transaction to the next caller
+            raw.rollback()
+        except Exception:
+            self._discard(raw)
+            return
+
+        with self._cond:
+            self._idle.append((raw, time.monotonic()))
+            self._cond.notify()
+
+    def _discard(self, raw):
+        self._close_quietly(raw)
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _reclaim_leaked(self, raw):
+        with self._cond:
+            self._stats["leaks"] += 1
+        self._release(raw)
+
+    def _evict_idle(self):
+        # caller holds self._cond
+        now = time.monotonic()
+        keep = []
+        for raw, last_used in self._idle:
+            if now - last_used > self.idle_timeout:
+                self._close_quietly(raw)
+                self._size -= 1
+                self._stats["evictions"] += 1
+            else:
+                keep.append((raw, last_used))
+        self._idle = keep
+
+    @staticmethod
+    def _is_healthy(raw):
+        try:
+            cursor = raw.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+
+    # =========================
+    # Housekeeping
+    # =========================
+    def stats(self):
+        with self._cond:
+            result = dict(self._stats)
+            result["open"] = self._size
+            result["idle"] = len(self._idle)
+            result["in_use"] = self._size - len(self._idle)
+            return result
+
+    def close_all(self):
+        with self._cond:
+            for raw, _ in self._idle:
+                self._close_quietly(raw)
+            self._size -= len(self._idle)
+            self._idle = []
+
+
+_pool = ConnectionPool(_connect)
+
 
 def get_connection():
-    return pyodbc.connect(
-        "DRIVER={ODBC Driver 17 for SQL Server};"
-        "SERVER=ME\\SQLEXPRESS;"  # <-- 8er dah 3la hasb el server 3andk
-        "DATABASE=SRMS_DB;"
-        "Trusted_Connection=yes;"
-    )
\ No newline at end of file
+    """
+    Checks a connection out of the pool.
+    Call close() on it (or use connection()) to give it back.
+    """
+    return _pool.acquire()
+
+
+def warm_up():
+    """
+    Opens one pooled connection ahead of the first real call, so the
+    ODBC driver load and the TCP/TLS/login handshake are already paid for.
+    Does nothing if the pool already has a connection.
+    """
+    if _pool.stats()["open"]:
+        return
+    get_connection().close()
+
+
+# =====================================================
+# Login sessions
+# =====================================================
+class Session:
+    """
+    One logged-in user. Holds the connection ValidateLogin ran on, whose
+    read-only SESSION_CONTEXT carries the user's role and clearance, so
+    procedures called on it skip the dbo.Users lookup.
+
+    The connection serves one call at a time; calls made while it is busy
+    (e.g. a background export still streaming) use the pool instead.
+    """
+
+    def __init__(self, username, role, clearance, lease):
+        self.username = username
+        self.role = role
+        self.clearance = clearance
+        self._lease = lease
+        self._lock = threading.Lock()
+
+    def try_borrow(self):
+        if not self._lock.acquire(blocking=False):
+            return None
+        if self._lease is None:
+            self._lock.release()
+            return None
+        return self._lease
+
+    def give_back(self):
+        try:
+            if self._lease is not None:
+                self._lease.rollback()
+        except Exception:
+            self._drop()
+        finally:
+            self._lock.release()
+
+    def broken(self):
+        # caller holds the lock (between try_borrow and give_back)
+        self._drop()
+
+    def _drop(self):
+        if self._lease is not None:
+            self._lease.discard()
+            self._lease = None
+
+    def close(self):
+        """
+        Ends the session. The context is read-only for the connection's
+        lifetime, so the connection is closed rather than pooled.
+        """
+        unregister_session(self)
+        with self._lock:
+            self._drop()
+
+
+_sessions = {}   # username (lowercase) -> Session
+_sessions_lock = threading.Lock()
+
+
+def register_session(session):
+    with _sessions_lock:
+        _sessions[session.username.lower()] = session
+
+
+def unregister_session(session):
+    with _sessions_lock:
+        key = session.username.lower()
+        if _sessions.get(key) is session:
+            del _sessions[key]
+
+
+def _session_for(username):
+    if not username:
+        return None
+    with _sessions_lock:
+        return _sessions.get(username.lower())
+
+
+@contextmanager
+def connection(username=None):
+    """
+    with connection() as conn:
+        cursor = conn.cursor()
+        ...
+
+    Pass the acting user to run on their login session when it is free.
+    """
+    session = _session_for(username)
+    conn = session.try_borrow() if session else None
+    if conn is not None:
+        try:
+            yield conn
+        except driver.OperationalError:
+            session.broken()
+            raise
+        finally:
+            session.give_back()
+        return
+
+    conn = _pool.acquire()
+    try:
+        yield conn
+    except driver.OperationalError:
+        # broken link - don't put it back in the pool
+        conn.discard()
+        raise
+    finally:
+        conn.close()
+
+
+def pool_stats():
+    return _pool.stats()
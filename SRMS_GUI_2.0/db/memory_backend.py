@@ -0,0 +1,1282 @@
+"""
+In-process stand-in for the SRMS SQL Server database.
+
+Implements the stored procedures in SRMS_DBS.sql in pure Python behind a
+small pyodbc-compatible surface (connect / cursor / execute / fetch*), so
+the services, benchmarks and scripts run without a server:
+
+    SRMS_BACKEND=memory python main.py
+
+The procedures raise the same error numbers as the T-SQL versions and keep
+the server's quirks: case-insensitive, trailing-space-insensitive string
+comparisons (the default collation) and NULL comparisons that are neither
+true nor false (an unknown user is never "not in" a role list).
+
+When a procedure changes in SRMS_DBS.sql, change it here too.
+"""
+import bisect
+import re
+import threading
+from collections import namedtuple
+from datetime import datetime, date, timedelta
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from itertools import islice
+
+apilevel = "2.0"
+threadsafety = 1
+paramstyle = "qmark"
+
+
+# =====================================================
+# Exceptions (same hierarchy as pyodbc)
+# =====================================================
+class Error(Exception):
+    pass
+
+
+class DatabaseError(Error):
+    pass
+
+
+class OperationalError(DatabaseError):
+    pass
+
+
+class ProgrammingError(DatabaseError):
+    pass
+
+
+class IntegrityError(DatabaseError):
+    pass
+
+
+class DataError(DatabaseError):
+    pass
+
+
+class ServerError(ProgrammingError):
+    """A THROW from a procedure. number is the T-SQL error number."""
+
+    def __init__(self, number, message):
+        self.number = number
+        super().__init__("42000", f"[42000] [SRMS memory backend]{message} ({number})")
+
+
+def _throw(number, message):
+    raise ServerError(number, message)
+
+
+# =====================================================
+# T-SQL comparison semantics
+# =====================================================
+def _key(value):
+    # default collation: case-insensitive, trailing spaces ignored
+    return value.rstrip(" ").casefold() if isinstance(value, str) else value
+
+
+def _eq(a, b):
+    return a is not None and b is not None and _key(a) == _key(b)
+
+
+def _ne(a, b):
+    return a is not None and b is not None and _key(a) != _key(b)
+
+
+def _lt(a, b):
+    return a is not None and a < b
+
+
+def _gt(a, b):
+    return a is not None and a > b
+
+
+def _in(a, values):
+    return a is not None and _key(a) in {_key(v) for v in values}
+
+
+def _not_in(a, values):
+    return a is not None and _key(a) not in {_key(v) for v in values}
+
+
+def _now():
+    # DATETIME keeps milliseconds at most
+    now = datetime.now()
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
+
+
+def _datetime(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    return datetime.fromisoformat(str(value))
+
+
+def _bit(value):
+    return None if value is None else bool(int(value))
+
+
+def _rowversion(n):
+    # ROWVERSION is BINARY(8): big-endian, so bytes compare like the numbers
+    return n.to_bytes(8, "big")
+
+
+def _decimal_5_2(value):
+    try:
+        d = Decimal(str(value)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    except InvalidOperation:
+        raise DataError("22018", "[22018] Error converting data type to decimal. (8114)")
+    if abs(d) >= 1000:
+        raise DataError("22003", "[22003] Arithmetic overflow error converting to data type numeric. (8115)")
+    return d
+
+
+# =====================================================
+# Tables
+# =====================================================
+class MemoryDatabase:
+    """
+    The SRMS tables held in dicts, plus the indexes the procedures need.
+    Every statement runs under one lock. Changes are visible to other
+    connections immediately and undone by rollback().
+    """
+
+    def __init__(self, seed=True):
+        self.lock = threading.RLock()
+
+        self.users = {}            # key(Username) -> dict
+        self.students = {}         # SurrogateID -> dict
+        self.student_by_email = {} # key(Email) -> SurrogateID
+        self.student_by_id = {}    # StudentID -> {SurrogateID} (IX_Student_StudentID_BIdx)
+        self.instructors = {}      # InstructorID -> dict
+        self.courses = {}          # CourseID -> dict
+        self.grades = {}           # GradeID -> dict
+        self.grade_by_key = {}     # (StudentRefID, CourseID) -> GradeID
+        self.attendance = {}       # AttendanceID -> dict
+        self.attendance_order = [] # sorted (DateRecorded, AttendanceID)
+        self.attendance_by_student = {}  # StudentRefID -> sorted (DateRecorded, AttendanceID)
+        self.role_requests = {}    # RequestID -> dict
+        self.dept_grade_agg = {}   # key(Department) -> dict (dbo.DeptGradeAgg)
+        self.grades_per_student = {}  # StudentRefID -> number of grades
+        self.attendance_weekly = {}   # (CourseID, StudentRefID, WeekStart) -> [Present, Absent]
+
+        self._identity = {"Student": 0, "Grades": 0, "Attendance": 0, "RoleRequests": 0}
+        self._rowversion = 0       # @@DBTS
+
+        if seed:
+            self.load_seed_data()
+
+    def next_id(self, table):
+        self._identity[table] += 1
+        return self._identity[table]
+
+    def next_rowversion(self):
+        self._rowversion += 1
+        return _rowversion(self._rowversion)
+
+    def min_active_rowversion(self):
+        # writes are applied under the database lock, so nothing is in flight
+        return _rowversion(self._rowversion + 1)
+
+    # =========================
+    # Row level changes (each registers its undo with tx)
+    # =========================
+    def insert_user(self, tx, username, password, role, clearance):
+        _check_user(role, clearance)
+        k = _key(username)
+        if k in self.users:
+            raise IntegrityError(
+                "23000",
+                f"[23000] Violation of PRIMARY KEY constraint. Cannot insert duplicate key in object 'dbo.Users'. "
+                f"The duplicate key value is ({username}). (2627)"
+            )
+        self.users[k] = {
+            "Username": username,
+            "Password": password,
+            "RoleName": role,
+            "ClearanceLevel": clearance,
+        }
+        tx.log(lambda: self.users.pop(k, None))
+
+    def insert_student(self, tx, student_id, full_name, email, phone, dob, department, clearance):
+        k = _key(email)
+        if k in self.student_by_email:
+            raise IntegrityError(
+                "23000",
+                f"[23000] Violation of UNIQUE KEY constraint. Cannot insert duplicate key in object 'dbo.Student'. "
+                f"The duplicate key value is ({email}). (2627)"
+            )
+        sid = self.next_id("Student")
+        self.students[sid] = {
+            "SurrogateID": sid,
+            "StudentID": student_id,
+            "FullName": full_name,
+            "Email": email,
+            "Phone": phone,
+            "DOB": dob,
+            "Department": department,
+            "ClearanceLevel": clearance,
+        }
+        self.student_by_email[k] = sid
+        self.student_by_id.setdefault(student_id, set()).add(sid)
+
+        def undo():
+            self.students.pop(sid, None)
+            self.student_by_email.pop(k, None)
+            self.student_by_id.get(student_id, set()).discard(sid)
+        tx.log(undo)
+        return sid
+
+    def insert_instructor(self, tx, instructor_id, full_name, email, clearance):
+        self.instructors[instructor_id] = {
+            "InstructorID": instructor_id,
+            "FullName": full_name,
+            "Email": email,
+            "ClearanceLevel": clearance,
+        }
+        tx.log(lambda: self.instructors.pop(instructor_id, None))
+
+    def insert_course(self, tx, course_id, name, description, public_info):
+        self.courses[course_id] = {
+            "CourseID": course_id,
+            "CourseName": name,
+            "Description": description,
+            "PublicInfo": public_info,
+            "RowVer": self.next_rowversion(),
+        }
+        tx.log(lambda: self.courses.pop(course_id, None))
+
+    def insert_grade(self, tx, ref, course_id, value, entered_by, when):
+        self.check_course(course_id, "INSERT", "FK_Grades_Course", "dbo.Course")
+        if (ref, course_id) in self.grade_by_key:
+            raise IntegrityError(
+                "23000",
+                "[23000] Cannot insert duplicate key row in object 'dbo.Grades' "
+                "with unique index 'UX_Grades_Student_Course'. (2601)"
+            )
+        gid = self.next_id("Grades")
+        self.grades[gid] = {
+            "GradeID": gid,
+            "StudentRefID": ref,
+            "CourseID": course_id,
+            "GradeValue": value,
+            "DateEntered": when,
+            "EnteredBy": entered_by,
+        }
+        self.grade_by_key[(ref, course_id)] = gid
+
+        def undo():
+            self.grades.pop(gid, None)
+            self.grade_by_key.pop((ref, course_id), None)
+        tx.log(undo)
+        self._grade_changed(tx, ref, value, 1)
+
+    def update_grade(self, tx, gid, value, entered_by, when):
+        row = self.grades[gid]
+        old_value = row["GradeValue"]
+        self.update_row(tx, row, GradeValue=value, DateEntered=when, EnteredBy=entered_by)
+        self._grade_changed(tx, row["StudentRefID"], value - old_value, 0)
+
+    def _grade_changed(self, tx, ref, delta_sum, delta_count):
+        # TR_Grades_DeptGradeAgg (students never change department here,
+        # so TR_Student_DeptGradeAgg has no counterpart)
+        before = self.grades_per_student.get(ref, 0)
+        after = before + delta_count
+        self.grades_per_student[ref] = after
+
+        department = self.students[ref]["Department"]
+        agg = self.dept_grade_agg.setdefault(_key(department), {
+            "Department": department, "GradeSum": Decimal(0), "GradeCount": 0, "StudentCount": 0,
+        })
+        delta_students = (after > 0) - (before > 0)
+        agg["GradeSum"] += delta_sum
+        agg["GradeCount"] += delta_count
+        agg["StudentCount"] += delta_students
+
+        def undo():
+            self.grades_per_student[ref] = before
+            agg["GradeSum"] -= delta_sum
+            agg["GradeCount"] -= delta_count
+            agg["StudentCount"] -= delta_students
+        tx.log(undo)
+
+    def update_row(self, tx, row, **changes):
+        if "RowVer" in row:
+            changes["RowVer"] = self.next_rowversion()
+        old = {name: row[name] for name in changes}
+        row.update(changes)
+        tx.log(lambda: row.update(old))
+
+    def insert_attendance(self, tx, ref, course_id, status, when, recorded_by):
+        self.check_course(course_id, "INSERT", "FK_Att_Course", "dbo.Course")
+        aid = self.next_id("Attendance")
+        self.attendance[aid] = {
+            "AttendanceID": aid,
+            "StudentRefID": ref,
+            "CourseID": course_id,
+            "Status": status,
+            "DateRecorded": when,
+            "RecordedBy": recorded_by,
+        }
+        entry = (when, aid)
+        by_student = self.attendance_by_student.setdefault(ref, [])
+        bisect.insort(self.attendance_order, entry)
+        bisect.insort(by_student, entry)
+
+        def undo():
+            self.attendance.pop(aid, None)
+            self.attendance_order.remove(entry)
+            by_student.remove(entry)
+        tx.log(undo)
+        self._attendance_changed(tx, ref, course_id, when, status)
+
+    def _attendance_changed(self, tx, ref, course_id, when, status):
+        # TR_Attendance_Weekly (attendance rows are only ever inserted here)
+        day = when.date()
+        k = (course_id, ref, day - timedelta(days=day.weekday()))
+        counts = self.attendance_weekly.setdefault(k, [0, 0])
+        column = 0 if status else 1
+        counts[column] += 1
+
+        def undo():
+            counts[column] -= 1
+            if counts == [0, 0]:
+                self.attendance_weekly.pop(k, None)
+        tx.log(undo)
+
+    def insert_role_request(self, tx, username, current_role, requested_role, reason, when):
+        rid = self.next_id("RoleRequests")
+        self.role_requests[rid] = {
+            "RequestID": rid,
+            "Username": username,
+            "CurrentRole": current_role,
+            "RequestedRole": requested_role,
+            "Reason": reason,
+            "Comments": None,
+            "Status": "Pending",
+            "DateSubmitted": when,
+            "DateResolved": None,
+            "ResolvedBy": None,
+        }
+        tx.log(lambda: self.role_requests.pop(rid, None))
+        return rid
+
+    def check_course(self, course_id, statement, constraint, table):
+        if course_id not in self.courses:
+            raise IntegrityError(
+                "23000",
+                f"[23000] The {statement} statement conflicted with the FOREIGN KEY constraint "
+                f"\"{constraint}\". The conflict occurred in table \"{table}\", column 'CourseID'. (547)"
+            )
+
+    # =========================
+    # Lookups used by the procedures
+    # =========================
+    def identity(self, username):
+        """(RoleName, ClearanceLevel, StudentRefID) - all None for unknown users, like dbo.UserIdentity."""
+        user = self.users.get(_key(username))
+        if user is None:
+            return None, None, None
+        return user["RoleName"], user["ClearanceLevel"], self.student_ref(username)
+
+    def student_ref(self, email):
+        return self.student_by_email.get(_key(email))
+
+    # =========================
+    # Seed data (TASK 11)
+    # =========================
+    def load_seed_data(self):
+        tx = AUTOCOMMIT
+        for username, password, role, clearance in (
+            ("admin1", "adminpass", "Admin", 4),
+            ("admin2", "admin2pass", "Admin", 4),
+            ("inst1", "instpass", "Instructor", 3),
+            ("inst2@nu.edu", "inst2pass", "Instructor", 3),
+            ("ta1", "tapass", "TA", 3),
+            ("ta2@nu.edu", "ta2pass", "TA", 3),
+            ("stud1@nu.edu", "studpass", "Student", 2),
+            ("stud2@nu.edu", "stud2pass", "Student", 2),
+            ("stud3@nu.edu", "stud3pass", "Student", 2),
+            ("stud4@nu.edu", "stud4pass", "Student", 2),
+            ("guest1", "guestpass", "Guest", 1),
+            ("guest2", "guest2pass", "Guest", 1),
+        ):
+            self.insert_user(tx, username, password, role, clearance)
+
+        for student in (
+            ("1001", "Alice Student", "stud1@nu.edu", "01011112222", date(2000, 1, 1), "Computer Science", 2),
+            ("1002", "Mohamed Hassan", "stud2@nu.edu", "01022223333", date(2001, 5, 15), "Computer Science", 2),
+            ("1003", "Sara Ali", "stud3@nu.edu", "01033334444", date(2002, 9, 10), "Information Systems", 2),
+            ("1003", "Zizo", "stud4@nu.edu", "01033334444", date(2005, 5, 5), "Computer Science", 2),
+        ):
+            self.insert_student(tx, *student)
+
+        self.insert_course(tx, 101, "Database Security", "Secure DB design", "Open to all")
+        self.insert_course(tx, 102, "Advanced Database", "SQL Server", "Open to all")
+
+
+def _check_user(role, clearance):
+    if (not _in(role, ("Admin", "Instructor", "TA", "Student", "Guest"))
+            or clearance is None or not 1 <= clearance <= 4):
+        raise IntegrityError(
+            "23000",
+            "[23000] The statement conflicted with a CHECK constraint. "
+            "The conflict occurred in table \"dbo.Users\". (547)"
+        )
+
+
+class _Autocommit:
+    """Pass as tx to change rows without an undo log (bulk loading)."""
+
+    def log(self, undo):
+        pass
+
+
+AUTOCOMMIT = _Autocommit()
+
+
+class _Transaction:
+    """Undo log of one connection's uncommitted changes."""
+
+    def __init__(self):
+        self._undo = []
+
+    def log(self, undo):
+        self._undo.append(undo)
+
+    def mark(self):
+        return len(self._undo)
+
+    def commit(self):
+        self._undo = []
+
+    def rollback(self, to=0):
+        while len(self._undo) > to:
+            self._undo.pop()()
+
+
+# =====================================================
+# Procedures
+# Each takes (db, conn, *params) and returns (columns, rows) or None.
+# =====================================================
+PROCEDURES = {}
+
+
+def procedure(func):
+    PROCEDURES[_key(func.__name__)] = func
+    return func
+
+
+def _user_identity(db, conn, username):
+    # dbo.UserIdentity: the context ValidateLogin pinned on this connection
+    # answers for its own user; anyone else is looked up in dbo.Users
+    context = conn.context
+    if context and _eq(context["SRMS_User"], username):
+        return context["SRMS_Role"], context["SRMS_Clearance"], context["SRMS_StudentRef"]
+    return db.identity(username)
+
+
+@procedure
+def OpenKeySession(db, conn):
+    # nothing is encrypted in memory: no key to open
+    return None
+
+
+@procedure
+def CreateUser(db, conn, AdminUser, Username, PlainPassword, RoleName, Clearance):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if _ne(role, "Admin"):
+        _throw(50001, "Admin only.")
+    db.insert_user(conn.tx, Username, PlainPassword, RoleName, Clearance)
+
+
+@procedure
+def ValidateLogin(db, conn, Username, PlainPassword):
+    user = db.users.get(_key(Username))
+    if user is None:
+        _throw(50002, "Invalid login.")
+    if _ne(user["Password"], PlainPassword):
+        _throw(50002, "Invalid login.")
+    if not conn.context:
+        # read_only: the first login on a connection owns it for good
+        role, clr, ref = db.identity(Username)
+        conn.context = {
+            "SRMS_User": Username,
+            "SRMS_Role": role,
+            "SRMS_Clearance": clr,
+            "SRMS_StudentRef": ref,
+        }
+    return (
+        ("Username", "RoleName", "ClearanceLevel"),
+        [(user["Username"], user["RoleName"], user["ClearanceLevel"])],
+    )
+
+
+_OWN_PROFILE_COLUMNS = ("StudentID", "FullName", "Email", "Phone", "DOB", "Department", "ClearanceLevel")
+
+
+@procedure
+def ViewOwnProfile(db, conn, Username):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if _lt(clr, 2):
+        _throw(50004, "MLS NRU: clearance < Confidential.")
+
+    if _eq(role, "Student"):
+        refs = [db.student_ref(Username)] if db.student_ref(Username) else []
+    else:
+        refs = list(db.students)
+
+    rows = []
+    for ref in refs:
+        s = db.students[ref]
+        rows.append((s["StudentID"], s["FullName"], s["Email"], s["Phone"],
+                     s["DOB"], s["Department"], s["ClearanceLevel"]))
+    return _OWN_PROFILE_COLUMNS, rows
+
+
+@procedure
+def ViewPublicCourses(db, conn, Username, SinceVersion=None):
+    role, _, _ = _user_identity(db, conn, Username)
+    if role is None:
+        _throw(50003, "Unknown user.")
+    return (
+        ("CourseID", "CourseName", "PublicInfo", "RowVer"),
+        [
+            (c["CourseID"], c["CourseName"], c["PublicInfo"], c["RowVer"])
+            for c in db.courses.values()
+            if SinceVersion is None or c["RowVer"] >= SinceVersion
+        ],
+    )
+
+
+@procedure
+def PublicCourseVersion(db, conn, Username):
+    role, _, _ = _user_identity(db, conn, Username)
+    if role is None:
+        _throw(50003, "Unknown user.")
+    version = max((c["RowVer"] for c in db.courses.values()), default=None)
+    return (
+        ("Version", "CourseCount", "Watermark"),
+        [(version, len(db.courses), db.min_active_rowversion())],
+    )
+
+
+_PROFILE_COLUMNS = ("ProfileType", "Identifier", "FullName", "Email", "Phone", "Department", "ClearanceLevel")
+
+
+def _student_profiles(db, refs):
+    for ref in refs:
+        s = db.students[ref]
+        yield ("Student", s["StudentID"], s["FullName"], s["Email"], s["Phone"],
+               s["Department"], s["ClearanceLevel"])
+
+
+def _user_profiles(db, profile_type, role=None):
+    for u in db.users.values():
+        if role is None or u["RoleName"] == role:
+            yield (profile_type, None, u["Username"], u["Username"], None, None, u["ClearanceLevel"])
+
+
+@procedure
+def ViewProfilesByRole(db, conn, Username):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if role is None:
+        _throw(50100, "Unknown user.")
+
+    if _eq(role, "Student"):
+        if _lt(clr, 2):
+            _throw(50101, "MLS NRU.")
+        ref = db.student_ref(Username)
+        return _PROFILE_COLUMNS, list(_student_profiles(db, [ref] if ref else []))
+
+    if _eq(role, "TA"):
+        if _lt(clr, 3):
+            _throw(50102, "MLS NRU.")
+        return _PROFILE_COLUMNS, list(_student_profiles(db, db.students))
+
+    if _eq(role, "Instructor"):
+        if _lt(clr, 3):
+            _throw(50103, "MLS NRU.")
+        rows = list(_student_profiles(db, db.students))
+        rows += _user_profiles(db, "TA", "TA")
+        return _PROFILE_COLUMNS, rows
+
+    if _eq(role, "Admin"):
+        if _lt(clr, 4):
+            _throw(50104, "MLS NRU.")
+        rows = list(_student_profiles(db, db.students))
+        rows += _user_profiles(db, "Instructor", "Instructor")
+        rows += _user_profiles(db, "User")
+        return _PROFILE_COLUMNS, rows
+
+    _throw(50105, "Access denied.")
+
+
+@procedure
+def FindStudentByID(db, conn, Username, StudentID):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if role is None:
+        _throw(50100, "Unknown user.")
+    if _eq(role, "TA") and _lt(clr, 3):
+        _throw(50102, "MLS NRU.")
+    if _eq(role, "Instructor") and _lt(clr, 3):
+        _throw(50103, "MLS NRU.")
+    if _eq(role, "Admin") and _lt(clr, 4):
+        _throw(50104, "MLS NRU.")
+    if _not_in(role, ("Admin", "Instructor", "TA")):
+        _throw(50105, "Access denied.")
+
+    refs = sorted(db.student_by_id.get((StudentID or "").strip(), ()))
+    return _PROFILE_COLUMNS, list(_student_profiles(db, refs))
+
+
+@procedure
+def EditOwnProfile(db, conn, Username, NewFullName):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if _not_in(role, ("Admin", "Instructor", "TA")):
+        _throw(50006, "Only Admin/Instructor/TA can edit profile.")
+
+    ref = db.student_ref(Username)
+    if ref is not None:
+        db.update_row(conn.tx, db.students[ref], FullName=NewFullName, ClearanceLevel=clr)
+
+
+# =========================
+# Grades
+# =========================
+def _check_grade_writer(role, clr):
+    if _not_in(role, ("Admin", "Instructor")):
+        _throw(50008, "Only Admin/Instructor can edit grades.")
+    if _lt(clr, 3):
+        _throw(50009, "MLS NRU: clearance < Secret.")
+    if _gt(clr, 3) and _ne(role, "Admin"):
+        _throw(50010, "MLS NWD: cannot write down.")
+
+
+def _save_grade(db, tx, ref, course_id, value, username, when):
+    gid = db.grade_by_key.get((ref, course_id))
+    if gid is not None:
+        db.update_grade(tx, gid, value, username, when)
+    else:
+        db.insert_grade(tx, ref, course_id, value, username, when)
+
+
+@procedure
+def EnterOrUpdateGrade(db, conn, Username, StudentEmail, CourseID, GradeValue):
+    role, clr, _ = _user_identity(db, conn, Username)
+    _check_grade_writer(role, clr)
+    value = _decimal_5_2(GradeValue)
+
+    ref = db.student_ref(StudentEmail)
+    if ref is None:
+        _throw(50025, "Student not found.")
+
+    _save_grade(db, conn.tx, ref, CourseID, value, Username, _now())
+
+
+@procedure
+def BulkEnterOrUpdateGrade(db, conn, Username, Grades):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if role is None or _not_in(role, ("Admin", "Instructor")):
+        _throw(50008, "Only Admin/Instructor can edit grades.")
+    if _lt(clr, 3):
+        _throw(50009, "MLS NRU: clearance < Secret.")
+    if _gt(clr, 3) and _ne(role, "Admin"):
+        _throw(50010, "MLS NWD: cannot write down.")
+
+    batch = sorted(
+        (int(row_no), email, db.student_ref(email), int(course_id), _decimal_5_2(value))
+        for row_no, email, course_id, value in Grades
+    )
+
+    errors = {}
+    last_line = {}
+    for row_no, email, ref, course_id, _ in batch:
+        if ref is None:
+            errors[row_no] = "Student not found."
+        elif course_id not in db.courses:
+            errors[row_no] = "Course not found."
+        else:
+            last_line[(ref, course_id)] = row_no
+
+    # the same student/course twice in one batch: the last line wins
+    for row_no, email, ref, course_id, _ in batch:
+        if row_no not in errors and last_line[(ref, course_id)] != row_no:
+            errors[row_no] = "Superseded by a later line for the same student/course."
+
+    when = _now()
+    for row_no, email, ref, course_id, value in batch:
+        if row_no not in errors:
+            _save_grade(db, conn.tx, ref, course_id, value, Username, when)
+
+    return (
+        ("RowNo", "StudentEmail", "Error"),
+        [(row_no, email, errors[row_no]) for row_no, email, *_ in batch if row_no in errors],
+    )
+
+
+@procedure
+def ViewGrades(db, conn, Username, StudentEmail):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if _not_in(role, ("Admin", "Instructor")):
+        _throw(50011, "Only Admin/Instructor can view grades.")
+    if _lt(clr, 3):
+        _throw(50012, "MLS NRU: clearance < Secret.")
+
+    ref = db.student_ref(StudentEmail)
+    if ref is None:
+        _throw(50025, "Student not found.")
+
+    student_id = db.students[ref]["StudentID"]
+    return (
+        ("GradeID", "StudentID", "CourseID", "GradeValue", "DateEntered", "EnteredBy"),
+        [
+            (g["GradeID"], student_id, g["CourseID"], g["GradeValue"], g["DateEntered"], g["EnteredBy"])
+            for g in db.grades.values() if g["StudentRefID"] == ref
+        ],
+    )
+
+
+@procedure
+def CourseGradebook(db, conn, Username, CourseID):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if role is None or _not_in(role, ("Admin", "Instructor")):
+        _throw(50011, "Only Admin/Instructor can view grades.")
+    if _lt(clr, 3):
+        _throw(50012, "MLS NRU: clearance < Secret.")
+    if CourseID not in db.courses:
+        _throw(50061, "Course not found.")
+
+    rows = []
+    for g in db.grades.values():
+        if g["CourseID"] == CourseID:
+            s = db.students[g["StudentRefID"]]
+            rows.append((s["StudentID"], s["FullName"], s["Email"], s["Department"],
+                         g["GradeValue"], g["DateEntered"], g["EnteredBy"]))
+    rows.sort(key=lambda r: (_key(r[1]), _key(r[2])))
+    return ("StudentID", "FullName", "Email", "Department", "GradeValue", "DateEntered", "EnteredBy"), rows
+
+
+# =========================
+# Attendance
+# =========================
+def _check_attendance_writer(role, clr, unknown_denied=False):
+    if (unknown_denied and role is None) or _not_in(role, ("Admin", "Instructor", "TA")):
+        _throw(50013, "Only Admin/Instructor/TA can edit attendance.")
+    if _lt(clr, 3):
+        _throw(50014, "MLS NRU: clearance < Secret.")
+    if _gt(clr, 3):
+        _throw(50015, "MLS NWD: cannot write down.")
+
+
+@procedure
+def RecordAttendance(db, conn, Username, StudentEmail, CourseID, Status):
+    role, clr, _ = _user_identity(db, conn, Username)
+    _check_attendance_writer(role, clr)
+
+    ref = db.student_ref(StudentEmail)
+    if ref is None:
+        _throw(50025, "Student not found.")
+
+    db.insert_attendance(conn.tx, ref, CourseID, _bit(Status), _now(), Username)
+
+
+@procedure
+def ListStudentRoster(db, conn, Username, CourseID, Department=None):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if role is None or _not_in(role, ("Admin", "Instructor", "TA")):
+        _throw(50013, "Only Admin/Instructor/TA can edit attendance.")
+    if _lt(clr, 3):
+        _throw(50014, "MLS NRU: clearance < Secret.")
+    if CourseID not in db.courses:
+        _throw(50061, "Course not found.")
+
+    # graded in the course or has attendance in it; else everyone (first lecture)
+    refs = {ref for ref, course in db.grade_by_key if course == CourseID}
+    refs.update(a["StudentRefID"] for a in db.attendance.values() if a["CourseID"] == CourseID)
+    in_course = bool(refs)
+    students = [db.students[ref] for ref in refs] if in_course else list(db.students.values())
+    if Department is not None:
+        students = [s for s in students if _eq(s["Department"], Department)]
+    students.sort(key=lambda s: (_key(s["FullName"]), _key(s["Email"])))
+    return (
+        ("Email", "FullName", "Department", "InCourse"),
+        [(s["Email"], s["FullName"], s["Department"], in_course) for s in students],
+    )
+
+
+@procedure
+def RecordAttendanceBatch(db, conn, Username, CourseID, Roster):
+    role, clr, _ = _user_identity(db, conn, Username)
+    _check_attendance_writer(role, clr, unknown_denied=True)
+    if CourseID not in db.courses:
+        _throw(50061, "Course not found.")
+
+    roster = {}
+    for email, status in Roster:
+        if _key(email) in roster:
+            raise IntegrityError(
+                "23000",
+                "[23000] Violation of PRIMARY KEY constraint. Cannot insert duplicate key in object "
+                f"'@Roster'. The duplicate key value is ({email}). (2627)"
+            )
+        roster[_key(email)] = (email, _bit(status))
+
+    when = _now()
+    results = []
+    for k in sorted(roster):
+        email, status = roster[k]
+        ref = db.student_ref(email)
+        if ref is None:
+            results.append((email, "Student not found"))
+        else:
+            db.insert_attendance(conn.tx, ref, CourseID, status, when, Username)
+            results.append((email, "Recorded"))
+
+    return ("StudentEmail", "Result"), results
+
+
+@procedure
+def ViewAttendance(db, conn, Username):
+    role, clr, me = _user_identity(db, conn, Username)
+    if _lt(clr, 3) and _ne(role, "Student"):
+        _throw(50016, "MLS NRU: clearance < Secret.")
+
+    if _in(role, ("Admin", "Instructor", "TA")):
+        return (
+            ("AttendanceID", "StudentID", "CourseID", "Status", "DateRecorded", "RecordedBy"),
+            [
+                (a["AttendanceID"], db.students[a["StudentRefID"]]["StudentID"], a["CourseID"],
+                 a["Status"], a["DateRecorded"], a["RecordedBy"])
+                for a in db.attendance.values()
+            ],
+        )
+
+    if _eq(role, "Student"):
+        ref = me
+        if ref is None:
+            _throw(50017, "Student record not found.")
+        student_id = db.students[ref]["StudentID"]
+        return (
+            ("AttendanceID", "StudentID", "CourseID", "Status", "DateRecorded"),
+            [
+                (a["AttendanceID"], student_id, a["CourseID"], a["Status"], a["DateRecorded"])
+                for a in (db.attendance[aid] for _, aid in db.attendance_by_student.get(ref, []))
+            ],
+        )
+
+    _throw(50018, "Access denied.")
+
+
+@procedure
+def ViewAttendancePage(db, conn, Username, PageSize=100, AfterDate=None, AfterID=None,
+                       CourseID=None, FromDate=None, ToDate=None):
+    role, clr, me = _user_identity(db, conn, Username)
+    if role is None or _not_in(role, ("Admin", "Instructor", "TA", "Student")):
+        _throw(50018, "Access denied.")
+    if _lt(clr, 3) and _ne(role, "Student"):
+        _throw(50016, "MLS NRU: clearance < Secret.")
+    if PageSize is None or not 1 <= PageSize <= 1000:
+        _throw(50060, "Page size must be between 1 and 1000.")
+
+    index = db.attendance_order
+    if _eq(role, "Student"):
+        ref = me
+        if ref is None:
+            _throw(50017, "Student record not found.")
+        index = db.attendance_by_student.get(ref, [])
+
+    AfterDate, FromDate, ToDate = _datetime(AfterDate), _datetime(FromDate), _datetime(ToDate)
+
+    # walk the (DateRecorded, AttendanceID) index backwards from the keyset position
+    if AfterDate is None:
+        end = len(index)
+    elif AfterID is None:
+        end = bisect.bisect_left(index, (AfterDate,))
+    else:
+        end = bisect.bisect_left(index, (AfterDate, AfterID))
+    if ToDate is not None:
+        end = min(end, bisect.bisect_left(index, (ToDate,)))
+
+    rows = []
+    for i in range(end - 1, -1, -1):
+        when, aid = index[i]
+        if FromDate is not None and when < FromDate:
+            break
+        a = db.attendance[aid]
+        if CourseID is not None and a["CourseID"] != CourseID:
+            continue
+        rows.append((
+            aid,
+            db.students[a["StudentRefID"]]["StudentID"],
+            a["CourseID"],
+            a["Status"],
+            when,
+            None if _eq(role, "Student") else a["RecordedBy"],
+        ))
+        if len(rows) == PageSize:
+            break
+
+    return ("AttendanceID", "StudentID", "CourseID", "Status", "DateRecorded", "RecordedBy"), rows
+
+
+# =========================
+# Admin
+# =========================
+@procedure
+def RebuildAttendanceWeekly(db, conn, AdminUser):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if role is None or _ne(role, "Admin"):
+        _throw(50001, "Admin only.")
+    db.attendance_weekly.clear()
+    for a in db.attendance.values():
+        db._attendance_changed(AUTOCOMMIT, a["StudentRefID"], a["CourseID"], a["DateRecorded"], a["Status"])
+
+
+_WEEKLY_COLUMNS = ("Email", "FullName", "CourseID", "WeekStart", "PresentCount", "AbsentCount")
+
+
+def _weekly_rows(db, keys):
+    for course_id, ref, week in keys:
+        s = db.students[ref]
+        present, absent = db.attendance_weekly[(course_id, ref, week)]
+        yield (s["Email"], s["FullName"], course_id, week, present, absent)
+
+
+@procedure
+def AttendanceWeekly(db, conn, Username, CourseID=None):
+    role, clr, me = _user_identity(db, conn, Username)
+    if role is None or _not_in(role, ("Admin", "Instructor", "TA", "Student")):
+        _throw(50018, "Access denied.")
+    if _lt(clr, 3) and _ne(role, "Student"):
+        _throw(50016, "MLS NRU: clearance < Secret.")
+
+    if _eq(role, "Student"):
+        if me is None:
+            _throw(50017, "Student record not found.")
+        keys = sorted(
+            (c, ref, week) for c, ref, week in db.attendance_weekly
+            if ref == me and (CourseID is None or c == CourseID)
+        )
+        return _WEEKLY_COLUMNS, list(_weekly_rows(db, keys))
+
+    if CourseID is None or CourseID not in db.courses:
+        _throw(50061, "Course not found.")
+    keys = sorted(
+        ((c, ref, week) for c, ref, week in db.attendance_weekly if c == CourseID),
+        key=lambda k: (_key(db.students[k[1]]["Email"]), k[2])
+    )
+    return _WEEKLY_COLUMNS, list(_weekly_rows(db, keys))
+
+
+@procedure
+def UpdateUserRole(db, conn, AdminUser, TargetUser, NewRole, NewClearance):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if _ne(role, "Admin"):
+        _throw(50019, "Admin only.")
+
+    user = db.users.get(_key(TargetUser))
+    if user is not None:
+        _check_user(NewRole, NewClearance)
+        db.update_row(conn.tx, user, RoleName=NewRole, ClearanceLevel=NewClearance)
+
+
+@procedure
+def GradeDistributionByDepartment(db, conn, Username):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if _not_in(role, ("Admin", "Instructor")):
+        _throw(50020, "Access denied.")
+    if _lt(clr, 3):
+        _throw(50021, "MLS NRU.")
+
+    shown = {k: a for k, a in db.dept_grade_agg.items() if a["GradeCount"] and a["StudentCount"] >= 3}
+    rows = []
+    for g in db.grades.values():
+        agg = shown.get(_key(db.students[g["StudentRefID"]]["Department"]))
+        if agg is not None:
+            rows.append((agg["Department"], agg["StudentCount"], g["GradeValue"]))
+    rows += [
+        (a["Department"], a["StudentCount"], None)
+        for a in db.dept_grade_agg.values() if a["GradeCount"] and a["StudentCount"] < 3
+    ]
+    rows.sort(key=lambda r: _key(r[0]))
+    return ("Department", "GroupSize", "GradeValue"), rows
+
+
+@procedure
+def RebuildDeptGradeAgg(db, conn, AdminUser):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if role is None or _ne(role, "Admin"):
+        _throw(50001, "Admin only.")
+    db.dept_grade_agg.clear()
+    db.grades_per_student.clear()
+    for g in db.grades.values():
+        db._grade_changed(AUTOCOMMIT, g["StudentRefID"], g["GradeValue"], 1)
+
+
+@procedure
+def AvgGradeByDepartment(db, conn, Username, Department):
+    role, clr, _ = _user_identity(db, conn, Username)
+    if _not_in(role, ("Admin", "Instructor")):
+        _throw(50020, "Access denied.")
+    if _lt(clr, 3):
+        _throw(50021, "MLS NRU.")
+
+    agg = db.dept_grade_agg.get(_key(Department)) if Department is not None else None
+    if agg is None or agg["StudentCount"] < 3:
+        _throw(50022, "Inference Control: group size < 3.")
+
+    avg = (agg["GradeSum"] / agg["GradeCount"]).quantize(Decimal("0.000001"), rounding=ROUND_HALF_UP)
+    return ("Department", "AvgGrade", "GroupSize"), [(agg["Department"], avg, agg["StudentCount"])]
+
+
+# =========================
+# Role requests (Part B)
+# =========================
+_REQUEST_COLUMNS = ("RequestID", "Username", "CurrentRole", "RequestedRole", "Reason", "DateSubmitted", "Status")
+
+
+@procedure
+def SubmitRoleUpgradeRequest(db, conn, Username, RequestedRole, Reason):
+    current_role, _, _ = db.identity(Username)
+    if current_role is None:
+        _throw(50050, "User not found in dbo.Users (cannot determine CurrentRole).")
+    db.insert_role_request(conn.tx, Username, current_role, RequestedRole, Reason, _now())
+
+
+@procedure
+def ListPendingRoleRequests(db, conn, AdminUser, PageSize=None, AfterID=None):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if _ne(role, "Admin"):
+        _throw(50031, "Admin only.")
+    if PageSize is not None and not 1 <= PageSize <= 1000:
+        _throw(50060, "Page size must be between 1 and 1000.")
+
+    # role_requests is filled in RequestID order
+    pending = (
+        r for r in db.role_requests.values()
+        if r["Status"] == "Pending" and (AfterID is None or r["RequestID"] > AfterID)
+    )
+    if PageSize is not None:
+        pending = islice(pending, PageSize)
+    return _REQUEST_COLUMNS, [tuple(r[c] for c in _REQUEST_COLUMNS) for r in pending]
+
+
+@procedure
+def ResolveRoleRequest(db, conn, AdminUser, RequestID, Action, NewClearance=None):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if _ne(role, "Admin"):
+        _throw(50032, "Admin only.")
+
+    request = db.role_requests.get(RequestID)
+    if request is not None and _ne(request["Status"], "Pending"):
+        _throw(50033, "Already resolved.")
+
+    if _eq(Action, "Approve"):
+        if request is not None:
+            user = db.users.get(_key(request["Username"]))
+            if user is not None:
+                clearance = NewClearance if NewClearance is not None else user["ClearanceLevel"]
+                _check_user(request["RequestedRole"], clearance)
+                db.update_row(conn.tx, user, RoleName=request["RequestedRole"], ClearanceLevel=clearance)
+            db.update_row(conn.tx, request, Status="Approved", DateResolved=_now(), ResolvedBy=AdminUser)
+    elif _eq(Action, "Deny"):
+        if request is not None:
+            db.update_row(conn.tx, request, Status="Denied", DateResolved=_now(), ResolvedBy=AdminUser)
+    else:
+        _throw(50034, "Invalid action.")
+
+
+@procedure
+def BulkResolveRoleRequests(db, conn, AdminUser, Decisions):
+    role, _, _ = _user_identity(db, conn, AdminUser)
+    if role is None or _ne(role, "Admin"):
+        _throw(50032, "Admin only.")
+
+    decisions = {}
+    for request_id, action, new_clearance in Decisions:
+        if request_id in decisions:
+            raise IntegrityError(
+                "23000",
+                "[23000] Violation of PRIMARY KEY constraint. Cannot insert duplicate key in object "
+                f"'@Decisions'. The duplicate key value is ({request_id}). (2627)"
+            )
+        decisions[request_id] = (action, new_clearance)
+
+    results = []
+    approvals = {}   # key(Username) -> (RequestID, request, NewClearance), newest wins
+    when = _now()
+    for request_id in sorted(decisions):
+        action, new_clearance = decisions[request_id]
+        request = db.role_requests.get(request_id)
+        if request is None:
+            results.append((request_id, "Request not found"))
+        elif _ne(request["Status"], "Pending"):
+            results.append((request_id, "Already resolved"))
+        elif _not_in(action, ("Approve", "Deny")):
+            results.append((request_id, "Invalid action"))
+        else:
+            outcome = "Approved" if _eq(action, "Approve") else "Denied"
+            if outcome == "Approved":
+                approvals[_key(request["Username"])] = (request, new_clearance)
+            db.update_row(conn.tx, request, Status=outcome, DateResolved=when, ResolvedBy=AdminUser)
+            results.append((request_id, outcome))
+
+    for username, (request, new_clearance) in approvals.items():
+        user = db.users.get(username)
+        if user is not None:
+            clearance = new_clearance if new_clearance is not None else user["ClearanceLevel"]
+            _check_user(request["RequestedRole"], clearance)
+            db.update_row(conn.tx, user, RoleName=request["RequestedRole"], ClearanceLevel=clearance)
+
+    return ("RequestID", "Result"), results
+
+
+# =====================================================
+# DB-API surface
+# =====================================================
+_EXEC = re.compile(r"^\s*EXEC(?:UTE)?\s+(?:dbo\.)?\[?(\w+)\]?\s*(.*?)\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+_SELECT_1 = re.compile(r"^\s*SELECT\s+1\s*;?\s*$", re.IGNORECASE)
+
+_row_types = {}
+
+
+def _row_type(columns):
+    row_type = _row_types.get(columns)
+    if row_type is None:
+        row_type = _row_types[columns] = namedtuple("Row", columns)
+    return row_type
+
+
+class Cursor:
+    arraysize = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self._rows = []
+        self._pos = 0
+
+    def execute(self, sql, *params):
+        if len(params) == 1 and isinstance(params[0], tuple) and sql.count("?") > 1:
+            params = params[0]
+
+        self.description = None
+        self._rows = []
+        self._pos = 0
+        self.rowcount = -1
+
+        if _SELECT_1.match(sql):
+            self._set_result(("",), [(1,)])
+            return self
+
+        match = _EXEC.match(sql)
+        if not match:
+            raise ProgrammingError("42000", f"[42000] Unsupported statement for the memory backend: {sql!r}")
+
+        name, args = match.groups()
+        proc = PROCEDURES.get(_key(name))
+        if proc is None:
+            raise ProgrammingError("42000", f"[42000] Could not find stored procedure '{name}'. (2812)")
+
+        markers = args.count("?")
+        if markers != len(params):
+            raise ProgrammingError(
+                "07002",
+                f"The SQL contains {markers} parameter markers, but {len(params)} parameters were supplied"
+            )
+
+        db = self.connection.database
+        tx = self.connection.tx
+        with db.lock:
+            mark = tx.mark()
+            try:
+                result = proc(db, self.connection, *params)
+            except TypeError as e:
+                tx.rollback(mark)
+                raise ProgrammingError("42000", f"[42000] {name}: {e} (8144)") from None
+            except Error:
+                # a failed procedure leaves nothing behind (XACT_ABORT)
+                tx.rollback(mark)
+                raise
+
+        if result is not None:
+            self._set_result(*result)
+        return self
+
+    def _set_result(self, columns, rows):
+        columns = tuple(columns)
+        self.description = [(c, None, None, None, None, None, True) for c in columns]
+        row_type = _row_type(tuple(c or f"column{i}" for i, c in enumerate(columns)))
+        self._rows = [row_type._make(r) for r in rows]
+        self.rowcount = len(self._rows)
+
+    def fetchone(self):
+        if self._pos >= len(self._rows):
+            return None
+        self._pos += 1
+        return self._rows[self._pos - 1]
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        rows = self._rows[self._pos:self._pos + size]
+        self._pos += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._rows[self._pos:]
+        self._pos = len(self._rows)
+        return rows
+
+    def nextset(self):
+        return False
+
+    def close(self):
+        self._rows = []
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+
+class Connection:
+    def __init__(self, database):
+        self.database = database
+        self.tx = _Transaction()
+        self.context = {}   # SESSION_CONTEXT
+        self.closed = False
+
+    def cursor(self):
+        if self.closed:
+            raise OperationalError("08003", "[08003] The connection is closed.")
+        return Cursor(self)
+
+    def commit(self):
+        self.tx.commit()
+
+    def rollback(self):
+        with self.database.lock:
+            self.tx.rollback()
+
+    def close(self):
+        if not self.closed:
+            self.rollback()
+            self.closed = True
+
+
+_default_database = None
+_default_lock = threading.Lock()
+
+
+def default_database():
+    """The process-wide database every connect() without a database uses."""
+    global _default_database
+    with _default_lock:
+        if _default_database is None:
+            _default_database = MemoryDatabase()
+        return _default_database
+
+
+def connect(connection_string=None, database=None, **kwargs):
+    """Same call shape as pyodbc.connect(); the connection string is ignored."""
+    return Connection(database or default_database())
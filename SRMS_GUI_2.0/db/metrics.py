@@ -0,0 +1,186 @@
+import bisect
+import json
+import math
+import re
+import threading
+from datetime import datetime, date
+from decimal import Decimal
+
+# =========================
+# Histogram settings
+# =========================
+MIN_MS = 0.01        # first bucket bound
+GROWTH = 1.1         # each bucket is 10% wider than the last (~10% error on percentiles)
+MAX_MS = 600_000.0   # anything slower lands in the last bucket
+
+_BOUNDS = [MIN_MS * GROWTH ** i for i in range(int(math.log(MAX_MS / MIN_MS, GROWTH)) + 2)]
+
+PERCENTILES = (0.50, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """
+    Fixed log-scale buckets: constant memory however many calls are
+    recorded, percentiles accurate to one bucket (about 10%).
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_left(_BOUNDS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        if not self.count:
+            return 0.0
+        rank = math.ceil(q * self.count)
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                upper = _BOUNDS[i] if i < len(_BOUNDS) else self.max_ms
+                return min(upper, self.max_ms)
+        return self.max_ms
+
+    def mean(self):
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class CallStats:
+    """Everything recorded for one (procedure, role) pair."""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.last_error = None
+        self.rows = 0
+        self.bytes = 0
+        self.total = LatencyHistogram()
+        self.connect = LatencyHistogram()
+        self.execute = LatencyHistogram()
+        self.fetch = LatencyHistogram()
+
+    def as_dict(self):
+        result = {
+            "calls": self.calls,
+            "errors": self.errors,
+            "last_error": self.last_error,
+            "rows": self.rows,
+            "bytes": self.bytes,
+        }
+        for q in PERCENTILES:
+            result[f"p{round(q * 100)}_ms"] = round(self.total.percentile(q), 3)
+        result["max_ms"] = round(self.total.max_ms, 3)
+        for phase in ("connect", "execute", "fetch"):
+            result[f"avg_{phase}_ms"] = round(getattr(self, phase).mean(), 3)
+        return result
+
+
+# =====================================================
+# Registry
+# =====================================================
+_lock = threading.Lock()
+_stats = {}         # (procedure, role) -> CallStats
+_roles = {}         # username (lowercase) -> role, filled in at login
+_started = datetime.now()
+
+_PROC_NAME = re.compile(r"^\s*EXEC(?:UTE)?\s+(?:dbo\.)?\[?(\w+)", re.IGNORECASE)
+
+
+def procedure_name(sql):
+    match = _PROC_NAME.match(sql)
+    return match.group(1) if match else sql.split(None, 1)[0].upper()
+
+
+def register_user(username, role):
+    """Remembers a logged-in user's role so their calls are grouped by it."""
+    with _lock:
+        _roles[username.lower()] = role
+
+
+def role_for(params):
+    # every procedure takes the acting user as its first parameter
+    if params and isinstance(params[0], str):
+        return _roles.get(params[0].lower(), "-")
+    return "-"
+
+
+def row_bytes(row):
+    """Approximate wire size of a row (NVARCHAR = 2 bytes per character)."""
+    size = 0
+    for value in row:
+        if value is None:
+            continue
+        if isinstance(value, str):
+            size += 2 * len(value)
+        elif isinstance(value, (bytes, bytearray)):
+            size += len(value)
+        elif isinstance(value, bool):
+            size += 1
+        elif isinstance(value, (datetime, float)):
+            size += 8
+        elif isinstance(value, date):
+            size += 3
+        elif isinstance(value, Decimal):
+            size += 9
+        else:
+            size += 4
+    return size
+
+
+def record(procedure, role, rows=0, nbytes=0, connect_s=0.0, execute_s=0.0,
+           fetch_s=0.0, error=None):
+    with _lock:
+        stats = _stats.get((procedure, role))
+        if stats is None:
+            stats = _stats[(procedure, role)] = CallStats()
+
+        stats.calls += 1
+        stats.rows += rows
+        stats.bytes += nbytes
+        if error is not None:
+            stats.errors += 1
+            stats.last_error = str(error)
+
+        stats.connect.add(connect_s * 1000)
+        stats.execute.add(execute_s * 1000)
+        stats.fetch.add(fetch_s * 1000)
+        stats.total.add((connect_s + execute_s + fetch_s) * 1000)
+
+
+def snapshot():
+    """One dict per (procedure, role), slowest p95 first."""
+    with _lock:
+        result = [
+            dict(procedure=procedure, role=role, **stats.as_dict())
+            for (procedure, role), stats in _stats.items()
+        ]
+    result.sort(key=lambda r: r["p95_ms"], reverse=True)
+    return result
+
+
+def reset():
+    global _started
+    with _lock:
+        _stats.clear()
+        _started = datetime.now()
+
+
+def dump(path):
+    """Writes the current snapshot to path as JSON."""
+    from db.connection import pool_stats
+
+    report = {
+        "since": _started.isoformat(timespec="seconds"),
+        "written": datetime.now().isoformat(timespec="seconds"),
+        "pool": pool_stats(),
+        "procedures": snapshot(),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
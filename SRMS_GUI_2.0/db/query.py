@@ -0,0 +1,153 @@
+import time
+from contextlib import nullcontext
+
+from db import metrics
+from db.connection import connection
+
+FETCH_BATCH_SIZE = 500
+
+
+def _row_builder(cursor, record_type):
+    # map result columns to record fields by name; missing columns -> None
+    columns = [c[0] for c in cursor.description]
+    positions = [columns.index(f) if f in columns else None for f in record_type._fields]
+
+    def build(row):
+        return record_type._make(row[i] if i is not None else None for i in positions)
+
+    return build
+
+
+def _checkout(params, conn):
+    # every procedure takes the acting user as its first parameter
+    if conn is not None:
+        return nullcontext(conn)
+    return connection(params[0] if params and isinstance(params[0], str) else None)
+
+
+class _Call:
+    """
+    Times one statement (connect / execute / fetch) and counts the rows
+    and bytes it returned. The numbers go to db.metrics when it ends.
+    """
+
+    def __init__(self, sql, params):
+        self.procedure = metrics.procedure_name(sql)
+        self.role = metrics.role_for(params)
+        self.rows = 0
+        self.bytes = 0
+        self.connect_s = 0.0
+        self.execute_s = 0.0
+        self.fetch_s = 0.0
+        self.error = None
+        self._mark = time.perf_counter()
+
+    def lap(self):
+        now = time.perf_counter()
+        elapsed = now - self._mark
+        self._mark = now
+        return elapsed
+
+    def fail(self, error):
+        self.error = error
+        self.execute_s += self.lap()  # a failed call is charged to execute
+
+    def count(self, rows):
+        self.rows += len(rows)
+        self.bytes += sum(metrics.row_bytes(r) for r in rows)
+
+    def done(self):
+        metrics.record(
+            self.procedure, self.role, self.rows, self.bytes,
+            self.connect_s, self.execute_s, self.fetch_s, self.error
+        )
+
+
+def stream(record_type, sql, *params, batch_size=FETCH_BATCH_SIZE):
+    """
+    Runs sql and yields record_type rows, fetching batch_size rows at a time.
+    The connection is given back once the generator is exhausted
+    or closed, so consume it (or close it) promptly.
+    """
+    call = _Call(sql, params)
+    try:
+        with _checkout(params, None) as conn:
+            call.connect_s = call.lap()
+            cursor = conn.cursor()
+            cursor.execute(sql, *params)
+            call.execute_s = call.lap()
+            if cursor.description is None:
+                return
+
+            build = _row_builder(cursor, record_type)
+            while True:
+                call.lap()  # time spent in the consumer is not fetch time
+                rows = cursor.fetchmany(batch_size)
+                call.fetch_s += call.lap()
+                if not rows:
+                    return
+                call.count(rows)
+                for row in rows:
+                    yield build(row)
+    except Exception as e:
+        call.fail(e)
+        raise
+    finally:
+        call.done()
+
+
+def fetch_all(record_type, sql, *params):
+    return list(stream(record_type, sql, *params))
+
+
+def fetch_one(record_type, sql, *params, conn=None):
+    """Runs sql and returns its first row, or None. conn overrides the checkout."""
+    call = _Call(sql, params)
+    try:
+        with _checkout(params, conn) as conn:
+            call.connect_s = call.lap()
+            cursor = conn.cursor()
+            cursor.execute(sql, *params)
+            call.execute_s = call.lap()
+            row = cursor.fetchone()
+            call.fetch_s = call.lap()
+            if not row:
+                return None
+            call.count([row])
+            return _row_builder(cursor, record_type)(row)
+    except Exception as e:
+        call.fail(e)
+        raise
+    finally:
+        call.done()
+
+
+def execute(sql, *params, record_type=None):
+    """
+    Runs a statement that changes data and commits it.
+    If record_type is given, the rows it returns are read before the commit.
+    """
+    call = _Call(sql, params)
+    try:
+        with _checkout(params, None) as conn:
+            call.connect_s = call.lap()
+            cursor = conn.cursor()
+            cursor.execute(sql, *params)
+            call.execute_s = call.lap()
+
+            rows = []
+            if record_type is not None and cursor.description is not None:
+                rows = cursor.fetchall()
+                call.count(rows)
+                build = _row_builder(cursor, record_type)
+                rows = [build(r) for r in rows]
+            call.fetch_s = call.lap()
+
+            conn.commit()
+            call.execute_s += call.lap()
+            return rows
+    except Exception as e:
+        call.fail(e)
+        raise
+    finally:
+        call.done()
@@ -0,0 +1,201 @@
+from itertools import islice
+from tkinter import simpledialog, messagebox, filedialog
+
+from services.profile_service import iter_profiles, save_own_profile
+from services.grade_service import save_grade, iter_grades, import_grades_csv
+from services.attendance_service import save_attendance
+from services.course_service import public_courses
+from services.inference_service import department_average
+from utils.background import run_in_background
+
+MAX_DIALOG_ROWS = 50  # a message box cannot show more than this usefully
+
+
+def _summarize(rows, fmt):
+    """
+    Formats at most MAX_DIALOG_ROWS rows of a (possibly streamed) result.
+    Runs in the worker thread; the rest of the stream is counted, not kept.
+    Returns (text, total_rows).
+    """
+    rows = iter(rows)
+    blocks = [fmt(r) for r in islice(rows, MAX_DIALOG_ROWS)]
+    total = len(blocks) + sum(1 for _ in rows)
+
+    text = "".join(block + "----------------------\n" for block in blocks)
+    if total > len(blocks):
+        text += f"... and {total - len(blocks)} more"
+    return text, total
+
+
+def _show_rows(parent, title, empty_text, result):
+    text, total = result
+    if not total:
+        messagebox.showinfo(title, empty_text, parent=parent)
+        return
+    messagebox.showinfo(title, text, parent=parent)
+
+
+# =========================
+# Profiles
+# =========================
+def view_profile(username, parent):
+    def fmt(r):
+        return (
+            f"Name: {r.FullName}\n"
+            f"Email: {r.Email}\n"
+            f"Department: {r.Department}\n"
+            f"Clearance: {r.ClearanceLevel}\n"
+        )
+
+    run_in_background(
+        parent,
+        lambda: _summarize(iter_profiles(username), fmt),
+        lambda result: _show_rows(parent, "My Profile", "No data found", result)
+    )
+
+
+def edit_own_profile(username, parent):
+    full_name = simpledialog.askstring("Edit Profile", "New Full Name:", parent=parent)
+
+    if not full_name:
+        return
+
+    run_in_background(
+        parent,
+        lambda: save_own_profile(username, full_name),
+        lambda _: messagebox.showinfo("Success", "Profile updated successfully", parent=parent)
+    )
+
+
+# =========================
+# Grades
+# =========================
+def enter_or_update_grade(username, parent):
+    student_email = simpledialog.askstring("Grade", "Student Email:", parent=parent)
+    course_id = simpledialog.askinteger("Grade", "Course ID:", parent=parent)
+    grade_value = simpledialog.askfloat("Grade", "Grade Value:", parent=parent)
+
+    if not student_email or not course_id or grade_value is None:
+        return
+
+    run_in_background(
+        parent,
+        lambda: save_grade(username, student_email, course_id, grade_value),
+        lambda _: messagebox.showinfo("Success", "Grade saved successfully", parent=parent)
+    )
+
+
+def view_grades(username, parent):
+    student_email = simpledialog.askstring("View Grades", "Student Email:", parent=parent)
+
+    if not student_email:
+        return
+
+    def fmt(r):
+        return (
+            f"Course ID: {r.CourseID}\n"
+            f"Grade: {r.GradeValue}\n"
+            f"Entered By: {r.EnteredBy}\n"
+            f"Date: {r.DateEntered}\n"
+        )
+
+    run_in_background(
+        parent,
+        lambda: _summarize(iter_grades(username, student_email), fmt),
+        lambda result: _show_rows(parent, "Grades", "No grades found", result)
+    )
+
+
+def import_grades(username, parent):
+    path = filedialog.askopenfilename(
+        parent=parent,
+        title="Grade CSV (StudentEmail, CourseID, GradeValue)",
+        filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+    )
+    if not path:
+        return
+
+    def show(result):
+        text = (
+            f"Rows: {result['rows']}\n"
+            f"Saved: {result['saved']}\n"
+            f"Errors: {len(result['errors'])}\n"
+            f"Throughput: {result['rows_per_sec']:.0f} rows/s"
+        )
+        if result["errors"]:
+            text += "\n\n" + "\n".join(
+                f"Line {line}: {email} - {error}"
+                for line, email, error in result["errors"][:20]
+            )
+            if len(result["errors"]) > 20:
+                text += f"\n... and {len(result['errors']) - 20} more"
+
+        messagebox.showinfo("Grade Import", text, parent=parent)
+
+    run_in_background(parent, lambda: import_grades_csv(username, path), show)
+
+
+# =========================
+# Attendance
+# =========================
+def record_attendance(username, parent):
+    student_email = simpledialog.askstring("Attendance", "Student Email:", parent=parent)
+    course_id = simpledialog.askinteger("Attendance", "Course ID:", parent=parent)
+    status = simpledialog.askinteger("Attendance", "Status (1 = Present, 0 = Absent)", parent=parent)
+
+    if not student_email or not course_id or status is None:
+        return
+
+    run_in_background(
+        parent,
+        lambda: save_attendance(username, student_email, course_id, status),
+        lambda _: messagebox.showinfo("Success", "Attendance recorded", parent=parent)
+    )
+
+
+# =========================
+# Courses
+# =========================
+def view_public_courses(username, parent):
+    def fmt(r):
+        return (
+            f"Course ID: {r.CourseID}\n"
+            f"Course Name: {r.CourseName}\n"
+            f"Info: {r.PublicInfo}\n"
+        )
+
+    run_in_background(
+        parent,
+        lambda: _summarize(public_courses(username), fmt),
+        lambda result: _show_rows(parent, "Public Courses", "No public courses available", result)
+    )
+
+
+# =========================
+# Inference
+# =========================
+def avg_grade_by_department(admin_user, parent):
+    dept = simpledialog.askstring("Inference", "Department Name:", parent=parent)
+
+    if not dept:
+        return
+
+    def show(row):
+        if not row:
+            messagebox.showinfo("Result", "No data", parent=parent)
+            return
+
+        result = (
+            f"Department: {row.Department}\n"
+            f"Average Grade: {row.AvgGrade}\n"
+            f"Group Size: {row.GroupSize}"
+        )
+
+        messagebox.showinfo("Inference Result", result, parent=parent)
+
+    run_in_background(
+        parent,
+        lambda: department_average(admin_user, dept),
+        show,
+        lambda e: messagebox.showerror("Inference Blocked", str(e), parent=parent)
+    )
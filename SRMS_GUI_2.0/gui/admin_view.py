@@ -1,16 +1,24 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import ttk, messagebox
 from utils.layout import create_section
+from utils.background import run_in_background
 
-from services.profile_service import view_profile, edit_own_profile
-from services.grade_service import enter_or_update_grade, view_grades
-from services.attendance_service import view_attendance
+from gui.actions import (
+    view_profile,
+    edit_own_profile,
+    enter_or_update_grade,
+    view_grades,
+    import_grades,
+    avg_grade_by_department
+)
+from gui.attendance_view import open_attendance_grid
+from gui.inference_view import open_department_report
+from gui.metrics_view import open_metrics_window, dump_metrics
 from services.role_request_service import (
     list_requests,
-    approve_request,
-    deny_request
+    resolve_requests,
+    REQUEST_PAGE_SIZE
 )
-from services.inference_service import avg_grade_by_department
 
 
 # =====================================================
@@ -19,7 +27,7 @@ from services.inference_service import avg_grade_by_department
 def open_admin(username):
     win = tk.Toplevel()
     win.title("Admin Dashboard")
-    win.geometry("550x600")
+    win.geometry("550x820")
 
     tk.Label(
         win,
@@ -34,13 +42,13 @@ def open_admin(username):
     tk.Button(
         profiles,
         text="View All Profiles",
-        command=lambda: view_profile(username)
+        command=lambda: view_profile(username, win)
     ).pack(fill="x", pady=4)
 
     tk.Button(
         profiles,
         text="Edit My Profile",
-        command=lambda: edit_own_profile(username)
+        command=lambda: edit_own_profile(username, win)
     ).pack(fill="x", pady=3)
 
     # =========================
@@ -50,13 +58,19 @@ def open_admin(username):
     tk.Button(
         grades,
         text="Enter / Update Grade",
-        command=lambda: enter_or_update_grade(username)
+        command=lambda: enter_or_update_grade(username, win)
     ).pack(fill="x", pady=4)
 
     tk.Button(
         grades,
         text="View Grades",
-        command=lambda: view_grades(username)
+        command=lambda: view_grades(username, win)
+    ).pack(fill="x", pady=4)
+
+    tk.Button(
+        grades,
+        text="Import Grades (CSV)",
+        command=lambda: import_grades(username, win)
     ).pack(fill="x", pady=4)
 
     # =========================
@@ -66,7 +80,7 @@ def open_admin(username):
     tk.Button(
         attendance,
         text="View Attendance",
-        command=lambda: view_attendance(username)
+        command=lambda: open_attendance_grid(username)
     ).pack(fill="x", pady=4)
 
     # =========================
@@ -86,89 +100,237 @@ def open_admin(username):
     tk.Button(
         inference,
         text="Average Grade by Department",
-        command=lambda: avg_grade_by_department(username)
+        command=lambda: avg_grade_by_department(username, win)
     ).pack(fill="x", pady=6)
 
+    tk.Button(
+        inference,
+        text="All Departments Report",
+        command=lambda: open_department_report(username)
+    ).pack(fill="x", pady=4)
+
+    # =========================
+    # Performance
+    # =========================
+    performance = create_section(win, "Performance")
+    tk.Button(
+        performance,
+        text="Procedure Latency (live)",
+        command=open_metrics_window
+    ).pack(fill="x", pady=4)
+
+    tk.Button(
+        performance,
+        text="Dump Metrics to File",
+        command=lambda: dump_metrics(win)
+    ).pack(fill="x", pady=4)
+
+    return win
+
 
 # =====================================================
 # Role Requests Management Window
+# Pending requests are paged in as the list scrolls; resolved ones are
+# removed in place and Refresh only asks for requests newer than the
+# newest one already shown. Approve/Deny apply to every selected row
+# in one call.
 # =====================================================
+REQUEST_COLUMNS = (
+    ("RequestID", "ID", 50),
+    ("Username", "User", 180),
+    ("CurrentRole", "Current Role", 100),
+    ("RequestedRole", "Requested", 100),
+    ("DateSubmitted", "Submitted", 150),
+)
+REQUEST_PREFETCH_AT = 0.9   # fetch the next page once scrolled past 90%
+REQUEST_REFRESH_MS = 30000  # poll for new submissions once everything is loaded
+
+
 def open_role_requests_window(admin_user):
     win = tk.Toplevel()
     win.title("Pending Role Requests")
     win.geometry("750x450")
+    RoleRequestQueue(win, admin_user)
 
-    tk.Label(
-        win,
-        text="Pending Role Upgrade Requests",
-        font=("Arial", 13, "bold")
-    ).pack(pady=10)
 
-    requests = list_requests(admin_user)
+class RoleRequestQueue:
+    def __init__(self, win, admin_user):
+        self.win = win
+        self.admin_user = admin_user
+
+        self.requests = {}       # RequestID -> RoleRequestRow (loaded, still pending)
+        self.last_id = None      # highest RequestID loaded: paging key and high watermark
+        self.exhausted = False
+        self.loading = False
+        self.resolving = set()   # RequestIDs with an Approve/Deny in flight
 
-    if not requests:
+        self.build()
+        self.load_more()
+        self.win.after(REQUEST_REFRESH_MS, self.poll)
+
+    def build(self):
         tk.Label(
-            win,
-            text="No pending role requests",
-            font=("Arial", 11)
-        ).pack(pady=20)
-        return
-
-    for req in requests:
-        frame = tk.Frame(win, bd=1, relief="solid", padx=8, pady=8)
-        frame.pack(fill="x", padx=10, pady=6)
-
-        info = (
-            f"User: {req['Username']}\n"
-            f"Current Role: {req['CurrentRole']} → Requested: {req['RequestedRole']}\n"
-            f"Reason: {req['Reason']}\n"
-            f"Date: {req['DateSubmitted']}"
+            self.win,
+            text="Pending Role Upgrade Requests",
+            font=("Arial", 13, "bold")
+        ).pack(pady=10)
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10)
+
+        self.tree = ttk.Treeview(
+            table, columns=[c[0] for c in REQUEST_COLUMNS], show="headings", selectmode="extended"
         )
+        for key, title, width in REQUEST_COLUMNS:
+            self.tree.heading(key, text=title)
+            self.tree.column(key, width=width, anchor="w")
+        self.tree.bind("<<TreeviewSelect>>", lambda e: self.show_reason())
+        self.tree.bind("<Control-a>", lambda e: self.tree.selection_set(self.tree.get_children()))
 
-        tk.Label(frame, text=info, justify="left").pack(side="left", expand=True)
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
 
-        btn_frame = tk.Frame(frame)
-        btn_frame.pack(side="right")
+        self.reason = tk.Label(self.win, anchor="w", justify="left", wraplength=720)
+        self.reason.pack(fill="x", padx=10, pady=(6, 0))
 
-        tk.Button(
-            btn_frame,
-            text="Approve",
-            width=10,
-            bg="#c8f7c5",
-            command=lambda r=req: approve_and_refresh(
-                admin_user, r["RequestID"], r["RequestedRole"], win
-            )
-        ).pack(pady=3)
-
-        tk.Button(
-            btn_frame,
-            text="Deny",
-            width=10,
-            bg="#f7c5c5",
-            command=lambda r=req: deny_and_refresh(
-                admin_user, r["RequestID"], win
+        bar = tk.Frame(self.win)
+        bar.pack(fill="x", padx=10, pady=8)
+
+        self.status = tk.Label(bar, anchor="w")
+        self.status.pack(side="left", fill="x", expand=True)
+
+        tk.Button(bar, text="Refresh", width=10, command=self.refresh).pack(side="right", padx=2)
+        tk.Button(bar, text="Deny", width=10, bg="#f7c5c5",
+                  command=lambda: self.resolve("Deny")).pack(side="right", padx=2)
+        tk.Button(bar, text="Approve", width=10, bg="#c8f7c5",
+                  command=lambda: self.resolve("Approve")).pack(side="right", padx=2)
+
+    # =========================
+    # Paging / new submissions
+    # =========================
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if float(last) >= REQUEST_PREFETCH_AT:
+            self.load_more()
+
+    def refresh(self):
+        self.exhausted = False
+        self.load_more()
+
+    def poll(self):
+        if not self.win.winfo_exists():
+            return
+        if self.exhausted:
+            self.refresh()
+        self.win.after(REQUEST_REFRESH_MS, self.poll)
+
+    def load_more(self):
+        if self.loading or self.exhausted:
+            return
+
+        self.loading = True
+        last_id = self.last_id
+        run_in_background(
+            self.win,
+            lambda: list_requests(self.admin_user, last_id, REQUEST_PAGE_SIZE),
+            self.append_page,
+            self.page_failed
+        )
+
+    def append_page(self, rows):
+        for r in rows:
+            self.requests[r.RequestID] = r
+            self.tree.insert(
+                "", "end", iid=str(r.RequestID),
+                values=(r.RequestID, r.Username, r.CurrentRole, r.RequestedRole, r.DateSubmitted)
             )
-        ).pack(pady=3)
 
+        if rows:
+            self.last_id = rows[-1].RequestID
+        self.exhausted = len(rows) < REQUEST_PAGE_SIZE
+        self.loading = False
+        self.update_status()
 
-# =====================================================
-# Helpers
-# =====================================================
-def approve_and_refresh(admin_user, request_id, requested_role, window):
-    try:
-        approve_request(admin_user, request_id, requested_role)
-        messagebox.showinfo("Success", "Request approved successfully")
-        window.destroy()
-        open_role_requests_window(admin_user)
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
-
-
-def deny_and_refresh(admin_user, request_id, window):
-    try:
-        deny_request(admin_user, request_id)
-        messagebox.showinfo("Success", "Request denied")
-        window.destroy()
-        open_role_requests_window(admin_user)
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+        if not self.exhausted:
+            self.win.after_idle(self.fill_view)
+
+    def page_failed(self, error):
+        self.loading = False
+        self.update_status()
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def fill_view(self):
+        # keep fetching until the visible area is full (or there is no more data)
+        if self.tree.yview()[1] >= REQUEST_PREFETCH_AT:
+            self.load_more()
+
+    def update_status(self, note=""):
+        count = len(self.requests)
+        text = f"{count} pending" if count else "No pending role requests"
+        if not self.exhausted:
+            text += " loaded - scroll for more"
+        self.status.config(text=f"{note}  {text}" if note else text)
+
+    def show_reason(self):
+        selected = self.tree.selection()
+        if len(selected) > 1:
+            self.reason.config(text=f"{len(selected)} requests selected")
+            return
+        request = self.requests.get(int(selected[0])) if selected else None
+        self.reason.config(text=f"Reason: {request.Reason}" if request else "")
+
+    # =========================
+    # Approve / Deny (rows are removed in place)
+    # =========================
+    def resolve(self, action):
+        batch = [
+            self.requests[int(iid)] for iid in self.tree.selection()
+            if int(iid) not in self.resolving
+        ]
+        if not batch:
+            messagebox.showwarning("Role Requests", "Select one or more requests first", parent=self.win)
+            return
+        if len(batch) > 1 and not messagebox.askyesno(
+            "Role Requests", f"{action} {len(batch)} requests?", parent=self.win
+        ):
+            return
+
+        ids = {r.RequestID for r in batch}
+        self.resolving |= ids
+        decisions = [(r.RequestID, action, r.RequestedRole) for r in batch]
+
+        run_in_background(
+            self.win,
+            lambda: resolve_requests(self.admin_user, decisions),
+            lambda outcomes: self.resolved(ids, outcomes),
+            lambda e: self.resolve_failed(ids, e)
+        )
+
+    def resolved(self, ids, outcomes):
+        self.resolving -= ids
+        counts = {}
+        for o in outcomes:
+            counts[o.Result] = counts.get(o.Result, 0) + 1
+            # rows that are no longer pending (resolved here or elsewhere) go away
+            if o.Result in ("Approved", "Denied", "Already resolved", "Request not found"):
+                self.remove(o.RequestID)
+        self.update_status(", ".join(f"{n} {result.lower()}" for result, n in counts.items()) + ".")
+
+    def resolve_failed(self, ids, error):
+        self.resolving -= ids
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def remove(self, request_id):
+        iid = str(request_id)
+        if not self.tree.exists(iid):
+            return
+        following = self.tree.next(iid) or self.tree.prev(iid)
+        self.tree.delete(iid)
+        self.requests.pop(request_id, None)
+        if following and not self.tree.selection():
+            self.tree.selection_set(following)
+            self.tree.see(following)
+        elif not self.tree.selection():
+            self.reason.config(text="")
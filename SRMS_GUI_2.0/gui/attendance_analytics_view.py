@@ -0,0 +1,211 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from services.attendance_analytics_service import (
+    attendance_summary,
+    AT_RISK_RATE,
+    AT_RISK_WEEKS,
+    RECENT_WEEKS
+)
+from utils.background import run_in_background
+
+SPARKS = "▁▂▃▄▅▆▇█"
+
+STAFF_COLUMNS = (
+    ("FullName", "Student", 160),
+    ("Email", "Email", 170),
+    ("Sessions", "Sessions", 65),
+    ("Rate", "Rate", 60),
+    ("Trend", "Trend / wk", 75),
+    ("PresentStreak", "Weeks present", 95),
+    ("AbsentStreak", "Weeks absent", 90),
+    ("Recent", f"Last {RECENT_WEEKS} weeks", 110),
+    ("AtRisk", "At risk", 60),
+)
+STUDENT_COLUMNS = (("CourseID", "Course", 70),) + STAFF_COLUMNS[2:]
+TEXT_COLUMNS = ("FullName", "Email")
+NUMERIC_COLUMNS = ("Sessions", "Rate", "Trend", "PresentStreak", "AbsentStreak", "CourseID")
+
+
+def _sparkline(rates):
+    """One block per week, scaled 0..100%; a dot for a week without a session."""
+    top = len(SPARKS) - 1
+    return "".join("·" if r is None else SPARKS[round(r * top)] for r in rates)
+
+
+def _cell(row, key):
+    value = getattr(row, key)
+    if key == "Rate":
+        return f"{value:.0%}"
+    if key == "Trend":
+        return "" if value is None else f"{value:+.0%}"
+    if key == "Recent":
+        return _sparkline(value)
+    if key == "AtRisk":
+        return "yes" if value else ""
+    return value
+
+
+# =====================================================
+# Attendance Analytics (served by the weekly rollup)
+# =====================================================
+def open_course_attendance_analytics(username):
+    win = tk.Toplevel()
+    win.title("Attendance Analytics")
+    win.geometry("940x500")
+    AttendanceAnalyticsWindow(win, username, STAFF_COLUMNS, by_course=True)
+
+
+def open_my_attendance_analytics(username):
+    win = tk.Toplevel()
+    win.title("My Attendance Analytics")
+    win.geometry("700x320")
+    window = AttendanceAnalyticsWindow(win, username, STUDENT_COLUMNS, by_course=False)
+    window.load()
+
+
+class AttendanceAnalyticsWindow:
+    def __init__(self, win, username, columns, by_course):
+        self.win = win
+        self.username = username
+        self.columns = columns
+        self.by_course = by_course
+        self.course_id = None
+        self.loaded = False
+        self.rows = []          # one AttendanceSummary per student (or course)
+        self.shown = []
+        self.sort_key = "Rate"
+        self.descending = False
+        self.build()
+        self.update_status()
+
+    def build(self):
+        bar = tk.Frame(self.win)
+        bar.pack(fill="x", padx=10, pady=8)
+
+        if self.by_course:
+            tk.Label(bar, text="Course ID").pack(side="left")
+            self.course_entry = tk.Entry(bar, width=8)
+            self.course_entry.pack(side="left", padx=(2, 5))
+            self.course_entry.bind("<Return>", lambda e: self.load())
+            tk.Button(bar, text="Load", command=self.load).pack(side="left")
+        else:
+            tk.Button(bar, text="Refresh", command=self.load).pack(side="left")
+
+        self.at_risk_only = tk.BooleanVar()
+        tk.Checkbutton(
+            bar, text="At risk only", variable=self.at_risk_only, command=self.render
+        ).pack(side="left", padx=(20, 0))
+
+        tk.Label(
+            bar, fg="gray",
+            text=f"At risk: rate under {AT_RISK_RATE:.0%} or absent {AT_RISK_WEEKS}+ weeks running"
+        ).pack(side="right")
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10)
+
+        self.tree = ttk.Treeview(table, columns=[c[0] for c in self.columns], show="headings")
+        for key, title, width in self.columns:
+            self.tree.heading(key, text=title, command=lambda k=key: self.sort_by(k))
+            self.tree.column(key, width=width, anchor="e" if key in NUMERIC_COLUMNS else "w")
+        self.tree.tag_configure("risk", foreground="firebrick")
+
+        scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.status = tk.Label(self.win, anchor="w")
+        self.status.pack(fill="x", padx=10, pady=4)
+
+    # =========================
+    # Loading (the only server call)
+    # =========================
+    def load(self):
+        course_id = None
+        if self.by_course:
+            try:
+                course_id = int(self.course_entry.get().strip())
+            except ValueError:
+                messagebox.showerror("Error", "Course ID must be a number", parent=self.win)
+                return
+
+        self.status.config(text="Loading...")
+        run_in_background(
+            self.win,
+            lambda: attendance_summary(self.username, course_id),
+            lambda rows: self.show(course_id, rows),
+            self.failed
+        )
+
+    def failed(self, error):
+        self.status.config(text="")
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def show(self, course_id, rows):
+        self.course_id = course_id
+        self.loaded = True
+        self.rows = rows
+        self.render()
+
+    # =========================
+    # Filter + sort (client side)
+    # =========================
+    def sort_by(self, key):
+        if key == self.sort_key:
+            self.descending = not self.descending
+        else:
+            self.sort_key, self.descending = key, key in ("PresentStreak", "AbsentStreak", "AtRisk")
+        self.render()
+
+    def render(self):
+        rows = [r for r in self.rows if r.AtRisk or not self.at_risk_only.get()]
+
+        key = self.sort_key
+        if key in TEXT_COLUMNS:
+            rows.sort(key=lambda r: getattr(r, key).casefold(), reverse=self.descending)
+        elif key == "Recent":
+            # by the latest week that had a session
+            rows.sort(key=lambda r: next((x for x in reversed(r.Recent) if x is not None), -1),
+                      reverse=self.descending)
+        else:
+            # missing trends always last
+            present = [r for r in rows if getattr(r, key) is not None]
+            present.sort(key=lambda r: getattr(r, key), reverse=self.descending)
+            rows = present + [r for r in rows if getattr(r, key) is None]
+        self.shown = rows
+
+        self.tree.delete(*self.tree.get_children())
+        for r in rows:
+            self.tree.insert(
+                "", "end",
+                values=[_cell(r, k) for k, _, _ in self.columns],
+                tags=("risk",) if r.AtRisk else ()
+            )
+
+        for k, title, _ in self.columns:
+            arrow = (" ▼" if self.descending else " ▲") if k == key else ""
+            self.tree.heading(k, text=title + arrow)
+
+        self.update_status()
+
+    def update_status(self):
+        if not self.loaded:
+            self.status.config(
+                text="Enter a course ID and press Load." if self.by_course else "Loading..."
+            )
+            return
+        if not self.rows:
+            self.status.config(text="No attendance recorded yet.")
+            return
+
+        sessions = sum(r.Sessions for r in self.rows)
+        present = sum(r.Present for r in self.rows)
+        at_risk = sum(r.AtRisk for r in self.rows)
+        what = f"Course {self.course_id}: {len(self.rows)} students" if self.by_course \
+            else f"{len(self.rows)} courses"
+        self.status.config(
+            text=f"{what}, {present} of {sessions} sessions attended ({present / sessions:.0%}), "
+                 f"{at_risk} at risk; showing {len(self.shown)}"
+        )
@@ -0,0 +1,199 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+from datetime import datetime, timedelta
+
+from services.attendance_service import fetch_attendance_page, iter_attendance, PAGE_SIZE
+from utils.background import run_in_background
+from utils.export import write_csv
+
+COLUMNS = ("AttendanceID", "StudentID", "CourseID", "Status", "Date", "RecordedBy")
+PREFETCH_AT = 0.9  # fetch the next page once the view is scrolled past 90%
+
+
+# =====================================================
+# Attendance Grid (pages are fetched while scrolling)
+# =====================================================
+def open_attendance_grid(username):
+    win = tk.Toplevel()
+    win.title("Attendance")
+    win.geometry("780x480")
+    AttendanceGrid(win, username)
+
+
+class AttendanceGrid:
+    def __init__(self, win, username):
+        self.win = win
+        self.username = username
+
+        self.after_key = None    # (DateRecorded, AttendanceID) of last loaded row
+        self.exhausted = False
+        self.loading = False
+        self.generation = 0      # bumped when filters change; stale pages are dropped
+        self.filters = {}
+        self.row_count = 0
+
+        self.build()
+        self.reload()
+
+    def build(self):
+        bar = tk.Frame(self.win)
+        bar.pack(fill="x", padx=10, pady=8)
+
+        tk.Label(bar, text="Course ID").pack(side="left")
+        self.course_entry = tk.Entry(bar, width=8)
+        self.course_entry.pack(side="left", padx=(2, 10))
+
+        tk.Label(bar, text="From (YYYY-MM-DD)").pack(side="left")
+        self.from_entry = tk.Entry(bar, width=11)
+        self.from_entry.pack(side="left", padx=(2, 10))
+
+        tk.Label(bar, text="To").pack(side="left")
+        self.to_entry = tk.Entry(bar, width=11)
+        self.to_entry.pack(side="left", padx=(2, 10))
+
+        tk.Button(bar, text="Apply", command=self.apply_filters).pack(side="left")
+        tk.Button(bar, text="Export CSV...", command=self.export_csv).pack(side="right")
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10)
+
+        self.tree = ttk.Treeview(table, columns=COLUMNS, show="headings")
+        for col in COLUMNS:
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=110)
+
+        self.scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.status = tk.Label(self.win, anchor="w")
+        self.status.pack(fill="x", padx=10, pady=4)
+
+    # =========================
+    # Filters
+    # =========================
+    def apply_filters(self):
+        try:
+            course = self.course_entry.get().strip()
+            date_from = self.from_entry.get().strip()
+            date_to = self.to_entry.get().strip()
+
+            self.filters = {
+                "course_id": int(course) if course else None,
+                "from_date": datetime.strptime(date_from, "%Y-%m-%d") if date_from else None,
+                # the To day is inclusive for the user, exclusive for the procedure
+                "to_date": (datetime.strptime(date_to, "%Y-%m-%d") + timedelta(days=1)
+                            if date_to else None),
+            }
+        except ValueError:
+            messagebox.showerror(
+                "Error",
+                "Course ID must be a number and dates must be YYYY-MM-DD",
+                parent=self.win
+            )
+            return
+
+        self.reload()
+
+    def reload(self):
+        self.generation += 1
+        self.after_key = None
+        self.exhausted = False
+        self.loading = False
+        self.row_count = 0
+        self.tree.delete(*self.tree.get_children())
+        self.load_more()
+
+    # =========================
+    # Paging
+    # =========================
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if float(last) >= PREFETCH_AT:
+            self.load_more()
+
+    def load_more(self):
+        if self.loading or self.exhausted:
+            return
+
+        self.loading = True
+        self.status.config(text=f"{self.row_count} rows loaded - loading...")
+
+        generation = self.generation
+        after_key = self.after_key
+        filters = dict(self.filters)
+
+        run_in_background(
+            self.win,
+            lambda: fetch_attendance_page(self.username, after_key, **filters),
+            lambda rows: self.append_page(generation, rows),
+            lambda e: self.page_failed(generation, e)
+        )
+
+    def append_page(self, generation, rows):
+        if generation != self.generation:
+            return
+
+        for r in rows:
+            self.tree.insert(
+                "", "end",
+                values=(
+                    r.AttendanceID,
+                    r.StudentID,
+                    r.CourseID,
+                    "Present" if r.Status else "Absent",
+                    r.DateRecorded,
+                    r.RecordedBy or ""
+                )
+            )
+
+        self.row_count += len(rows)
+        if rows:
+            self.after_key = (rows[-1].DateRecorded, rows[-1].AttendanceID)
+        if len(rows) < PAGE_SIZE:
+            self.exhausted = True
+        self.loading = False
+
+        if self.exhausted:
+            text = f"{self.row_count} rows" if self.row_count else "No attendance records"
+        else:
+            text = f"{self.row_count} rows loaded - scroll for more"
+            self.win.after_idle(self.fill_view)
+        self.status.config(text=text)
+
+    def page_failed(self, generation, error):
+        if generation != self.generation:
+            return
+        self.loading = False
+        self.status.config(text=f"{self.row_count} rows loaded")
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def fill_view(self):
+        # keep fetching until the visible area is full (or there is no more data)
+        if self.tree.yview()[1] >= PREFETCH_AT:
+            self.load_more()
+
+    # =========================
+    # Export
+    # =========================
+    def export_csv(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.win,
+            title="Export Attendance",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv")]
+        )
+        if not path:
+            return
+
+        # exports everything matching the current filters, not just the loaded rows
+        filters = dict(self.filters)
+        run_in_background(
+            self.win,
+            lambda: write_csv(path, iter_attendance(self.username, **filters)),
+            lambda count: messagebox.showinfo(
+                "Export", f"{count} rows written to\n{path}", parent=self.win
+            )
+        )
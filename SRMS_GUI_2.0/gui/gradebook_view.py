@@ -0,0 +1,197 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from services.grade_service import fetch_gradebook
+from utils.background import run_in_background
+from utils.export import write_csv
+
+COLUMNS = (
+    ("StudentID", "Student ID", 90),
+    ("FullName", "Name", 170),
+    ("Email", "Email", 190),
+    ("Department", "Department", 140),
+    ("GradeValue", "Grade", 60),
+    ("DateEntered", "Entered", 140),
+    ("EnteredBy", "By", 90),
+)
+TEXT_COLUMNS = ("StudentID", "FullName", "Email", "Department", "EnteredBy")
+
+
+# =====================================================
+# Course Gradebook (one call per course; sort/filter locally)
+# =====================================================
+def open_gradebook(username):
+    win = tk.Toplevel()
+    win.title("Course Gradebook")
+    win.geometry("920x520")
+    GradebookWindow(win, username)
+
+
+class GradebookWindow:
+    def __init__(self, win, username):
+        self.win = win
+        self.username = username
+        self.course_id = None
+        self.rows = []          # the whole course, as returned by CourseGradebook
+        self.shown = []         # rows after filter + sort
+        self.sort_key = "FullName"
+        self.descending = False
+        self.build()
+        self.update_status()
+
+    def build(self):
+        bar = tk.Frame(self.win)
+        bar.pack(fill="x", padx=10, pady=8)
+
+        tk.Label(bar, text="Course ID").pack(side="left")
+        self.course_entry = tk.Entry(bar, width=8)
+        self.course_entry.pack(side="left", padx=(2, 5))
+        self.course_entry.bind("<Return>", lambda e: self.load())
+        tk.Button(bar, text="Load", command=self.load).pack(side="left")
+
+        tk.Label(bar, text="Filter").pack(side="left", padx=(20, 2))
+        self.filter_text = tk.StringVar()
+        self.filter_text.trace_add("write", lambda *_: self.render())
+        tk.Entry(bar, textvariable=self.filter_text, width=24).pack(side="left")
+
+        tk.Label(bar, text="Grade").pack(side="left", padx=(15, 2))
+        self.min_grade = tk.Entry(bar, width=5)
+        self.min_grade.pack(side="left")
+        tk.Label(bar, text="to").pack(side="left", padx=2)
+        self.max_grade = tk.Entry(bar, width=5)
+        self.max_grade.pack(side="left")
+        for entry in (self.min_grade, self.max_grade):
+            entry.bind("<KeyRelease>", lambda e: self.render())
+
+        tk.Button(bar, text="Export CSV...", command=self.export_csv).pack(side="right")
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10)
+
+        self.tree = ttk.Treeview(table, columns=[c[0] for c in COLUMNS], show="headings")
+        for key, title, width in COLUMNS:
+            self.tree.heading(key, text=title, command=lambda k=key: self.sort_by(k))
+            self.tree.column(key, width=width, anchor="e" if key == "GradeValue" else "w")
+
+        scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        self.status = tk.Label(self.win, anchor="w")
+        self.status.pack(fill="x", padx=10, pady=4)
+
+    # =========================
+    # Loading (the only server call)
+    # =========================
+    def load(self):
+        try:
+            course_id = int(self.course_entry.get().strip())
+        except ValueError:
+            messagebox.showerror("Error", "Course ID must be a number", parent=self.win)
+            return
+
+        self.status.config(text=f"Loading course {course_id}...")
+        run_in_background(
+            self.win,
+            lambda: fetch_gradebook(self.username, course_id),
+            lambda rows: self.show(course_id, rows),
+            self.failed
+        )
+
+    def failed(self, error):
+        self.status.config(text="")
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def show(self, course_id, rows):
+        self.course_id = course_id
+        self.rows = rows
+        self.render()
+
+    # =========================
+    # Filter + sort (client side, on the cached rows)
+    # =========================
+    def sort_by(self, key):
+        if key == self.sort_key:
+            self.descending = not self.descending
+        else:
+            self.sort_key, self.descending = key, key == "GradeValue"
+        self.render()
+
+    def _grade_bounds(self):
+        bounds = []
+        for entry in (self.min_grade, self.max_grade):
+            try:
+                bounds.append(float(entry.get()))
+            except ValueError:
+                bounds.append(None)  # empty or still being typed
+        return bounds
+
+    def _matches(self, row, text, low, high):
+        if text and not any(text in str(getattr(row, k) or "").casefold() for k in TEXT_COLUMNS):
+            return False
+        if low is not None and (row.GradeValue is None or row.GradeValue < low):
+            return False
+        if high is not None and (row.GradeValue is None or row.GradeValue > high):
+            return False
+        return True
+
+    def render(self):
+        text = self.filter_text.get().strip().casefold()
+        low, high = self._grade_bounds()
+        rows = [r for r in self.rows if self._matches(r, text, low, high)]
+
+        key = self.sort_key
+        if key in TEXT_COLUMNS:
+            rows.sort(key=lambda r: str(getattr(r, key) or "").casefold(), reverse=self.descending)
+        else:
+            # missing values always last
+            present = [r for r in rows if getattr(r, key) is not None]
+            present.sort(key=lambda r: getattr(r, key), reverse=self.descending)
+            rows = present + [r for r in rows if getattr(r, key) is None]
+        self.shown = rows
+
+        self.tree.delete(*self.tree.get_children())
+        for r in rows:
+            self.tree.insert("", "end", values=r)
+
+        for k, title, _ in COLUMNS:
+            arrow = (" ▼" if self.descending else " ▲") if k == key else ""
+            self.tree.heading(k, text=title + arrow)
+
+        self.update_status()
+
+    def update_status(self):
+        if self.course_id is None:
+            self.status.config(text="Enter a course ID and press Load.")
+            return
+        grades = [r.GradeValue for r in self.shown if r.GradeValue is not None]
+        average = f", average {sum(grades) / len(grades):.2f}" if grades else ""
+        self.status.config(
+            text=f"Course {self.course_id}: showing {len(self.shown)} of {len(self.rows)} students{average}"
+        )
+
+    # =========================
+    # Export (what is shown, in the shown order)
+    # =========================
+    def export_csv(self):
+        if not self.shown:
+            messagebox.showinfo("Export", "Nothing to export", parent=self.win)
+            return
+
+        path = filedialog.asksaveasfilename(
+            parent=self.win,
+            title="Export Gradebook",
+            defaultextension=".csv",
+            initialfile=f"gradebook_{self.course_id}.csv",
+            filetypes=[("CSV files", "*.csv")]
+        )
+        if not path:
+            return
+
+        try:
+            count = write_csv(path, self.shown)
+        except OSError as e:
+            messagebox.showerror("Error", str(e), parent=self.win)
+            return
+        messagebox.showinfo("Export", f"{count} rows written to\n{path}", parent=self.win)
@@ -1,8 +1,8 @@
 import tkinter as tk
 from utils.layout import create_section
-from services.course_service import view_public_courses
+from gui.actions import view_public_courses
 
-def open_guest():
+def open_guest(username):
     win = tk.Toplevel()
     win.title("Guest Dashboard")
     win.geometry("300x200")
@@ -15,4 +15,6 @@ def open_guest():
 
     courses = create_section(win, "Public Information")
     tk.Button(courses, text="View Public Courses",
-              command=lambda: view_public_courses("guest1")).pack(fill="x", pady=5)
+              command=lambda: view_public_courses(username, win)).pack(fill="x", pady=5)
+
+    return win
@@ -0,0 +1,128 @@
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from services.inference_service import department_report, HISTOGRAM_BINS, INFERENCE_MIN_GROUP
+from utils.background import run_in_background
+
+COLUMNS = (
+    ("Department", "Department", 150),
+    ("GroupSize", "Students", 70),
+    ("Grades", "Grades", 65),
+    ("Mean", "Mean", 65),
+    ("Median", "Median", 65),
+    ("StdDev", "Std Dev", 65),
+    ("P10", "P10", 60),
+    ("P25", "P25", 60),
+    ("P75", "P75", 60),
+    ("P90", "P90", 60),
+    ("Min", "Min", 60),
+    ("Max", "Max", 60),
+    ("Histogram", "Distribution (0-100)", 150),
+)
+SPARKS = " ▁▂▃▄▅▆▇█"
+
+
+# =====================================================
+# Inference Report (all departments)
+# =====================================================
+def open_department_report(username):
+    win = tk.Toplevel()
+    win.title("Department Grade Report")
+    win.geometry("1080x420")
+    DepartmentReport(win, username)
+
+
+def _sparkline(counts):
+    top = max(counts, default=0)
+    if not top:
+        return ""
+    return "".join(SPARKS[round(c / top * (len(SPARKS) - 1))] for c in counts)
+
+
+class DepartmentReport:
+    def __init__(self, win, username):
+        self.win = win
+        self.username = username
+        self.rows = []
+        self.sort_key = "Department"
+        self.descending = False
+        self.build()
+        self.load()
+
+    def build(self):
+        bar = tk.Frame(self.win)
+        bar.pack(fill="x", padx=10, pady=8)
+
+        self.status = tk.Label(bar, anchor="w")
+        self.status.pack(side="left", fill="x", expand=True)
+        tk.Button(bar, text="Refresh", command=self.load).pack(side="right")
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.tree = ttk.Treeview(table, columns=[c[0] for c in COLUMNS], show="headings")
+        for key, title, width in COLUMNS:
+            self.tree.heading(key, text=title, command=lambda k=key: self.sort_by(k))
+            self.tree.column(key, width=width, anchor="w" if key in ("Department", "Histogram") else "e")
+
+        scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+    def load(self):
+        self.status.config(text="Loading...")
+        run_in_background(
+            self.win,
+            lambda: department_report(self.username),
+            self.show,
+            self.failed
+        )
+
+    def failed(self, error):
+        self.status.config(text="")
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def show(self, rows):
+        self.rows = rows
+        hidden = sum(1 for r in rows if r.Suppressed)
+        self.status.config(
+            text=f"{len(rows) - hidden} departments, {hidden} suppressed "
+                 f"(fewer than {INFERENCE_MIN_GROUP} graded students). "
+                 f"Buckets of {HISTOGRAM_BINS[1] - HISTOGRAM_BINS[0]} points."
+        )
+        self.render()
+
+    # =========================
+    # Sorting (click a heading; again to reverse)
+    # =========================
+    def sort_by(self, key):
+        if key == "Histogram":
+            return
+        if key == self.sort_key:
+            self.descending = not self.descending
+        else:
+            self.sort_key, self.descending = key, key != "Department"
+        self.render()
+
+    def render(self):
+        key = self.sort_key
+        if key == "Department":
+            ordered = sorted(self.rows, key=lambda r: r.Department.casefold(), reverse=self.descending)
+        else:
+            # suppressed departments have no statistics: always last
+            shown = [r for r in self.rows if getattr(r, key) is not None]
+            ordered = sorted(shown, key=lambda r: getattr(r, key), reverse=self.descending)
+            ordered += [r for r in self.rows if getattr(r, key) is None]
+
+        self.tree.delete(*self.tree.get_children())
+        for r in ordered:
+            if r.Suppressed:
+                values = [r.Department, r.GroupSize, "suppressed"] + [""] * (len(COLUMNS) - 3)
+            else:
+                values = [getattr(r, k) for k, _, _ in COLUMNS[:-1]] + [_sparkline(r.Histogram)]
+            self.tree.insert("", "end", values=values)
+
+        for k, title, _ in COLUMNS:
+            arrow = (" ▼" if self.descending else " ▲") if k == key else ""
+            self.tree.heading(k, text=title + arrow)
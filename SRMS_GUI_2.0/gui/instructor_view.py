@@ -1,14 +1,23 @@
 import tkinter as tk
 from utils.layout import create_section
 
-from services.profile_service import view_profile, edit_own_profile
-from services.grade_service import enter_or_update_grade, view_grades
-from services.attendance_service import record_attendance, view_attendance
+from gui.actions import (
+    view_profile,
+    edit_own_profile,
+    enter_or_update_grade,
+    view_grades,
+    import_grades,
+    record_attendance
+)
+from gui.attendance_view import open_attendance_grid
+from gui.attendance_analytics_view import open_course_attendance_analytics
+from gui.gradebook_view import open_gradebook
+from gui.roster_view import open_attendance_roster
 
 def open_instructor(username):
     win = tk.Toplevel()
     win.title("Instructor Dashboard")
-    win.geometry("450x450")
+    win.geometry("450x530")
 
     tk.Label(
         win,
@@ -18,18 +27,28 @@ def open_instructor(username):
 
     profiles = create_section(win, "Profiles")
     tk.Button(profiles, text="View Profiles",
-              command=lambda: view_profile(username)).pack(fill="x", pady=3)
+              command=lambda: view_profile(username, win)).pack(fill="x", pady=3)
     tk.Button(profiles, text="Edit My Profile",
-              command=lambda: edit_own_profile(username)).pack(fill="x", pady=3)
+              command=lambda: edit_own_profile(username, win)).pack(fill="x", pady=3)
 
     grades = create_section(win, "Grades")
     tk.Button(grades, text="Enter / Update Grade",
-              command=lambda: enter_or_update_grade(username)).pack(fill="x", pady=3)
+              command=lambda: enter_or_update_grade(username, win)).pack(fill="x", pady=3)
     tk.Button(grades, text="View Grades",
-              command=lambda: view_grades(username)).pack(fill="x", pady=3)
+              command=lambda: view_grades(username, win)).pack(fill="x", pady=3)
+    tk.Button(grades, text="Course Gradebook",
+              command=lambda: open_gradebook(username)).pack(fill="x", pady=3)
+    tk.Button(grades, text="Import Grades (CSV)",
+              command=lambda: import_grades(username, win)).pack(fill="x", pady=3)
 
     attendance = create_section(win, "Attendance")
     tk.Button(attendance, text="Record Attendance",
-              command=lambda: record_attendance(username)).pack(fill="x", pady=3)
+              command=lambda: record_attendance(username, win)).pack(fill="x", pady=3)
+    tk.Button(attendance, text="Take Class Attendance",
+              command=lambda: open_attendance_roster(username)).pack(fill="x", pady=3)
     tk.Button(attendance, text="View Attendance",
-              command=lambda: view_attendance(username)).pack(fill="x", pady=3)
+              command=lambda: open_attendance_grid(username)).pack(fill="x", pady=3)
+    tk.Button(attendance, text="Attendance Analytics",
+              command=lambda: open_course_attendance_analytics(username)).pack(fill="x", pady=3)
+
+    return win
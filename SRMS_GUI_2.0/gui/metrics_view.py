@@ -0,0 +1,115 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from db import metrics
+from db.connection import pool_stats
+
+REFRESH_MS = 1000
+
+COLUMNS = (
+    ("procedure", "Procedure", 170),
+    ("role", "Role", 80),
+    ("calls", "Calls", 60),
+    ("errors", "Errors", 55),
+    ("p50_ms", "p50 ms", 70),
+    ("p95_ms", "p95 ms", 70),
+    ("p99_ms", "p99 ms", 70),
+    ("avg_connect_ms", "Connect", 65),
+    ("avg_execute_ms", "Execute", 65),
+    ("avg_fetch_ms", "Fetch", 65),
+    ("rows", "Rows", 70),
+    ("bytes", "Bytes", 80),
+)
+
+
+# =====================================================
+# Performance (live per-procedure latency)
+# =====================================================
+def open_metrics_window():
+    win = tk.Toplevel()
+    win.title("Performance")
+    win.geometry("1000x420")
+    MetricsWindow(win)
+
+
+def dump_metrics(parent):
+    path = filedialog.asksaveasfilename(
+        parent=parent,
+        title="Dump Performance Metrics",
+        defaultextension=".json",
+        filetypes=[("JSON files", "*.json")]
+    )
+    if not path:
+        return
+
+    try:
+        metrics.dump(path)
+    except OSError as e:
+        messagebox.showerror("Error", str(e), parent=parent)
+        return
+    messagebox.showinfo("Performance", f"Metrics written to\n{path}", parent=parent)
+
+
+class MetricsWindow:
+    def __init__(self, win):
+        self.win = win
+        self.build()
+        self.refresh()
+
+    def build(self):
+        bar = tk.Frame(self.win)
+        bar.pack(fill="x", padx=10, pady=8)
+
+        self.pool_label = tk.Label(bar, anchor="w")
+        self.pool_label.pack(side="left", fill="x", expand=True)
+
+        tk.Button(bar, text="Reset", command=self.reset).pack(side="right", padx=2)
+        tk.Button(bar, text="Dump to File...",
+                  command=lambda: dump_metrics(self.win)).pack(side="right", padx=2)
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.tree = ttk.Treeview(table, columns=[c[0] for c in COLUMNS], show="headings")
+        for key, title, width in COLUMNS:
+            self.tree.heading(key, text=title)
+            self.tree.column(key, width=width, anchor="w" if key in ("procedure", "role") else "e")
+
+        scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+    def refresh(self):
+        if not self.win.winfo_exists():
+            return
+
+        rows = metrics.snapshot()
+        seen = set()
+        for r in rows:
+            iid = f"{r['procedure']}|{r['role']}"
+            seen.add(iid)
+            values = [r[key] for key, _, _ in COLUMNS]
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=values)
+            else:
+                self.tree.insert("", "end", iid=iid, values=values)
+        for iid in self.tree.get_children():
+            if iid not in seen:
+                self.tree.delete(iid)
+
+        # keep the slowest p95 on top
+        for index, r in enumerate(rows):
+            self.tree.move(f"{r['procedure']}|{r['role']}", "", index)
+
+        pool = pool_stats()
+        self.pool_label.config(
+            text=f"Pool: {pool['in_use']} in use / {pool['open']} open, "
+                 f"{pool['hits']} hits, {pool['misses']} misses, {pool['waits']} waits"
+        )
+
+        self.win.after(REFRESH_MS, self.refresh)
+
+    def reset(self):
+        metrics.reset()
+        self.tree.delete(*self.tree.get_children())
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import messagebox
 
 from services.role_request_service import submit_role_request
+from utils.background import run_in_background
 
 
 # =====================================================
@@ -52,15 +53,19 @@ def open_role_request_form(username, role):
             messagebox.showerror("Error", "Reason is required")
             return
 
-        try:
-            submit_role_request(username, role, reason)
+        def done(_):
             messagebox.showinfo(
                 "Success",
-                "Role upgrade request submitted successfully"
+                "Role upgrade request submitted successfully",
+                parent=win
             )
             win.destroy()
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+
+        run_in_background(
+            win,
+            lambda: submit_role_request(username, role, reason),
+            done
+        )
 
     tk.Button(
         win,
@@ -0,0 +1,247 @@
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from services.attendance_service import (
+    fetch_roster,
+    record_attendance_batch,
+    read_attendance_csv
+)
+from utils.background import run_in_background
+
+PRESENT = "Present"
+ABSENT = "Absent"
+NOT_MARKED = "-"    # not submitted
+
+
+# =====================================================
+# Roster Attendance (whole class in one submit)
+# =====================================================
+def open_attendance_roster(username):
+    win = tk.Toplevel()
+    win.title("Take Attendance")
+    win.geometry("680x520")
+    RosterWindow(win, username)
+
+
+class RosterWindow:
+    def __init__(self, win, username):
+        self.win = win
+        self.username = username
+        self.course_id = None   # course of the roster in the tree
+        self.in_course = True   # False: the course had no students yet, the tree lists everyone
+        self.build()
+        self.update_counts()
+
+    def build(self):
+        top = tk.Frame(self.win)
+        top.pack(fill="x", padx=10, pady=8)
+
+        tk.Label(top, text="Course ID").pack(side="left")
+        self.course_entry = tk.Entry(top, width=8)
+        self.course_entry.pack(side="left", padx=(2, 5))
+        self.course_entry.bind("<Return>", lambda e: self.load_roster())
+        tk.Label(top, text="Department").pack(side="left")
+        self.department_entry = tk.Entry(top, width=14)
+        self.department_entry.pack(side="left", padx=(2, 5))
+        self.department_entry.bind("<Return>", lambda e: self.load_roster())
+        tk.Button(top, text="Load Roster",
+                  command=self.load_roster).pack(side="left", padx=(0, 15))
+
+        tk.Button(top, text="All Present",
+                  command=lambda: self.mark_all(PRESENT)).pack(side="left", padx=2)
+        tk.Button(top, text="All Absent",
+                  command=lambda: self.mark_all(ABSENT)).pack(side="left", padx=2)
+        tk.Button(top, text="Import CSV...",
+                  command=self.import_csv).pack(side="left", padx=2)
+
+        table = tk.Frame(self.win)
+        table.pack(fill="both", expand=True, padx=10)
+
+        self.tree = ttk.Treeview(
+            table,
+            columns=("Email", "Name", "Status"),
+            show="headings"
+        )
+        for col, width in (("Email", 220), ("Name", 200), ("Status", 80)):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width)
+
+        scrollbar = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        # click a student to toggle Present / Absent
+        self.tree.bind("<ButtonRelease-1>", self.toggle)
+        self.tree.bind("<space>", self.toggle)
+
+        bottom = tk.Frame(self.win)
+        bottom.pack(fill="x", padx=10, pady=8)
+
+        self.status = tk.Label(bottom, anchor="w", justify="left")
+        self.status.pack(side="left", fill="x", expand=True)
+
+        tk.Button(bottom, text="Submit Attendance", width=18,
+                  command=self.submit).pack(side="right")
+
+    def _entered_course(self):
+        try:
+            return int(self.course_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Please enter a numeric Course ID", parent=self.win)
+            return None
+
+    # =========================
+    # Roster
+    # =========================
+    def load_roster(self):
+        course_id = self._entered_course()
+        if course_id is None:
+            return
+        department = self.department_entry.get().strip() or None
+
+        self.status.config(text=f"Loading roster of course {course_id}...")
+        run_in_background(
+            self.win,
+            lambda: fetch_roster(self.username, course_id, department),
+            lambda rows: self.show_roster(course_id, rows),
+            self.failed
+        )
+
+    def failed(self, error):
+        self.update_counts()
+        messagebox.showerror("Error", str(error), parent=self.win)
+
+    def show_roster(self, course_id, rows):
+        self.course_id = course_id
+        self.in_course = all(r.InCourse for r in rows)
+        # a course's own students start Present; on a first lecture nobody
+        # is marked, so only the students actually marked are recorded
+        status = PRESENT if self.in_course else NOT_MARKED
+
+        self.tree.delete(*self.tree.get_children())
+        for r in rows:
+            self.tree.insert("", "end", iid=r.Email.lower(),
+                             values=(r.Email, r.FullName, status))
+        self.update_counts()
+
+    def set_status(self, iid, status):
+        email, name, _ = self.tree.item(iid, "values")
+        self.tree.item(iid, values=(email, name, status))
+
+    def toggle(self, event=None):
+        if (event is not None and event.type == tk.EventType.ButtonRelease
+                and self.tree.identify_region(event.x, event.y) != "cell"):
+            return  # heading / scroll area click
+        for iid in self.tree.selection():
+            current = self.tree.set(iid, "Status")
+            self.set_status(iid, ABSENT if current == PRESENT else PRESENT)
+        self.update_counts()
+
+    def mark_all(self, status):
+        for iid in self.tree.get_children():
+            self.set_status(iid, status)
+        self.update_counts()
+
+    def update_counts(self):
+        if self.course_id is None:
+            self.status.config(text="Enter a course ID (and optionally a department) and press Load Roster.")
+            return
+        statuses = [self.tree.set(iid, "Status") for iid in self.tree.get_children()]
+        present = statuses.count(PRESENT)
+        text = f"Course {self.course_id}: {len(statuses)} students - {present} present"
+        if not self.in_course:
+            text += (f", {statuses.count(NOT_MARKED)} not marked\n"
+                     "No students in this course yet: listing all students, only marked ones are recorded.")
+        self.status.config(text=text)
+
+    # =========================
+    # CSV import (recorded as is, not matched to the roster shown)
+    # =========================
+    def import_csv(self):
+        course_id = self._entered_course()
+        if course_id is None:
+            return
+
+        path = filedialog.askopenfilename(
+            parent=self.win,
+            title="Attendance CSV",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not path:
+            return
+
+        try:
+            marks = read_attendance_csv(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Import Failed", str(e), parent=self.win)
+            return
+        if not marks:
+            messagebox.showinfo("Import", "The file has no attendance rows", parent=self.win)
+            return
+
+        present = sum(1 for _, p in marks if p)
+        if not messagebox.askyesno(
+            "Import",
+            f"Record {len(marks)} students from the file for course {course_id} "
+            f"({present} present, {len(marks) - present} absent)?",
+            parent=self.win
+        ):
+            return
+
+        if course_id == self.course_id:
+            for email, p in marks:
+                if self.tree.exists(email.lower()):
+                    self.set_status(email.lower(), PRESENT if p else ABSENT)
+
+        self.status.config(text=f"Recording {len(marks)} students from the file...")
+        run_in_background(
+            self.win,
+            lambda: record_attendance_batch(self.username, course_id, marks),
+            self.show_outcome,
+            self.failed
+        )
+
+    # =========================
+    # Submit
+    # =========================
+    def submit(self):
+        course_id = self.course_id
+        if course_id is None:
+            messagebox.showerror("Error", "Load a course roster first", parent=self.win)
+            return
+        if self.course_entry.get().strip() != str(course_id):
+            messagebox.showerror(
+                "Error", f"The roster shown is course {course_id}: press Load Roster "
+                         "to take attendance for another course", parent=self.win
+            )
+            return
+
+        marks = [
+            (self.tree.set(iid, "Email"), self.tree.set(iid, "Status") == PRESENT)
+            for iid in self.tree.get_children()
+            if self.tree.set(iid, "Status") != NOT_MARKED
+        ]
+        if not marks:
+            messagebox.showinfo("Attendance", "No student is marked", parent=self.win)
+            return
+
+        self.status.config(text=f"Submitting {len(marks)} students...")
+        run_in_background(
+            self.win,
+            lambda: record_attendance_batch(self.username, course_id, marks),
+            self.show_outcome,
+            self.failed
+        )
+
+    def show_outcome(self, outcomes):
+        missing = [email for email, result in outcomes if result != "Recorded"]
+        recorded = len(outcomes) - len(missing)
+        self.update_counts()
+
+        text = f"Attendance recorded for {recorded} students."
+        if missing:
+            text += "\n\nNot found:\n" + "\n".join(missing[:20])
+            if len(missing) > 20:
+                text += f"\n... and {len(missing) - 20} more"
+        messagebox.showinfo("Attendance", text, parent=self.win)
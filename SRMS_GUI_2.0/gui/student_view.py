@@ -1,14 +1,15 @@
 import tkinter as tk
 from utils.layout import create_section
-from services.attendance_service import view_attendance
-from services.profile_service import view_profile
+from gui.attendance_view import open_attendance_grid
+from gui.attendance_analytics_view import open_my_attendance_analytics
+from gui.actions import view_profile
 from gui.role_request_view import open_role_request_form
 
 
 def open_student(username):
     win = tk.Toplevel()
     win.title("Student Dashboard")
-    win.geometry("350x350")
+    win.geometry("350x395")
 
     tk.Label(
         win,
@@ -23,7 +24,7 @@ def open_student(username):
     tk.Button(
         profile,
         text="View Profile",
-        command=lambda: view_profile(username)
+        command=lambda: view_profile(username, win)
     ).pack(fill="x", padx=10, pady=5)
 
     # =====================
@@ -33,7 +34,12 @@ def open_student(username):
     tk.Button(
         attendance,
         text="View Attendance",
-        command=lambda: view_attendance(username)
+        command=lambda: open_attendance_grid(username)
+    ).pack(fill="x", padx=10, pady=5)
+    tk.Button(
+        attendance,
+        text="My Attendance Analytics",
+        command=lambda: open_my_attendance_analytics(username)
     ).pack(fill="x", padx=10, pady=5)
 
     # =====================
@@ -47,3 +53,5 @@ def open_student(username):
         command=lambda: open_role_request_form(username, "TA")
     ).pack(pady=5)
 
+    return win
+
@@ -1,8 +1,9 @@
 import tkinter as tk
 from utils.layout import create_section
 
-from services.profile_service import view_profile, edit_own_profile
-from services.attendance_service import record_attendance, view_attendance
+from gui.actions import view_profile, edit_own_profile, record_attendance
+from gui.attendance_view import open_attendance_grid
+from gui.roster_view import open_attendance_roster
 from gui.role_request_view import open_role_request_form
 
 
@@ -27,13 +28,13 @@ def open_ta(username):
     tk.Button(
         profiles,
         text="View Students",
-        command=lambda: view_profile(username)
+        command=lambda: view_profile(username, win)
     ).pack(fill="x", pady=5)
 
     tk.Button(
         profiles,
         text="Edit My Profile",
-        command=lambda: edit_own_profile(username)
+        command=lambda: edit_own_profile(username, win)
     ).pack(fill="x", pady=3)
     
     # =====================
@@ -43,13 +44,19 @@ def open_ta(username):
     tk.Button(
         attendance,
         text="Record Attendance",
-        command=lambda: record_attendance(username)
+        command=lambda: record_attendance(username, win)
+    ).pack(fill="x", pady=5)
+
+    tk.Button(
+        attendance,
+        text="Take Class Attendance",
+        command=lambda: open_attendance_roster(username)
     ).pack(fill="x", pady=5)
 
     tk.Button(
         attendance,
         text="View Attendance",
-        command=lambda: view_attendance(username)
+        command=lambda: open_attendance_grid(username)
     ).pack(fill="x", pady=5)
 
     # =====================
@@ -63,3 +70,5 @@ def open_ta(username):
         width=30,
         command=lambda: open_role_request_form(username, "Instructor")
     ).pack(pady=5)
+
+    return win
@@ -1,68 +1,132 @@
+import importlib
+import threading
 import tkinter as tk
 from tkinter import messagebox
-import sys
 
-from auth.login import validate_login
-from gui.admin_view import open_admin
-from gui.instructor_view import open_instructor
-from gui.ta_view import open_ta
-from gui.student_view import open_student
-from gui.guest_view import open_guest
+# Only Tk is loaded before the login window shows. The database driver is
+# loaded (and a pooled connection opened) in the background while the user
+# types, and each dashboard module is imported the first time someone
+# logs in with that role.
+
+# role -> (module, function that opens the dashboard)
+DASHBOARDS = {
+    "Admin": ("gui.admin_view", "open_admin"),
+    "Instructor": ("gui.instructor_view", "open_instructor"),
+    "TA": ("gui.ta_view", "open_ta"),
+    "Student": ("gui.student_view", "open_student"),
+    "Guest": ("gui.guest_view", "open_guest"),
+}
+
 
 # =========================
-# Create Login Window
+# Background warm-up
 # =========================
-root = tk.Tk()
-root.title("SRMS Login")
-root.geometry("300x220")
+def warm_up():
+    try:
+        from db.connection import warm_up as open_pooled_connection
+        import auth.login  # noqa: F401
+        open_pooled_connection()
+    except Exception:
+        pass  # nothing to show yet: the login attempt reports the same error
 
-tk.Label(root, text="Username").pack(pady=5)
-entry_user = tk.Entry(root)
-entry_user.pack()
 
-tk.Label(root, text="Password").pack(pady=5)
-entry_pass = tk.Entry(root, show="*")
-entry_pass.pack()
+def start_warm_up():
+    thread = threading.Thread(target=warm_up, name="srms-warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def login_and_load(username, password):
+    """
+    Runs off the Tk thread: validates the login, then imports the
+    dashboard for the user's role. Returns (session, opener); opener is
+    None for a role without a dashboard.
+    """
+    from auth.login import validate_login
+
+    session = validate_login(username, password)
+    if not session or session.role not in DASHBOARDS:
+        return session, None
+
+    module, name = DASHBOARDS[session.role]
+    try:
+        return session, getattr(importlib.import_module(module), name)
+    except Exception:
+        session.close()
+        raise
 
-# =========================
-# LOGIN HANDLER (WRITE HERE)
-# =========================
-def handle_login():
-    username = entry_user.get()
-    password = entry_pass.get()
-
-    result = validate_login(username, password)
-    if not result:
-        return
-
-    role = result["role"]
-
-    root.withdraw()  # HIDE login window
-
-    if role == "Admin":
-        open_admin(username)
-    elif role == "Instructor":
-        open_instructor(username)
-    elif role == "TA":
-        open_ta(username)
-    elif role == "Student":
-        open_student(username)
-    elif role == "Guest":
-        open_guest()
-    else:
-        messagebox.showerror("Error", "Unknown role")
 
 # =========================
-# Login Button
+# Login Window
 # =========================
-tk.Button(
-    root,
-    text="Login",
-    command=handle_login
-).pack(pady=15)
+class LoginWindow:
+    def __init__(self, root):
+        self.root = root
+        self.dashboard = None
+        self.build()
+
+    def build(self):
+        self.root.title("SRMS Login")
+        self.root.geometry("300x220")
+
+        tk.Label(self.root, text="Username").pack(pady=5)
+        self.entry_user = tk.Entry(self.root)
+        self.entry_user.pack()
+
+        tk.Label(self.root, text="Password").pack(pady=5)
+        self.entry_pass = tk.Entry(self.root, show="*")
+        self.entry_pass.pack()
+
+        tk.Button(
+            self.root,
+            text="Login",
+            command=self.handle_login
+        ).pack(pady=15)
+
+    # =========================
+    # LOGIN HANDLER (WRITE HERE)
+    # =========================
+    def handle_login(self):
+        from utils.background import run_in_background
+
+        username = self.entry_user.get()
+        password = self.entry_pass.get()
+
+        run_in_background(
+            self.root,
+            lambda: login_and_load(username, password),
+            self.open_dashboard,
+            lambda e: messagebox.showerror("Login Error", str(e))
+        )
+
+    def open_dashboard(self, result):
+        session, opener = result
+        if not session:
+            messagebox.showerror("Login Failed", "Invalid username or password")
+            return
+        if opener is None:
+            session.close()
+            messagebox.showerror("Error", "Unknown role")
+            return
+
+        win = opener(session.username)
+        self.root.withdraw()  # HIDE login window
+
+        # the dashboard runs on the login session; closing it ends the session
+        win.bind("<Destroy>", lambda e: session.close() if e.widget is win else None)
+        self.dashboard = win
 
 
 # =========================
 # Start GUI
 # =========================
-root.mainloop()
+def main():
+    root = tk.Tk()
+    LoginWindow(root)
+    # warm up once the window is drawn, not before
+    root.after_idle(start_warm_up)
+    root.mainloop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+from typing import NamedTuple
+
+
+# =====================================================
+# Typed rows returned by the service layer.
+# Field names match the column names the procedures return.
+# =====================================================
+class LoginRow(NamedTuple):
+    Username: str
+    RoleName: str
+    ClearanceLevel: int
+
+
+class ProfileRow(NamedTuple):
+    ProfileType: str
+    Identifier: str
+    FullName: str
+    Email: str
+    Phone: str
+    Department: str
+    ClearanceLevel: int
+
+
+class UserOutcome(NamedTuple):
+    Username: str
+    Result: str
+
+
+class CourseRow(NamedTuple):
+    CourseID: int
+    CourseName: str
+    PublicInfo: str
+    RowVer: bytes
+
+
+class CatalogVersion(NamedTuple):
+    Version: bytes      # None for an empty catalog
+    CourseCount: int
+    Watermark: bytes
+
+
+class GradeRow(NamedTuple):
+    GradeID: int
+    StudentID: str
+    CourseID: int
+    GradeValue: object   # Decimal
+    DateEntered: object  # datetime
+    EnteredBy: str
+
+
+class GradebookRow(NamedTuple):
+    StudentID: str
+    FullName: str
+    Email: str
+    Department: str
+    GradeValue: object   # Decimal
+    DateEntered: object  # datetime
+    EnteredBy: str
+
+
+class GradeImportError(NamedTuple):
+    RowNo: int
+    StudentEmail: str
+    Error: str
+
+
+class AttendanceRow(NamedTuple):
+    AttendanceID: int
+    StudentID: str
+    CourseID: int
+    Status: bool
+    DateRecorded: object  # datetime
+    RecordedBy: str       # None for students
+
+
+class RosterRow(NamedTuple):
+    Email: str
+    FullName: str
+    Department: str
+    InCourse: bool  # False: the course has no students yet, this is everyone
+
+
+class AttendanceOutcome(NamedTuple):
+    StudentEmail: str
+    Result: str
+
+
+class AttendanceWeek(NamedTuple):
+    Email: str
+    FullName: str
+    CourseID: int
+    WeekStart: object  # date, the Monday of the week
+    PresentCount: int
+    AbsentCount: int
+
+
+class AttendanceSummary(NamedTuple):
+    Email: str
+    FullName: str
+    CourseID: int
+    Sessions: int
+    Present: int
+    Rate: float           # present / sessions, 0..1
+    Trend: float          # change of the weekly rate per week; None under 2 weeks
+    PresentStreak: int    # latest weeks in a row without an absence
+    AbsentStreak: int     # latest weeks in a row with an absence
+    Recent: tuple         # weekly rates of the last RECENT_WEEKS weeks, None = no session
+    AtRisk: bool
+
+
+class DepartmentAverage(NamedTuple):
+    Department: str
+    AvgGrade: object  # Decimal
+    GroupSize: int
+
+
+class DepartmentGrade(NamedTuple):
+    Department: str
+    GroupSize: int
+    GradeValue: object  # Decimal; None for a suppressed department
+
+
+class DepartmentStats(NamedTuple):
+    Department: str
+    GroupSize: int
+    Grades: int
+    Mean: float         # statistics are None when Suppressed
+    Median: float
+    StdDev: float
+    P10: float
+    P25: float
+    P75: float
+    P90: float
+    Min: float
+    Max: float
+    Histogram: tuple    # counts per HISTOGRAM_BINS bucket
+    Suppressed: bool
+
+
+class RoleRequestRow(NamedTuple):
+    RequestID: int
+    Username: str
+    CurrentRole: str
+    RequestedRole: str
+    Reason: str
+    DateSubmitted: object  # datetime
+    Status: str
+
+
+class RoleDecisionOutcome(NamedTuple):
+    RequestID: int
+    Result: str
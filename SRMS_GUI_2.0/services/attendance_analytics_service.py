@@ -0,0 +1,124 @@
+import numpy as np
+
+from db.query import fetch_all, execute
+from models.records import AttendanceWeek, AttendanceSummary
+
+AT_RISK_RATE = 0.75     # below this overall rate a student is at risk
+AT_RISK_WEEKS = 2       # ... and so is one absent in each of the latest weeks
+RECENT_WEEKS = 8        # weekly rates kept for the sparkline
+
+
+def fetch_attendance_weeks(username, course_id=None):
+    """
+    Present/absent counts per student, course and week (AttendanceWeekly).
+    Read from dbo.AttendanceWeekly, never from the attendance rows.
+    Students get their own weeks, staff those of one course.
+    """
+    return fetch_all(
+        AttendanceWeek,
+        "EXEC AttendanceWeekly ?, ?",
+        username, course_id
+    )
+
+
+def attendance_summary(username, course_id=None):
+    """
+    Rate, trend, streaks and at-risk flag per (student, course),
+    computed from the weekly rollup in one pass over a week matrix.
+    """
+    return summarize_weeks(fetch_attendance_weeks(username, course_id))
+
+
+def rebuild_attendance_rollup(admin_user):
+    """Recomputes dbo.AttendanceWeekly from dbo.Attendance (Admin only)."""
+    execute("EXEC RebuildAttendanceWeekly ?", admin_user)
+
+
+def summarize_weeks(rows):
+    if not rows:
+        return []
+
+    # one matrix row per (student, course), one column per week seen
+    groups = {}
+    people = []
+    weeks = sorted({r.WeekStart for r in rows})
+    week_col = {w: i for i, w in enumerate(weeks)}
+
+    g = np.empty(len(rows), dtype=np.intp)
+    w = np.empty(len(rows), dtype=np.intp)
+    present = np.empty(len(rows), dtype=np.float64)
+    absent = np.empty(len(rows), dtype=np.float64)
+    for i, r in enumerate(rows):
+        key = (r.Email.casefold(), r.CourseID)
+        code = groups.get(key)
+        if code is None:
+            code = groups[key] = len(people)
+            people.append(r)
+        g[i] = code
+        w[i] = week_col[r.WeekStart]
+        present[i] = r.PresentCount
+        absent[i] = r.AbsentCount
+
+    shape = (len(people), len(weeks))
+    P = np.zeros(shape)
+    A = np.zeros(shape)
+    np.add.at(P, (g, w), present)
+    np.add.at(A, (g, w), absent)
+    T = P + A
+    held = T > 0
+
+    sessions = T.sum(axis=1)
+    attended = P.sum(axis=1)
+    rate = attended / sessions   # every group has at least one session
+    weekly = np.divide(P, T, out=np.full(shape, np.nan), where=held)
+
+    trend = _weekly_slope(weekly, held, weeks)
+    present_streak, absent_streak = _streaks(held & (A == 0), A > 0)
+    at_risk = (rate < AT_RISK_RATE) | (absent_streak >= AT_RISK_WEEKS)
+
+    recent = np.round(weekly[:, -RECENT_WEEKS:], 3).tolist()
+    rate = np.round(rate, 4).tolist()
+    trend = np.round(trend, 4).tolist()
+    return [
+        AttendanceSummary(
+            p.Email, p.FullName, p.CourseID,
+            int(sessions[i]), int(attended[i]), rate[i],
+            None if np.isnan(trend[i]) else trend[i],
+            int(present_streak[i]), int(absent_streak[i]),
+            tuple(None if np.isnan(x) else x for x in recent[i]),
+            bool(at_risk[i])
+        )
+        for i, p in enumerate(people)
+    ]
+
+
+def _weekly_slope(weekly, held, weeks):
+    """
+    Least-squares slope of each row's weekly rate against the week
+    number, over the weeks that had a session; NaN under two such weeks.
+    """
+    x = np.array([(wk - weeks[0]).days // 7 for wk in weeks], dtype=np.float64)
+    m = held.astype(np.float64)
+    y = np.where(held, weekly, 0.0)
+
+    n = m.sum(axis=1)
+    sx = m @ x
+    sy = y.sum(axis=1)
+    sxx = m @ (x * x)
+    sxy = y @ x
+    denominator = n * sxx - sx * sx
+    return np.divide(n * sxy - sx * sy, denominator,
+                     out=np.full(len(n), np.nan), where=denominator > 0)
+
+
+def _streaks(good, bad):
+    """
+    Length of the current run of good weeks and of bad weeks, counting
+    back from the latest week; weeks without a session don't break a run.
+    """
+    cols = np.arange(1, good.shape[1] + 1)
+    last_bad = (bad * cols).max(axis=1)
+    last_good = (good * cols).max(axis=1)
+    good_run = (good & (cols > last_bad[:, None])).sum(axis=1)
+    bad_run = (bad & (cols > last_good[:, None])).sum(axis=1)
+    return good_run, bad_run
@@ -1,53 +1,122 @@
-from db.connection import get_connection
-from tkinter import messagebox
-from tkinter import simpledialog
+import csv
 
-def view_attendance(username):
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+from db.query import fetch_all, execute
+from models.records import AttendanceRow, RosterRow, AttendanceOutcome
 
-        cursor.execute("EXEC ViewAttendance ?", username)
-        rows = cursor.fetchall()
+def save_attendance(username, student_email, course_id, status):
+    execute(
+        "EXEC RecordAttendance ?, ?, ?, ?",
+        username, student_email, course_id, status
+    )
 
-        if not rows:
-            messagebox.showinfo("Attendance", "No attendance records")
+
+PAGE_SIZE = 100
+EXPORT_PAGE_SIZE = 1000
+
+def fetch_attendance_page(username, after=None, course_id=None,
+                          from_date=None, to_date=None, page_size=PAGE_SIZE):
+    """
+    Returns one page of attendance rows, newest first.
+    after is (DateRecorded, AttendanceID) of the last row already loaded.
+    to_date is exclusive.
+    """
+    after_date, after_id = after if after else (None, None)
+
+    return fetch_all(
+        AttendanceRow,
+        "EXEC ViewAttendancePage ?, ?, ?, ?, ?, ?, ?",
+        username, page_size, after_date, after_id,
+        course_id, from_date, to_date
+    )
+
+
+def iter_attendance(username, course_id=None, from_date=None, to_date=None,
+                    page_size=EXPORT_PAGE_SIZE):
+    """
+    Yields every attendance row the user may see, newest first, one
+    ViewAttendancePage page at a time (at most page_size rows in memory).
+    """
+    after = None
+    while True:
+        page = fetch_attendance_page(
+            username, after, course_id, from_date, to_date, page_size
+        )
+        yield from page
+
+        if len(page) < page_size:
             return
+        after = (page[-1].DateRecorded, page[-1].AttendanceID)
 
-        result = ""
-        for r in rows:
-            status = "Present" if r.Status else "Absent"
-            result += (
-                f"Course ID: {r.CourseID}\n"
-                f"Status: {status}\n"
-                f"Date: {r.DateRecorded}\n"
-                "----------------------\n"
-            )
 
-        messagebox.showinfo("Attendance", result)
+# =========================
+# Roster (bulk) attendance
+# =========================
+def fetch_roster(username, course_id, department=None):
+    """
+    Students of one course: graded in it or with attendance in it.
+    Until the course has any, every student (InCourse False).
+    department narrows the list.
+    """
+    return fetch_all(
+        RosterRow,
+        "EXEC ListStudentRoster ?, ?, ?",
+        username, course_id, department
+    )
 
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
 
-def record_attendance(username):
-    student_email = simpledialog.askstring("Attendance", "Student Email:")
-    course_id = simpledialog.askinteger("Attendance", "Course ID:")
-    status = simpledialog.askinteger("Attendance", "Status (1 = Present, 0 = Absent)")
+def record_attendance_batch(username, course_id, marks):
+    """
+    Records a whole roster in one round trip / one transaction.
+    marks: iterable of (student_email, present) - the last mark per email wins.
+    Returns [(student_email, result)], result is 'Recorded' or 'Student not found'.
+    """
+    roster = {}
+    for email, present in marks:
+        roster[email.strip().lower()] = bool(present)
 
-    if not student_email or not course_id or status is None:
-        return
+    if not roster:
+        return []
 
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+    return execute(
+        "EXEC RecordAttendanceBatch ?, ?, ?",
+        username, course_id, list(roster.items()),
+        record_type=AttendanceOutcome
+    )
 
-        cursor.execute(
-            "EXEC RecordAttendance ?, ?, ?, ?",
-            username, student_email, course_id, status
-        )
-        conn.commit()
 
-        messagebox.showinfo("Success", "Attendance recorded")
+PRESENT_VALUES = {"1", "p", "present", "y", "yes", "true"}
+ABSENT_VALUES = {"0", "a", "absent", "n", "no", "false"}
+HEADER_VALUES = {"email", "studentemail", "student email", "student", "username"}
+
+def read_attendance_csv(path):
+    """
+    Reads attendance marks from a CSV file.
+    Accepts "email,status" rows (status 1/0, P/A, Present/Absent) or a
+    single email column, as exported by the card scanners, where every
+    listed student is present. A header row is skipped.
+    Returns [(student_email, present)].
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return parse_attendance_rows(csv.reader(f))
+
+
+def parse_attendance_rows(rows):
+    """read_attendance_csv for rows that are already split into values."""
+    marks = []
+    for row in rows:
+        if not row or not row[0].strip():
+            continue
+
+        email = row[0].strip()
+        if email.lower() in HEADER_VALUES:
+            continue
+
+        status = row[1].strip().lower() if len(row) > 1 else "1"
+        if status in PRESENT_VALUES:
+            marks.append((email, True))
+        elif status in ABSENT_VALUES:
+            marks.append((email, False))
+        else:
+            raise ValueError(f"Unknown status '{row[1]}' for {email}")
 
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+    return marks
@@ -1,28 +1,74 @@
-from db.connection import get_connection
-from tkinter import messagebox
-
-def view_public_courses(username):
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("EXEC ViewPublicCourses ?", username)
-        rows = cursor.fetchall()
-
-        if not rows:
-            messagebox.showinfo("Courses", "No public courses available")
-            return
-
-        result = ""
-        for r in rows:
-            result += (
-                f"Course ID: {r.CourseID}\n"
-                f"Course Name: {r.CourseName}\n"
-                f"Info: {r.PublicInfo}\n"
-                "----------------------\n"
-            )
-
-        messagebox.showinfo("Public Courses", result)
-
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+import threading
+import time
+
+from db.query import stream, fetch_one
+from models.records import CourseRow, CatalogVersion
+
+def iter_public_courses(username, since_version=None):
+    """Public catalog straight from the server (ViewPublicCourses), streamed."""
+    return stream(CourseRow, "EXEC ViewPublicCourses ?, ?", username, since_version)
+
+
+# =====================================================
+# Public catalog cache
+# The catalog is unclassified and the same for every role, so one copy
+# serves all users of this process.
+# =====================================================
+CATALOG_TTL = 60  # seconds the cached catalog is used without asking the server
+
+_catalog_lock = threading.Lock()
+_catalog = {
+    "courses": {},      # CourseID -> CourseRow
+    "watermark": None,  # PublicCourseVersion.Watermark of the last refresh
+    "checked": None,    # time.monotonic() of the last refresh
+    "users": set(),     # users the server has accepted (unknown users are refused)
+}
+
+
+def public_courses(username):
+    """
+    The public catalog sorted by CourseID. Served from memory for
+    CATALOG_TTL seconds; after that one PublicCourseVersion probe decides
+    whether anything changed, and only changed rows are fetched again.
+    """
+    with _catalog_lock:
+        checked = _catalog["checked"]
+        if (checked is None or time.monotonic() - checked >= CATALOG_TTL
+                or username.lower() not in _catalog["users"]):
+            _refresh_catalog(username)
+        return sorted(_catalog["courses"].values())
+
+
+def clear_catalog_cache():
+    with _catalog_lock:
+        _catalog["courses"].clear()
+        _catalog["watermark"] = None
+        _catalog["checked"] = None
+        _catalog["users"].clear()
+
+
+def _refresh_catalog(username):
+    # caller holds _catalog_lock
+    probe = fetch_one(CatalogVersion, "EXEC PublicCourseVersion ?", username)
+    courses = _catalog["courses"]
+    since = _catalog["watermark"]
+
+    if since is None:
+        _reload(courses, username)
+    elif probe.Version is not None and probe.Version >= since:
+        for row in iter_public_courses(username, since):
+            courses[row.CourseID] = row
+
+    if len(courses) != probe.CourseCount:
+        # rows were deleted: rowversion can't say which
+        _reload(courses, username)
+
+    _catalog["watermark"] = probe.Watermark
+    _catalog["checked"] = time.monotonic()
+    _catalog["users"].add(username.lower())
+
+
+def _reload(courses, username):
+    courses.clear()
+    for row in iter_public_courses(username):
+        courses[row.CourseID] = row
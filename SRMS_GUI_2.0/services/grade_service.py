@@ -1,61 +1,109 @@
-from db.connection import get_connection
-from tkinter import simpledialog, messagebox
+import csv
+import time
+from decimal import Decimal, InvalidOperation
+from itertools import islice
 
-def enter_or_update_grade(username):
-    student_email = simpledialog.askstring("Grade", "Student Email:")
-    course_id = simpledialog.askinteger("Grade", "Course ID:")
-    grade_value = simpledialog.askfloat("Grade", "Grade Value:")
+from db.query import stream, fetch_all, execute
+from models.records import GradeRow, GradebookRow, GradeImportError
 
-    if not student_email or not course_id or grade_value is None:
-        return
+def save_grade(username, student_email, course_id, grade_value):
+    execute(
+        "EXEC EnterOrUpdateGrade ?, ?, ?, ?",
+        username, student_email, course_id, grade_value
+    )
 
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            "EXEC EnterOrUpdateGrade ?, ?, ?, ?",
-            username, student_email, course_id, grade_value
-        )
-        conn.commit()
+def iter_grades(username, student_email):
+    """Grades of one student (ViewGrades), streamed."""
+    return stream(GradeRow, "EXEC ViewGrades ?, ?", username, student_email)
 
-        messagebox.showinfo("Success", "Grade saved successfully")
 
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+def fetch_gradebook(username, course_id):
+    """Every grade of one course (CourseGradebook), sorted by student name."""
+    return fetch_all(GradebookRow, "EXEC CourseGradebook ?, ?", username, course_id)
 
 
-def view_grades(username):
-    student_email = simpledialog.askstring("View Grades", "Student Email:")
+# =========================
+# Bulk grade import (CSV)
+# =========================
+IMPORT_CHUNK_SIZE = 2000
+GRADE_MIN, GRADE_MAX = Decimal(0), Decimal(100)   # the grade scale; the server stores DECIMAL(5,2)
+COURSE_ID_MIN, COURSE_ID_MAX = -2**31, 2**31 - 1   # INT
 
-    if not student_email:
-        return
+def _parse_grade_rows(reader, errors):
+    """
+    Yields (line_no, email, course_id, grade) for every usable CSV line.
+    Lines that cannot be parsed are added to errors instead, and so are
+    values the server could not convert: one of those would fail the
+    whole chunk.
+    Expected columns: StudentEmail, CourseID, GradeValue (header optional).
+    """
+    for line_no, row in enumerate(reader, start=1):
+        if not row or not "".join(row).strip():
+            continue
+        if line_no == 1 and row[0].strip().lower() in ("studentemail", "email", "student email"):
+            continue
 
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        try:
+            email, course, grade = (c.strip() for c in row[:3])
+            course = int(course)
+            grade = Decimal(grade).quantize(Decimal("0.01"))
+        except (ValueError, InvalidOperation):
+            errors.append((line_no, row[0].strip() if row else "", "Expected: email, course id, grade"))
+            continue
 
-        cursor.execute(
-            "EXEC ViewGrades ?, ?",
-            username, student_email
-        )
+        if not COURSE_ID_MIN <= course <= COURSE_ID_MAX:
+            errors.append((line_no, email, "Course ID out of range"))
+        elif not grade.is_finite() or not GRADE_MIN <= grade <= GRADE_MAX:
+            errors.append((line_no, email, f"Grade must be between {GRADE_MIN} and {GRADE_MAX}"))
+        else:
+            yield line_no, email, course, grade
 
-        rows = cursor.fetchall()
-        if not rows:
-            messagebox.showinfo("Grades", "No grades found")
-            return
 
-        result = ""
-        for r in rows:
-            result += (
-                f"Course ID: {r.CourseID}\n"
-                f"Grade: {r.GradeValue}\n"
-                f"Entered By: {r.EnteredBy}\n"
-                f"Date: {r.DateEntered}\n"
-                "----------------------\n"
-            )
+def import_grades_csv(username, path, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """
+    Streams a grade CSV to BulkEnterOrUpdateGrade in chunks of chunk_size
+    rows (one round trip per chunk, the file is never loaded whole).
+    progress(rows_sent) is called after every chunk.
+    Returns {"rows", "saved", "errors": [(line, email, error)], "seconds", "rows_per_sec"}.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return import_grades(username, csv.reader(f), chunk_size, progress)
 
-        messagebox.showinfo("Grades", result)
 
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
+def import_grades(username, reader, chunk_size=IMPORT_CHUNK_SIZE, progress=None):
+    """
+    import_grades_csv for rows that are already split into
+    [email, course id, grade] values (a csv.reader, JSON lines, ...).
+    """
+    parse_errors = []
+    errors = []
+    rows_sent = 0
+    started = time.perf_counter()
+
+    rows = _parse_grade_rows(reader, parse_errors)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+
+        errors.extend(execute(
+            "EXEC BulkEnterOrUpdateGrade ?, ?", username, chunk,
+            record_type=GradeImportError
+        ))
+
+        rows_sent += len(chunk)
+        if progress:
+            progress(rows_sent)
+
+    seconds = time.perf_counter() - started
+    total = rows_sent + len(parse_errors)
+    errors = sorted(parse_errors + errors)
+
+    return {
+        "rows": total,
+        "saved": total - len(errors),
+        "errors": errors,
+        "seconds": seconds,
+        "rows_per_sec": total / seconds if seconds else 0.0,
+    }
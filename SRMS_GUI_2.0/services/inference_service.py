@@ -1,33 +1,105 @@
-from db.connection import get_connection
-from tkinter import simpledialog, messagebox
+import numpy as np
 
-def avg_grade_by_department(admin_user):
-    dept = simpledialog.askstring("Inference", "Department Name:")
+from db.query import fetch_one, fetch_all, execute
+from models.records import DepartmentAverage, DepartmentGrade, DepartmentStats
 
-    if not dept:
-        return
+INFERENCE_MIN_GROUP = 3                  # same threshold the procedures enforce
+HISTOGRAM_BINS = np.arange(0, 101, 10)   # 0-10, 10-20, ... 90-100 (100 counts in the last)
+PERCENTILES = (10, 25, 50, 75, 90)
 
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
+def department_average(username, department):
+    """
+    Average grade of a department (AvgGradeByDepartment).
+    The procedure refuses groups smaller than 3 students.
+    Served from the totals dbo.DeptGradeAgg keeps per department.
+    """
+    return fetch_one(
+        DepartmentAverage,
+        "EXEC AvgGradeByDepartment ?, ?",
+        username, department
+    )
 
-        cursor.execute(
-            "EXEC AvgGradeByDepartment ?, ?",
-            admin_user, dept
-        )
 
-        row = cursor.fetchone()
-        if not row:
-            messagebox.showinfo("Result", "No data")
-            return
+def rebuild_department_totals(admin_user):
+    """Recomputes dbo.DeptGradeAgg from the grades (RebuildDeptGradeAgg)."""
+    execute("EXEC RebuildDeptGradeAgg ?", admin_user)
+
+
+# =====================================================
+# All-departments report
+# =====================================================
+def department_report(username):
+    """
+    Grade distribution of every department from one call
+    (GradeDistributionByDepartment). Statistics for all departments are
+    computed together on one sorted array. Departments with fewer than
+    INFERENCE_MIN_GROUP graded students come back Suppressed, without
+    statistics.
+    """
+    names = []       # departments with statistics, in code order
+    codes = {}       # department -> code
+    sizes = {}       # department -> GroupSize
+    suppressed = []
+    row_codes = []
+    values = []
+
+    for row in fetch_all(DepartmentGrade, "EXEC GradeDistributionByDepartment ?", username):
+        if row.GradeValue is None or row.GroupSize < INFERENCE_MIN_GROUP:
+            if row.Department not in sizes:
+                sizes[row.Department] = row.GroupSize
+                suppressed.append(row.Department)
+            continue
+        code = codes.get(row.Department)
+        if code is None:
+            code = codes[row.Department] = len(names)
+            names.append(row.Department)
+            sizes[row.Department] = row.GroupSize
+        row_codes.append(code)
+        values.append(float(row.GradeValue))
+
+    report = [
+        DepartmentStats(name, sizes[name], 0, *([None] * 9), (), True)
+        for name in suppressed
+    ]
+    if names:
+        report += _grouped_stats(names, sizes, np.array(row_codes, dtype=np.intp),
+                                 np.array(values, dtype=np.float64))
+    report.sort(key=lambda r: r.Department.casefold())
+    return report
 
-        result = (
-            f"Department: {row.Department}\n"
-            f"Average Grade: {row.AvgGrade}\n"
-            f"Group Size: {row.GroupSize}"
-        )
 
-        messagebox.showinfo("Inference Result", result)
+def _grouped_stats(names, sizes, codes, values):
+    k = len(names)
+    order = np.lexsort((values, codes))   # by department, then grade
+    codes, values = codes[order], values[order]
 
-    except Exception as e:
-        messagebox.showerror("Inference Blocked", str(e))
+    counts = np.bincount(codes, minlength=k)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    means = np.bincount(codes, weights=values, minlength=k) / counts
+    std = np.sqrt(np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=k) / counts)
+
+    def percentile(q):
+        # linear interpolation inside each department's slice (numpy's default method)
+        pos = starts + q / 100 * (counts - 1)
+        lo = np.floor(pos).astype(np.intp)
+        hi = np.ceil(pos).astype(np.intp)
+        return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+    p10, p25, p50, p75, p90 = (percentile(q) for q in PERCENTILES)
+    minimum = values[starts]
+    maximum = values[starts + counts - 1]
+
+    nbins = len(HISTOGRAM_BINS) - 1
+    buckets = np.clip(np.searchsorted(HISTOGRAM_BINS, values, side="right") - 1, 0, nbins - 1)
+    histogram = np.bincount(codes * nbins + buckets, minlength=k * nbins).reshape(k, nbins)
+
+    columns = [np.round(c, 2).tolist() for c in (means, p50, std, p10, p25, p75, p90, minimum, maximum)]
+    return [
+        DepartmentStats(
+            name, sizes[name], int(counts[i]),
+            *(c[i] for c in columns),
+            tuple(histogram[i].tolist()), False
+        )
+        for i, name in enumerate(names)
+    ]
@@ -1,4 +1,11 @@
-from db.connection import get_connection
+from db.query import fetch_all, execute
+from models.records import RoleRequestRow, RoleDecisionOutcome
+
+# Automatic clearance mapping (SECURE & FIXED)
+CLEARANCE_FOR_ROLE = {
+    "TA": 3,
+    "Instructor": 3
+}
 
 
 # =========================
@@ -9,52 +16,33 @@ def submit_role_request(username, requested_role, reason):
     Student submits a role upgrade request.
     Role is expected to be 'TA' only (enforced by GUI).
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
+    execute(
         "EXEC SubmitRoleUpgradeRequest ?, ?, ?",
         username,
         requested_role,
         reason
     )
 
-    conn.commit()
-    conn.close()
-
 
 # =========================
 # ADMIN: List Pending Requests
 # =========================
-def list_requests(admin_user):
+REQUEST_PAGE_SIZE = 100
+
+
+def list_requests(admin_user, after_id=None, page_size=None):
     """
-    Returns a list of pending role requests for Admin.
+    Returns pending role requests for Admin, oldest first.
+    after_id: only requests with a higher RequestID - the next page, or the
+    ones submitted since the newest request the caller has.
+    page_size None returns all of them.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
-        "EXEC ListPendingRoleRequests ?",
-        admin_user
+    return fetch_all(
+        RoleRequestRow,
+        "EXEC ListPendingRoleRequests ?, ?, ?",
+        admin_user, page_size, after_id
     )
 
-    rows = cursor.fetchall()
-    conn.close()
-
-    requests = []
-    for row in rows:
-        requests.append({
-            "RequestID": row.RequestID,
-            "Username": row.Username,
-            "CurrentRole": row.CurrentRole,
-            "RequestedRole": row.RequestedRole,
-            "Reason": row.Reason,
-            "DateSubmitted": row.DateSubmitted,
-            "Status": row.Status
-        })
-
-    return requests
-
 
 # =========================
 # ADMIN: Approve Request (AUTO clearance)
@@ -63,21 +51,12 @@ def approve_request(admin_user, request_id, requested_role):
     """
     Approves a role request and automatically assigns clearance.
     """
-    # Automatic clearance mapping (SECURE & FIXED)
-    clearance_map = {
-        "TA": 3,
-        "Instructor": 3
-    }
-
-    new_clearance = clearance_map.get(requested_role)
+    new_clearance = CLEARANCE_FOR_ROLE.get(requested_role)
 
     if new_clearance is None:
         raise Exception("Invalid role for approval")
 
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
+    execute(
         "EXEC ResolveRoleRequest ?, ?, ?, ?",
         admin_user,
         request_id,
@@ -85,9 +64,6 @@ def approve_request(admin_user, request_id, requested_role):
         new_clearance
     )
 
-    conn.commit()
-    conn.close()
-
 
 # =========================
 # ADMIN: Deny Request
@@ -96,15 +72,41 @@ def deny_request(admin_user, request_id):
     """
     Denies a role request without changing user role.
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute(
+    execute(
         "EXEC ResolveRoleRequest ?, ?, ?",
         admin_user,
         request_id,
         "Deny"
     )
 
-    conn.commit()
-    conn.close()
+
+# =========================
+# ADMIN: Approve / Deny many at once
+# =========================
+def resolve_requests(admin_user, decisions):
+    """
+    Resolves a batch of requests in one round trip and one transaction
+    (BulkResolveRoleRequests), with the same clearance mapping as
+    approve_request.
+    decisions: iterable of (request_id, action, requested_role),
+    action 'Approve' or 'Deny'.
+    Returns [RoleDecisionOutcome] ordered by RequestID.
+    """
+    batch = {}
+    outcomes = []
+    for request_id, action, requested_role in decisions:
+        new_clearance = None
+        if action == "Approve":
+            new_clearance = CLEARANCE_FOR_ROLE.get(requested_role)
+            if new_clearance is None:
+                outcomes.append(RoleDecisionOutcome(request_id, "Invalid role for approval"))
+                continue
+        batch[request_id] = (request_id, action, new_clearance)
+
+    if batch:
+        outcomes += execute(
+            "EXEC BulkResolveRoleRequests ?, ?",
+            admin_user, list(batch.values()),
+            record_type=RoleDecisionOutcome
+        )
+    return sorted(outcomes)
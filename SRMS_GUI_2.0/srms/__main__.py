@@ -0,0 +1,5 @@
+import sys
+
+from srms.cli import main
+
+sys.exit(main())
@@ -0,0 +1,438 @@
+"""
+Command line over the service layer, for cron jobs and bulk work. It
+imports no Tk and runs the same stored procedures as the dashboards:
+
+    python -m srms --user admin1 profiles create users.csv
+    python -m srms --user inst1 grades import grades.csv
+    python -m srms --user inst1 attendance record --course 101 scans.csv
+    python -m srms --user inst1 --format jsonl grades export --course 101 > grades.jsonl
+    python -m srms --user admin1 roles resolve decisions.csv
+    python -m srms --user admin1 inference report
+
+--user defaults to $SRMS_USER; the password is read from $SRMS_PASSWORD,
+or asked for when it is not set. Results go to stdout (or --out) as CSV
+or JSON lines, one row at a time; progress and throughput go to stderr.
+Input files are CSV, or JSON lines when they end in .jsonl (or with
+--input-format jsonl); "-" reads stdin.
+
+Exit codes: 0 done, 1 error (login refused, database error, bad file),
+2 bad usage, 3 done but some rows were rejected (they are the output).
+"""
+import argparse
+import csv
+import getpass
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+PROGRESS_EVERY = 2.0    # seconds between progress lines on stderr
+EXIT_ERROR = 1
+EXIT_REJECTED = 3
+
+# JSON lines input: field -> position in the CSV row the services parse
+GRADE_FIELDS = ("StudentEmail", "CourseID", "GradeValue")
+ATTENDANCE_FIELDS = ("StudentEmail", "Status")
+USER_FIELDS = ("Username", "Password", "RoleName", "ClearanceLevel")
+DECISION_FIELDS = ("RequestID", "Action")
+
+
+# =========================
+# Progress + throughput (stderr)
+# =========================
+class Progress:
+    def __init__(self, label, quiet=False):
+        self.label = label
+        self.quiet = quiet
+        self.rows = 0
+        self.started = self.shown = time.perf_counter()
+
+    def update(self, rows):
+        self.rows = rows
+        now = time.perf_counter()
+        if now - self.shown >= PROGRESS_EVERY:
+            self.shown = now
+            self._report(now, "...")
+
+    def done(self, note=""):
+        self._report(time.perf_counter(), f", {note}" if note else "")
+
+    def _report(self, now, suffix):
+        if self.quiet:
+            return
+        seconds = now - self.started
+        rate = self.rows / seconds if seconds else 0.0
+        print(f"{self.label}: {self.rows} rows in {seconds:.2f} s ({rate:,.0f} rows/s){suffix}",
+              file=sys.stderr, flush=True)
+
+
+# =========================
+# Input / output
+# =========================
+def read_rows(path, input_format, fields):
+    """
+    Yields the input one row at a time as a list of strings: CSV rows
+    as they are, JSON lines as the values of fields (in that order).
+    A blank line gives an empty row, so line numbers stay right.
+    """
+    f = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8-sig")
+    try:
+        if input_format == "jsonl":
+            for line in f:
+                record = json.loads(line) if line.strip() else {}
+                yield [_text(record.get(k)) for k in fields] if record else []
+        else:
+            yield from csv.reader(f)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _message(error):
+    # pyodbc errors are (sqlstate, message)
+    if len(error.args) == 2 and isinstance(error.args[-1], str):
+        return error.args[-1]
+    return str(error)
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _json_value(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.hex()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value):
+    if isinstance(value, tuple):
+        return ";".join(_text(v) for v in value)
+    return value
+
+
+def write_records(records, args, progress=None):
+    """Writes NamedTuples as they arrive. Returns the number written."""
+    out = args.out
+    writer = csv.writer(out) if args.format == "csv" else None
+    count = 0
+    for record in records:
+        if writer is None:
+            out.write(json.dumps(record._asdict(), default=_json_value) + "\n")
+        else:
+            if count == 0:
+                writer.writerow(record._fields)
+            writer.writerow([_csv_value(v) for v in record])
+        count += 1
+        if progress:
+            progress.update(count)
+    out.flush()
+    return count
+
+
+def _input_format(args):
+    if args.input_format:
+        return args.input_format
+    return "jsonl" if args.file.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _export(args, label, records):
+    progress = Progress(label, args.quiet)
+    write_records(records, args, progress)
+    progress.done()
+    return 0
+
+
+# =========================
+# Grades
+# =========================
+def grades_import(args):
+    from models.records import GradeImportError
+    from services.grade_service import import_grades
+
+    progress = Progress("grades import", args.quiet)
+    rows = read_rows(args.file, _input_format(args), GRADE_FIELDS)
+    result = import_grades(args.user, rows, args.chunk_size, progress.update)
+
+    errors = [GradeImportError(*e) for e in result["errors"]]
+    write_records(errors, args)
+    progress.rows = result["rows"]
+    progress.done(f"{result['saved']} saved, {len(errors)} rejected")
+    return EXIT_REJECTED if errors else 0
+
+
+def grades_export(args):
+    from services.grade_service import fetch_gradebook
+    return _export(args, "grades export", fetch_gradebook(args.user, args.course))
+
+
+def grades_student(args):
+    from services.grade_service import iter_grades
+    return _export(args, "grades student", iter_grades(args.user, args.email))
+
+
+# =========================
+# Attendance
+# =========================
+def attendance_record(args):
+    from services.attendance_service import parse_attendance_rows, record_attendance_batch
+
+    progress = Progress("attendance record", args.quiet)
+    marks = parse_attendance_rows(read_rows(args.file, _input_format(args), ATTENDANCE_FIELDS))
+    outcomes = record_attendance_batch(args.user, args.course, marks)
+
+    write_records(outcomes, args)
+    rejected = sum(1 for o in outcomes if o.Result != "Recorded")
+    progress.rows = len(outcomes)
+    progress.done(f"{len(outcomes) - rejected} recorded, {rejected} rejected")
+    return EXIT_REJECTED if rejected else 0
+
+
+def attendance_export(args):
+    from services.attendance_service import iter_attendance
+    rows = iter_attendance(args.user, course_id=args.course,
+                           from_date=args.from_date, to_date=args.to_date)
+    return _export(args, "attendance export", rows)
+
+
+def attendance_summary(args):
+    from services.attendance_analytics_service import attendance_summary as summary
+    rows = summary(args.user, args.course)
+    if args.at_risk:
+        rows = [r for r in rows if r.AtRisk]
+    return _export(args, "attendance summary", rows)
+
+
+# =========================
+# Profiles
+# =========================
+def profiles_list(args):
+    from services.profile_service import iter_profiles
+    return _export(args, "profiles list", iter_profiles(args.user))
+
+
+def profiles_find(args):
+    from services.profile_service import find_student_by_id
+
+    row = find_student_by_id(args.user, args.student_id)
+    if row is None:
+        print(f"srms: no student with ID {args.student_id}", file=sys.stderr)
+        return EXIT_ERROR
+    return _export(args, "profiles find", [row])
+
+
+def profiles_create(args):
+    """One CreateUser per row; a rejected row is reported and the rest go on."""
+    from db.connection import driver
+    from models.records import UserOutcome
+    from services.profile_service import create_user
+
+    progress = Progress("profiles create", args.quiet)
+    rejected = 0
+
+    def outcomes():
+        nonlocal rejected
+        for row in read_rows(args.file, _input_format(args), USER_FIELDS):
+            if not row or not row[0].strip() or row[0].strip().lower() == "username":
+                continue
+            username = row[0].strip()
+            try:
+                password, role, clearance = (c.strip() for c in row[1:4])
+                create_user(args.user, username, password, role, int(clearance))
+                result = "Created"
+            except driver.OperationalError:
+                raise  # the connection is gone, not this row
+            except ValueError:
+                result = "Expected: username, password, role, clearance"
+            except driver.Error as e:
+                result = _message(e)
+            if result != "Created":
+                rejected += 1
+            yield UserOutcome(username, result)
+
+    count = write_records(outcomes(), args, progress)
+    progress.done(f"{count - rejected} created, {rejected} rejected")
+    return EXIT_REJECTED if rejected else 0
+
+
+# =========================
+# Role requests
+# =========================
+def roles_list(args):
+    from services.role_request_service import list_requests
+    return _export(args, "roles list", list_requests(args.user))
+
+
+def roles_submit(args):
+    from services.role_request_service import submit_role_request
+    submit_role_request(args.user, args.role, args.reason)
+    if not args.quiet:
+        print(f"roles submit: request for {args.role} submitted", file=sys.stderr)
+    return 0
+
+
+def roles_resolve(args):
+    """Rows of (RequestID, Approve/Deny), resolved in one BulkResolveRoleRequests call."""
+    from models.records import RoleDecisionOutcome
+    from services.role_request_service import list_requests, resolve_requests
+
+    progress = Progress("roles resolve", args.quiet)
+    pending = {r.RequestID: r.RequestedRole for r in list_requests(args.user)}
+
+    decisions = []
+    outcomes = []
+    for row in read_rows(args.file, _input_format(args), DECISION_FIELDS):
+        if not row or not row[0].strip() or row[0].strip().lower() == "requestid":
+            continue
+        try:
+            request_id = int(row[0])
+            action = row[1].strip().capitalize()
+        except (ValueError, IndexError):
+            outcomes.append(RoleDecisionOutcome(row[0].strip(), "Expected: request id, Approve/Deny"))
+            continue
+        if action not in ("Approve", "Deny"):
+            outcomes.append(RoleDecisionOutcome(request_id, "Expected: request id, Approve/Deny"))
+        elif request_id not in pending:
+            outcomes.append(RoleDecisionOutcome(request_id, "Not pending"))
+        else:
+            decisions.append((request_id, action, pending[request_id]))
+
+    outcomes += resolve_requests(args.user, decisions)
+    write_records(outcomes, args)
+    rejected = sum(1 for o in outcomes if o.Result not in ("Approved", "Denied"))
+    progress.rows = len(outcomes)
+    progress.done(f"{len(outcomes) - rejected} resolved, {rejected} rejected")
+    return EXIT_REJECTED if rejected else 0
+
+
+# =========================
+# Inference
+# =========================
+def inference_report(args):
+    from services.inference_service import department_report
+    return _export(args, "inference report", department_report(args.user))
+
+
+def inference_average(args):
+    from services.inference_service import department_average
+    return _export(args, "inference average", [department_average(args.user, args.department)])
+
+
+# =========================
+# Command line
+# =========================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m srms",
+        description="SRMS command line (no GUI)",
+    )
+    parser.add_argument("--user", default=os.environ.get("SRMS_USER"),
+                        help="login name (default: $SRMS_USER); password from $SRMS_PASSWORD")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv",
+                        help="output format (default: csv)")
+    parser.add_argument("--out", default="-", help="output file (default: stdout)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"),
+                        help="input format (default: from the file name)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no progress on stderr")
+    groups = parser.add_subparsers(dest="group", required=True, metavar="command")
+
+    def command(group, name, handler, help):
+        sub = group.add_parser(name, help=help, description=help)
+        sub.set_defaults(handler=handler)
+        return sub
+
+    def subcommands(name, help):
+        return groups.add_parser(name, help=help).add_subparsers(
+            dest="action", required=True, metavar="action")
+
+    grades = subcommands("grades", "grades and bulk grade import")
+    sub = command(grades, "import", grades_import,
+                  "import StudentEmail, CourseID, GradeValue rows (BulkEnterOrUpdateGrade)")
+    sub.add_argument("file")
+    sub.add_argument("--chunk-size", type=int, default=2000, help="rows per round trip")
+    sub = command(grades, "export", grades_export, "every grade of one course (CourseGradebook)")
+    sub.add_argument("--course", type=int, required=True)
+    sub = command(grades, "student", grades_student, "grades of one student (ViewGrades)")
+    sub.add_argument("email")
+
+    attendance = subcommands("attendance", "attendance and attendance analytics")
+    sub = command(attendance, "record", attendance_record,
+                  "record StudentEmail[, Status] rows for one course (RecordAttendanceBatch)")
+    sub.add_argument("file")
+    sub.add_argument("--course", type=int, required=True)
+    sub = command(attendance, "export", attendance_export, "attendance rows, newest first")
+    sub.add_argument("--course", type=int)
+    sub.add_argument("--from", dest="from_date", type=date.fromisoformat, help="YYYY-MM-DD")
+    sub.add_argument("--to", dest="to_date", type=date.fromisoformat, help="YYYY-MM-DD, exclusive")
+    sub = command(attendance, "summary", attendance_summary,
+                  "rates, trends and streaks from the weekly rollup")
+    sub.add_argument("--course", type=int, help="required for staff")
+    sub.add_argument("--at-risk", action="store_true", help="at-risk students only")
+
+    profiles = subcommands("profiles", "profiles and user provisioning")
+    command(profiles, "list", profiles_list, "profiles the user may see (ViewProfilesByRole)")
+    sub = command(profiles, "find", profiles_find, "a student by Student ID (FindStudentByID)")
+    sub.add_argument("student_id")
+    sub = command(profiles, "create", profiles_create,
+                  "create Username, Password, RoleName, ClearanceLevel logins (Admin)")
+    sub.add_argument("file")
+
+    roles = subcommands("roles", "role upgrade requests")
+    command(roles, "list", roles_list, "pending requests (Admin)")
+    sub = command(roles, "submit", roles_submit, "request a role upgrade")
+    sub.add_argument("--role", default="TA")
+    sub.add_argument("--reason", required=True)
+    sub = command(roles, "resolve", roles_resolve,
+                  "approve/deny RequestID, Action rows in one transaction (Admin)")
+    sub.add_argument("file")
+
+    inference = subcommands("inference", "department grade statistics")
+    command(inference, "report", inference_report, "grade distribution per department")
+    sub = command(inference, "average", inference_average, "average grade of one department")
+    sub.add_argument("department")
+
+    return parser
+
+
+def _login(username):
+    from auth.login import validate_login
+
+    password = os.environ.get("SRMS_PASSWORD")
+    if password is None:
+        password = getpass.getpass(f"Password for {username}: ")
+    return validate_login(username, password)
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.user:
+        parser.error("--user (or SRMS_USER) is required")
+
+    session = None
+    out = None
+    try:
+        session = _login(args.user)
+        if session is None:
+            print("srms: invalid username or password", file=sys.stderr)
+            return EXIT_ERROR
+        args.user = session.username
+
+        out = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8")
+        args.out = out
+        return args.handler(args)
+    except Exception as e:
+        # database errors carry the procedure's THROW message
+        print(f"srms: {_message(e)}", file=sys.stderr)
+        return EXIT_ERROR
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+        if session is not None:
+            session.close()
@@ -0,0 +1,128 @@
+import queue
+import tkinter as tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import messagebox
+
+MAX_WORKERS = 4
+POLL_MS = 25
+
+
+class BackgroundRunner:
+    """
+    Runs database work on a small thread pool and posts the results
+    back to the Tk thread with after().
+
+    Work submitted for the same owner window runs one at a time, in the
+    order it was submitted, so callbacks for a window never arrive out
+    of order. Different windows run in parallel.
+    """
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="srms-db"
+        )
+        self._results = queue.Queue()
+        self._lanes = {}        # owner -> deque of (work, on_done, on_error)
+        self._poll_root = None  # Tk root the poll loop is scheduled on
+
+    # =========================
+    # Public API (Tk thread only)
+    # =========================
+    def submit(self, owner, work, on_done=None, on_error=None):
+        lane = self._lanes.setdefault(owner, deque())
+        lane.append((work, on_done, on_error))
+
+        if len(lane) == 1:
+            _set_busy(owner, True)
+            self._start(owner, work)
+
+        self._ensure_polling(owner)
+
+    def busy(self, owner):
+        return bool(self._lanes.get(owner))
+
+    # =========================
+    # Internals
+    # =========================
+    def _start(self, owner, work):
+        def job():
+            try:
+                self._results.put((owner, True, work()))
+            except Exception as e:
+                self._results.put((owner, False, e))
+
+        self._executor.submit(job)
+
+    def _ensure_polling(self, owner):
+        if self._poll_root is None:
+            self._poll_root = owner._root()
+            self._poll_root.after(POLL_MS, self._drain)
+
+    def _drain(self):
+        while True:
+            try:
+                owner, ok, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            lane = self._lanes[owner]
+            _, on_done, on_error = lane.popleft()
+
+            if lane:
+                self._start(owner, lane[0][0])
+            else:
+                del self._lanes[owner]
+                _set_busy(owner, False)
+
+            if not _alive(owner):
+                continue
+
+            try:
+                if ok:
+                    if on_done:
+                        on_done(value)
+                elif on_error:
+                    on_error(value)
+                else:
+                    messagebox.showerror("Error", str(value), parent=owner)
+            except Exception as e:
+                messagebox.showerror("Error", str(e), parent=owner)
+
+        if self._lanes:
+            self._poll_root.after(POLL_MS, self._drain)
+        else:
+            self._poll_root = None
+
+
+def _alive(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
+
+
+def _set_busy(owner, busy):
+    if not _alive(owner):
+        return
+    try:
+        owner.winfo_toplevel().config(cursor="watch" if busy else "")
+    except tk.TclError:
+        pass
+
+
+_runner = BackgroundRunner()
+
+
+def run_in_background(owner, work, on_done=None, on_error=None):
+    """
+    Runs work() off the Tk thread.
+    on_done(result) / on_error(exception) are called back on the Tk thread.
+    Without on_error, failures are shown in an error dialog.
+    """
+    _runner.submit(owner, work, on_done, on_error)
+
+
+def is_busy(owner):
+    return _runner.busy(owner)
@@ -0,0 +1,18 @@
+import csv
+
+
+def write_csv(path, records):
+    """
+    Writes typed rows (NamedTuples) to a CSV file as they arrive, so a
+    streamed result is never held in memory. The header comes from the
+    first row's fields. Returns the number of rows written.
+    """
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        for record in records:
+            if count == 0:
+                writer.writerow(record._fields)
+            writer.writerow(record)
+            count += 1
+    return count